@@ -3,18 +3,61 @@
 This module defines the REST API endpoints for the trading robot.
 """
 
+import threading
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 
-from fastapi import BackgroundTasks, FastAPI, HTTPException, Query
+import anyio.to_thread
+import orjson
+from cachetools import TLRUCache, TTLCache
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
 from blackbox import __version__
-from blackbox.core.scoring import ScoringConfig, ScoringService
+from blackbox.api.schemas import (
+    CalendarMonthResponse,
+    CalendarTodayResponse,
+    CurrencyScoreResponse,
+    PairBiasResponse,
+    PairSignalResponse,
+    RefreshResponse,
+    StatsResponse,
+)
+from blackbox.core.scoring import (
+    ScoringConfig,
+    ScoringService,
+    calculate_pair_bias,
+    get_bias_signal,
+)
 from blackbox.data.exceptions import ScraperError
+from blackbox.data.models import EconomicEvent
 from blackbox.data.services import CalendarService
-from blackbox.data.storage.database import get_session
-from blackbox.data.storage.repository import EventRepository
+from blackbox.data.storage.database import get_async_session
+from blackbox.data.storage.repository import AsyncEventRepository
+
+# Worker threads available to sync endpoints (scraping and database access)
+THREADPOOL_SIZE = 200
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Configure runtime resources for the lifetime of the application.
+
+    Blocking endpoints are declared as plain ``def`` so Starlette runs them
+    in its threadpool; the default limit of 40 threads is raised so slow
+    scrapes do not starve quick database reads. The browsers kept open by
+    the calendar service are closed on shutdown.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = THREADPOOL_SIZE
+    yield
+    _calendar_service.close()
+
 
 app = FastAPI(
     title="Blackbox Trading Robot API",
@@ -22,6 +65,8 @@ app = FastAPI(
     version=__version__,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -101,47 +146,154 @@ async def stop_strategy(strategy_name: str) -> dict:
     }
 
 
-# Calendar API response models
-class EventResponse(BaseModel):
-    """API response model for a single economic event."""
+# Fields of EconomicEvent exposed by EventResponse, applied to every list item
+_EVENT_RESPONSE_FIELDS = {
+    "__all__": {
+        "date",
+        "time",
+        "currency",
+        "impact",
+        "event_name",
+        "actual",
+        "forecast",
+        "previous",
+    }
+}
+_EVENTS_ADAPTER = TypeAdapter(list[EconomicEvent])
 
-    date: str
-    time: str | None
-    currency: str
-    impact: str
-    event_name: str
-    actual: float | None
-    forecast: float | None
-    previous: float | None
 
+def _events_response(envelope: dict, events: list[EconomicEvent]) -> Response:
+    """Build a JSON response embedding the serialized events in an envelope.
 
-class CalendarMonthResponse(BaseModel):
-    """API response model for a month's calendar."""
+    Events are dumped straight from the models by pydantic-core, so no
+    intermediate EventResponse instances or dicts are created.
 
-    year: int
-    month: int
-    total_events: int
-    events: list[EventResponse]
+    Args:
+        envelope: Top-level fields preceding the events list.
+        events: Events to serialize under the "events" key.
 
+    Returns:
+        Response with the assembled JSON body.
+    """
+    events_body = _EVENTS_ADAPTER.dump_json(events, include=_EVENT_RESPONSE_FIELDS)
+    body = orjson.dumps(envelope)[:-1] + b',"events":' + events_body + b"}"
+    return Response(content=body, media_type="application/json")
 
-class CalendarTodayResponse(BaseModel):
-    """API response model for today's calendar."""
 
-    date: str
-    total_events: int
-    events: list[EventResponse]
+# Shared calendar service: it only holds its scraper configuration and opens
+# a fresh database session and scraper per call, so it is safe across threads
+_calendar_service = CalendarService()
 
 
-class RefreshResponse(BaseModel):
-    """API response model for calendar refresh."""
+# In-memory cache of serialized month responses, keyed by
+# (year, month, currencies, impact). Past months rarely change, so they are
+# kept longer than the current (or a future) month.
+MONTH_CACHE_TTL_CURRENT = 60
+MONTH_CACHE_TTL_PAST = 3600
 
-    status: str
-    message: str
+
+def _month_cache_ttu(key: tuple, _value: bytes, now: float) -> float:
+    """Compute the expiry time of a month cache entry from its key."""
+    year, month = key[0], key[1]
+    today = date.today()
+    if (year, month) < (today.year, today.month):
+        return now + MONTH_CACHE_TTL_PAST
+    return now + MONTH_CACHE_TTL_CURRENT
+
+
+_month_cache: TLRUCache = TLRUCache(maxsize=256, ttu=_month_cache_ttu)
+_month_cache_lock = threading.Lock()
+# Bumped on every invalidation of a month, so a response streamed from data
+# read before the invalidation is not cached afterwards
+_month_generations: dict[tuple[int, int], int] = {}
+
+
+def _invalidate_month_cache(year: int, month: int) -> None:
+    """Drop every cached response for a month, whatever its filters."""
+    with _month_cache_lock:
+        _month_generations[year, month] = _month_generations.get((year, month), 0) + 1
+        for key in [k for k in _month_cache if k[:2] == (year, month)]:
+            _month_cache.pop(key, None)
+
+
+@lru_cache(maxsize=256)
+def _parse_currencies(currencies: str | None) -> frozenset[str] | None:
+    """Parse a comma-separated currency filter into uppercase codes.
+
+    Dashboards poll with fixed query strings, so results are memoized.
+
+    Args:
+        currencies: Raw query parameter, e.g. "usd,EUR".
+
+    Returns:
+        Frozen set of currency codes, or None when no filter is given.
+    """
+    if not currencies:
+        return None
+    return frozenset(c.strip().upper() for c in currencies.split(","))
+
+
+# Month responses are streamed MONTH_STREAM_BATCH_SIZE events at a time; only
+# bodies up to MONTH_CACHE_MAX_BODY_BYTES are kept in the response cache.
+MONTH_STREAM_BATCH_SIZE = 256
+MONTH_CACHE_MAX_BODY_BYTES = 1024 * 1024
+
+
+def _month_body_chunks(
+    year: int,
+    month: int,
+    currencies: frozenset[str] | None,
+    impact: str | None,
+) -> Iterator[bytes]:
+    """Serialize a month's stored events as JSON chunks, one per batch.
+
+    Rows arrive from the repository as plain dicts, which orjson encodes
+    directly without building any model instance.
+
+    The event count is only known once every batch has been read, so
+    total_events is written after the events list.
+    """
+    yield orjson.dumps({"year": year, "month": month})[:-1] + b',"events":['
+    total_events = 0
+    for batch in _calendar_service.iter_month_records(
+        year, month, currencies, impact, MONTH_STREAM_BATCH_SIZE
+    ):
+        # Strip the list brackets so consecutive batches form one array
+        yield (b"," if total_events else b"") + orjson.dumps(batch)[1:-1]
+        total_events += len(batch)
+    yield b'],"total_events":%d}' % total_events
+
+
+def _cache_month_body(
+    cache_key: tuple, generation: int, chunks: Iterable[bytes]
+) -> Iterator[bytes]:
+    """Pass response chunks through, caching the body if it stays small.
+
+    The body is not cached if its month was invalidated since generation
+    was read, as it may hold data from before the invalidation.
+    """
+    buffered: list[bytes] = []
+    size = 0
+    for chunk in chunks:
+        yield chunk
+        size += len(chunk)
+        if size <= MONTH_CACHE_MAX_BODY_BYTES:
+            buffered.append(chunk)
+        else:
+            buffered.clear()
+
+    if size <= MONTH_CACHE_MAX_BODY_BYTES:
+        with _month_cache_lock:
+            if _month_generations.get(cache_key[:2], 0) == generation:
+                _month_cache[cache_key] = b"".join(buffered)
 
 
 # Calendar endpoints
-@app.get("/api/v1/calendar/month", response_model=CalendarMonthResponse)
-async def get_calendar_month(
+@app.get(
+    "/api/v1/calendar/month",
+    responses={200: {"model": CalendarMonthResponse}},
+)
+def get_calendar_month(
     year: int = Query(..., ge=2000, le=2100, description="Year to fetch"),
     month: int = Query(..., ge=1, le=12, description="Month to fetch (1-12)"),
     currencies: str | None = Query(
@@ -149,11 +301,18 @@ async def get_calendar_month(
     ),
     high_impact_only: bool = Query(False, description="Only return high impact events"),
     force_refresh: bool = Query(False, description="Force re-scraping even if cached"),
-) -> CalendarMonthResponse:
+) -> Response:
     """Fetch the economic calendar for a specific month.
 
-    Uses cached data from PostgreSQL when available.
-    Use force_refresh=true to always scrape fresh data.
+    Uses cached data from PostgreSQL when available, and serves repeated
+    identical queries from an in-memory response cache (see
+    MONTH_CACHE_TTL_CURRENT / MONTH_CACHE_TTL_PAST).
+    Use force_refresh=true to always scrape fresh data; it also drops the
+    cached responses of the month for every filter.
+
+    Missing days are scraped before the response starts, so scraping errors
+    still map to an error status. Events are then streamed from a database
+    cursor in batches instead of being loaded all at once.
 
     Args:
         year: The year to fetch.
@@ -163,38 +322,20 @@ async def get_calendar_month(
         force_refresh: If true, ignore cache and scrape fresh data.
 
     Returns:
-        CalendarMonthResponse with all matching events.
+        JSON response shaped like CalendarMonthResponse with all matching events.
     """
-    currency_list = (
-        [c.strip().upper() for c in currencies.split(",")] if currencies else None
-    )
+    currency_set = _parse_currencies(currencies)
     impact = "high" if high_impact_only else None
+    cache_key = (year, month, currency_set, impact)
 
-    try:
-        service = CalendarService()
-        events = service.fetch_month(year, month, currency_list, impact, force_refresh)
-
-        event_responses = [
-            EventResponse(
-                date=str(e.date),
-                time=str(e.time) if e.time else None,
-                currency=e.currency,
-                impact=e.impact.value,
-                event_name=e.event_name,
-                actual=e.actual,
-                forecast=e.forecast,
-                previous=e.previous,
-            )
-            for e in events
-        ]
-
-        return CalendarMonthResponse(
-            year=year,
-            month=month,
-            total_events=len(event_responses),
-            events=event_responses,
-        )
+    if not force_refresh:
+        with _month_cache_lock:
+            body = _month_cache.get(cache_key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
 
+    try:
+        _calendar_service.sync_month(year, month, force_refresh)
     except ScraperError as e:
         raise HTTPException(
             status_code=503, detail=f"Failed to fetch calendar: {str(e)}"
@@ -202,12 +343,26 @@ async def get_calendar_month(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
+    if force_refresh:
+        _invalidate_month_cache(year, month)
+    with _month_cache_lock:
+        generation = _month_generations.get((year, month), 0)
+
+    chunks = _month_body_chunks(year, month, currency_set, impact)
+    return StreamingResponse(
+        _cache_month_body(cache_key, generation, chunks),
+        media_type="application/json",
+    )
+
 
-@app.get("/api/v1/calendar/today", response_model=CalendarTodayResponse)
-async def get_calendar_today(
+@app.get(
+    "/api/v1/calendar/today",
+    responses={200: {"model": CalendarTodayResponse}},
+)
+def get_calendar_today(
     currencies: str | None = Query(None, description="Comma-separated currency codes"),
     high_impact_only: bool = Query(False, description="Only return high impact events"),
-) -> CalendarTodayResponse:
+) -> Response:
     """Fetch today's economic calendar.
 
     Uses cached data from PostgreSQL when available.
@@ -217,34 +372,15 @@ async def get_calendar_today(
         high_impact_only: If true, only return high impact events.
 
     Returns:
-        CalendarTodayResponse with today's events.
+        JSON response shaped like CalendarTodayResponse with today's events.
     """
-    currency_list = (
-        [c.strip().upper() for c in currencies.split(",")] if currencies else None
-    )
+    currency_set = _parse_currencies(currencies)
 
     try:
-        service = CalendarService()
-        events = service.fetch_today(currency_list, high_impact_only)
-
-        event_responses = [
-            EventResponse(
-                date=str(e.date),
-                time=str(e.time) if e.time else None,
-                currency=e.currency,
-                impact=e.impact.value,
-                event_name=e.event_name,
-                actual=e.actual,
-                forecast=e.forecast,
-                previous=e.previous,
-            )
-            for e in events
-        ]
+        events = _calendar_service.fetch_today(currency_set, high_impact_only)
 
-        return CalendarTodayResponse(
-            date=str(date.today()),
-            total_events=len(event_responses),
-            events=event_responses,
+        return _events_response(
+            {"date": date.today(), "total_events": len(events)}, events
         )
 
     except ScraperError as e:
@@ -256,23 +392,62 @@ async def get_calendar_today(
 
 
 # Background refresh state
-_refresh_status = {"status": "idle", "message": "No refresh in progress"}
+@dataclass(frozen=True)
+class RefreshState:
+    """Status of a calendar refresh operation.
+
+    Attributes:
+        status: One of idle, running, completed or error.
+        message: Human-readable description of the status.
+    """
+
+    status: str
+    message: str
+
+
+_IDLE_REFRESH_STATE = RefreshState(status="idle", message="No refresh in progress")
+
+# Guards the in-flight set and the status records below; the refresh task
+# runs in a worker thread while the endpoints run on the event loop
+_refresh_lock = threading.Lock()
+_refresh_inflight: set[tuple[int, int]] = set()
+_refresh_status: RefreshState = _IDLE_REFRESH_STATE
+_refresh_status_by_month: dict[tuple[int, int], RefreshState] = {}
+
+
+def _set_refresh_state(year: int, month: int, state: RefreshState) -> None:
+    """Record the state of a month refresh as both latest and per-month status."""
+    global _refresh_status
+    with _refresh_lock:
+        _refresh_status = state
+        _refresh_status_by_month[(year, month)] = state
 
 
 def _do_calendar_refresh(year: int, month: int) -> None:
     """Background task to refresh calendar data."""
-    global _refresh_status
-    _refresh_status = {"status": "running", "message": f"Refreshing {year}-{month:02d}"}
+    _set_refresh_state(
+        year, month, RefreshState("running", f"Refreshing {year}-{month:02d}")
+    )
 
     try:
-        service = CalendarService()
-        count = service.refresh_month(year, month)
-        _refresh_status = {
-            "status": "completed",
-            "message": f"Successfully refreshed {year}-{month:02d}: {count} events",
-        }
+        count = _calendar_service.refresh_month(year, month)
+        _invalidate_month_cache(year, month)
+        with _score_cache_lock:
+            _score_cache.clear()
+        _reset_event_cache()
+        _set_refresh_state(
+            year,
+            month,
+            RefreshState(
+                "completed",
+                f"Successfully refreshed {year}-{month:02d}: {count} events",
+            ),
+        )
     except Exception as e:
-        _refresh_status = {"status": "error", "message": str(e)}
+        _set_refresh_state(year, month, RefreshState("error", str(e)))
+    finally:
+        with _refresh_lock:
+            _refresh_inflight.discard((year, month))
 
 
 @app.post("/api/v1/calendar/refresh", response_model=RefreshResponse)
@@ -287,17 +462,29 @@ async def refresh_calendar(
 ) -> RefreshResponse:
     """Trigger a background refresh of the calendar data.
 
+    Requests for a month that is already being refreshed are coalesced:
+    no second scrape is queued.
+
     Args:
         year: The year to refresh (defaults to current year).
         month: The month to refresh (defaults to current month).
 
     Returns:
-        RefreshResponse indicating the refresh has started.
+        RefreshResponse indicating the refresh has started, or is already
+        running.
     """
     today = date.today()
     year = year or today.year
     month = month or today.month
 
+    with _refresh_lock:
+        if (year, month) in _refresh_inflight:
+            return RefreshResponse(
+                status="already_running",
+                message=f"Calendar refresh already running for {year}-{month:02d}",
+            )
+        _refresh_inflight.add((year, month))
+
     background_tasks.add_task(_do_calendar_refresh, year, month)
 
     return RefreshResponse(
@@ -307,35 +494,38 @@ async def refresh_calendar(
 
 
 @app.get("/api/v1/calendar/refresh/status", response_model=RefreshResponse)
-async def get_refresh_status() -> RefreshResponse:
-    """Get the status of the last calendar refresh operation.
+async def get_refresh_status(
+    year: int | None = Query(None, ge=2000, le=2100, description="Year refreshed"),
+    month: int | None = Query(None, ge=1, le=12, description="Month refreshed"),
+) -> RefreshResponse:
+    """Get the status of a calendar refresh operation.
+
+    Args:
+        year: Optional year of the refresh to inspect.
+        month: Optional month of the refresh to inspect.
 
     Returns:
-        RefreshResponse with the current refresh status.
+        RefreshResponse with the status of the given month's refresh when
+        both year and month are provided, otherwise of the last refresh.
     """
-    return RefreshResponse(**_refresh_status)
-
+    with _refresh_lock:
+        if year is not None and month is not None:
+            state = _refresh_status_by_month.get((year, month), _IDLE_REFRESH_STATE)
+        else:
+            state = _refresh_status
 
-class StatsResponse(BaseModel):
-    """API response model for database statistics."""
-
-    total_events: int
-    by_currency: dict[str, int]
-    by_impact: dict[str, int]
-    date_range_start: str | None
-    date_range_end: str | None
+    return RefreshResponse(status=state.status, message=state.message)
 
 
 @app.get("/api/v1/calendar/stats", response_model=StatsResponse)
-async def get_calendar_stats() -> StatsResponse:
+def get_calendar_stats() -> StatsResponse:
     """Get statistics about stored calendar events.
 
     Returns:
         StatsResponse with counts and date range information.
     """
     try:
-        service = CalendarService()
-        stats = service.get_stats()
+        stats = _calendar_service.get_stats()
 
         return StatsResponse(
             total_events=stats["total_events"],
@@ -352,38 +542,100 @@ async def get_calendar_stats() -> StatsResponse:
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
-# Scoring API response models
-class CurrencyScoreResponse(BaseModel):
-    """API response model for currency score."""
+@lru_cache(maxsize=64)
+def _scoring_config(
+    half_life_hours: float,
+    lookback_days: int,
+    min_bias_threshold: float = ScoringConfig.min_bias_threshold,
+) -> ScoringConfig:
+    """Return the (immutable) scoring configuration for the query parameters.
 
-    currency: str
-    score: float
-    reference_time: str
-    config: dict
+    Args:
+        half_life_hours: Half-life for temporal decay.
+        lookback_days: Number of days to include in analysis.
+        min_bias_threshold: Minimum absolute bias for directional signal.
 
+    Returns:
+        Cached ScoringConfig instance.
 
-class PairBiasResponse(BaseModel):
-    """API response model for pair bias."""
+    Raises:
+        ValueError: If a parameter is invalid (not cached).
+    """
+    return ScoringConfig(
+        half_life_hours=half_life_hours,
+        lookback_days=lookback_days,
+        min_bias_threshold=min_bias_threshold,
+    )
+
+
+# Currency scores memoized per (currency, reference minute, half-life,
+# lookback). Reference times are rounded to the minute, over which decay
+# barely moves, so entries only need to live for one minute.
+SCORE_CACHE_TTL = 60
 
-    base: str
-    quote: str
-    pair: str
-    base_score: float
-    quote_score: float
-    bias: float
-    reference_time: str
+_score_cache: TTLCache = TTLCache(maxsize=4096, ttl=SCORE_CACHE_TTL)
+_score_cache_lock = threading.Lock()
 
+# Events of each lookback window, shared by the per-request scoring services
+# so a cache miss on one currency does not query the window again
+_event_cache = ScoringService.create_event_cache(ScoringConfig())
 
-class PairSignalResponse(BaseModel):
-    """API response model for pair signal."""
 
-    base: str
-    quote: str
-    pair: str
-    bias: float
-    signal: str
-    threshold: float
-    reference_time: str
+def _reset_event_cache() -> None:
+    """Start a new event cache once stored events changed.
+
+    The cache is replaced rather than cleared, as refreshes run in worker
+    threads while scoring requests use the cache on the event loop.
+    """
+    global _event_cache
+    _event_cache = ScoringService.create_event_cache(ScoringConfig())
+
+
+def _reference_minute() -> datetime:
+    """Get the current time truncated to the minute, used as scoring reference."""
+    return datetime.now().replace(second=0, microsecond=0)
+
+
+async def _currency_scores(
+    config: ScoringConfig, currencies: list[str], reference_time: datetime
+) -> dict[str, float]:
+    """Score currencies, querying the database only for uncached ones.
+
+    Args:
+        config: Scoring configuration.
+        currencies: Uppercase currency codes.
+        reference_time: Reference point for decay calculation.
+
+    Returns:
+        Mapping of currency code to aggregate score.
+    """
+
+    def cache_key(currency: str) -> tuple:
+        return (
+            currency,
+            reference_time,
+            config.half_life_hours,
+            config.lookback_days,
+        )
+
+    scores: dict[str, float] = {}
+    with _score_cache_lock:
+        for currency in currencies:
+            score = _score_cache.get(cache_key(currency))
+            if score is not None:
+                scores[currency] = score
+    missing = [currency for currency in currencies if currency not in scores]
+    if not missing:
+        return scores
+
+    async with get_async_session() as session:
+        service = ScoringService(config, AsyncEventRepository(session), _event_cache)
+        computed = await service.get_currency_scores(missing, reference_time)
+
+    with _score_cache_lock:
+        for currency, score in computed.items():
+            _score_cache[cache_key(currency)] = score
+    return scores | computed
 
 
 @app.get("/api/v1/scoring/currency/{currency}", response_model=CurrencyScoreResponse)
@@ -408,16 +660,12 @@ async def get_currency_score(
         CurrencyScoreResponse with the calculated score.
     """
     try:
-        config = ScoringConfig(
-            half_life_hours=half_life_hours,
-            lookback_days=lookback_days,
-        )
-        reference_time = datetime.now()
+        config = _scoring_config(half_life_hours, lookback_days)
+        reference_time = _reference_minute()
 
-        with get_session() as session:
-            repository = EventRepository(session)
-            service = ScoringService(config, repository)
-            score = service.get_currency_score(currency.upper(), reference_time)
+        currency_upper = currency.upper()
+        scores = await _currency_scores(config, [currency_upper], reference_time)
+        score = scores[currency_upper]
 
         return CurrencyScoreResponse(
             currency=currency.upper(),
@@ -458,20 +706,16 @@ async def get_pair_bias(
         PairBiasResponse with scores and bias.
     """
     try:
-        config = ScoringConfig(
-            half_life_hours=half_life_hours,
-            lookback_days=lookback_days,
-        )
-        reference_time = datetime.now()
+        config = _scoring_config(half_life_hours, lookback_days)
+        reference_time = _reference_minute()
         base_upper = base.upper()
         quote_upper = quote.upper()
 
-        with get_session() as session:
-            repository = EventRepository(session)
-            service = ScoringService(config, repository)
-            base_score = service.get_currency_score(base_upper, reference_time)
-            quote_score = service.get_currency_score(quote_upper, reference_time)
-            bias = service.get_pair_bias(base_upper, quote_upper, reference_time)
+        scores = await _currency_scores(
+            config, [base_upper, quote_upper], reference_time
+        )
+        base_score, quote_score = scores[base_upper], scores[quote_upper]
+        bias = calculate_pair_bias(base_score, quote_score)
 
         return PairBiasResponse(
             base=base_upper,
@@ -516,20 +760,17 @@ async def get_pair_signal(
         PairSignalResponse with signal and bias.
     """
     try:
-        config = ScoringConfig(
-            half_life_hours=half_life_hours,
-            lookback_days=lookback_days,
-            min_bias_threshold=min_bias_threshold,
-        )
-        reference_time = datetime.now()
+        config = _scoring_config(half_life_hours, lookback_days, min_bias_threshold)
+        reference_time = _reference_minute()
         base_upper = base.upper()
         quote_upper = quote.upper()
 
-        with get_session() as session:
-            repository = EventRepository(session)
-            service = ScoringService(config, repository)
-            bias = service.get_pair_bias(base_upper, quote_upper, reference_time)
-            signal = service.get_bias_signal(base_upper, quote_upper, reference_time)
+        scores = await _currency_scores(
+            config, [base_upper, quote_upper], reference_time
+        )
+        base_score, quote_score = scores[base_upper], scores[quote_upper]
+        bias = calculate_pair_bias(base_score, quote_score)
+        signal = get_bias_signal(bias, config.min_bias_threshold)
 
         return PairSignalResponse(
             base=base_upper,
@@ -0,0 +1,89 @@
+"""Response models for the Blackbox REST API.
+
+This module defines the Pydantic models describing the JSON bodies
+returned by the API endpoints.
+"""
+
+from pydantic import BaseModel
+
+
+# Calendar API response models
+class EventResponse(BaseModel):
+    """API response model for a single economic event."""
+
+    date: str
+    time: str | None
+    currency: str
+    impact: str
+    event_name: str
+    actual: float | None
+    forecast: float | None
+    previous: float | None
+
+
+class CalendarMonthResponse(BaseModel):
+    """API response model for a month's calendar."""
+
+    year: int
+    month: int
+    total_events: int
+    events: list[EventResponse]
+
+
+class CalendarTodayResponse(BaseModel):
+    """API response model for today's calendar."""
+
+    date: str
+    total_events: int
+    events: list[EventResponse]
+
+
+class RefreshResponse(BaseModel):
+    """API response model for calendar refresh."""
+
+    status: str
+    message: str
+
+
+class StatsResponse(BaseModel):
+    """API response model for database statistics."""
+
+    total_events: int
+    by_currency: dict[str, int]
+    by_impact: dict[str, int]
+    date_range_start: str | None
+    date_range_end: str | None
+
+
+# Scoring API response models
+class CurrencyScoreResponse(BaseModel):
+    """API response model for currency score."""
+
+    currency: str
+    score: float
+    reference_time: str
+    config: dict
+
+
+class PairBiasResponse(BaseModel):
+    """API response model for pair bias."""
+
+    base: str
+    quote: str
+    pair: str
+    base_score: float
+    quote_score: float
+    bias: float
+    reference_time: str
+
+
+class PairSignalResponse(BaseModel):
+    """API response model for pair signal."""
+
+    base: str
+    quote: str
+    pair: str
+    bias: float
+    signal: str
+    threshold: float
+    reference_time: str
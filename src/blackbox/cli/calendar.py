@@ -0,0 +1,270 @@
+"""Economic calendar CLI commands.
+
+Loaded on demand by the ``calendar`` group of blackbox.cli.main.
+"""
+
+from datetime import date
+
+import click
+import orjson
+
+# Text output: one line per event, with "-" for missing values
+EVENT_LINE = (
+    "[{time}] [{currency}] [{marker}] {name} | A:{actual} F:{forecast} P:{previous}"
+)
+DATED_EVENT_LINE = "[{date}] " + EVENT_LINE
+ALL_DAY = "All Day"
+DASH = "-"
+
+
+def _event_lines(events: list, template: str = EVENT_LINE) -> list[str]:
+    """Format events as text lines.
+
+    Args:
+        events: EconomicEvent objects to format.
+        template: EVENT_LINE or DATED_EVENT_LINE.
+
+    Returns:
+        One formatted line per event.
+    """
+    return [
+        template.format(
+            date=event.date,
+            time=event.time.isoformat("minutes") if event.time else ALL_DAY,
+            currency=event.currency,
+            marker=event.impact.marker,
+            name=event.event_name,
+            actual=event.actual or DASH,
+            forecast=event.forecast or DASH,
+            previous=event.previous or DASH,
+        )
+        for event in events
+    ]
+
+
+def _complete_month_events(
+    year: int,
+    month: int,
+    currencies: list[str] | None,
+    impact: str | None,
+) -> list | None:
+    """Read a month straight from the database when nothing needs scraping.
+
+    Args:
+        year: The year to read.
+        month: The month to read (1-12).
+        currencies: Optional currency codes to filter by.
+        impact: Optional minimum impact level.
+
+    Returns:
+        The filtered events, or None if the month still needs scraping.
+    """
+    import calendar as cal
+
+    from blackbox.data.storage.database import get_session
+    from blackbox.data.storage.repository import EventRepository
+
+    with get_session() as session:
+        repo = EventRepository(session)
+        if not repo.is_month_complete(year, month):
+            return None
+
+        _, last_day = cal.monthrange(year, month)
+        return repo.get_events(
+            date(year, month, 1), date(year, month, last_day), currencies, impact
+        )
+
+
+def _month_sequence(year: int, month: int, count: int) -> list[tuple[int, int]]:
+    """List ``count`` consecutive (year, month) pairs starting at a month.
+
+    Args:
+        year: The first year.
+        month: The first month (1-12).
+        count: Number of months.
+
+    Returns:
+        The (year, month) pairs in chronological order.
+    """
+    start = year * 12 + month - 1
+    return [(index // 12, index % 12 + 1) for index in range(start, start + count)]
+
+
+@click.command("fetch")
+@click.option(
+    "--year", "-y", type=int, default=None, help="Year to fetch (default: current)"
+)
+@click.option(
+    "--month", "-m", type=int, default=None, help="Month to fetch (default: current)"
+)
+@click.option(
+    "--months",
+    "-n",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of consecutive months to fetch, scraped in parallel",
+)
+@click.option(
+    "--currency",
+    "-c",
+    multiple=True,
+    help="Filter by currency (can be used multiple times)",
+)
+@click.option(
+    "--impact",
+    "-i",
+    type=click.Choice(["low", "medium", "high"]),
+    help="Minimum impact level",
+)
+@click.option(
+    "--headless/--no-headless", default=True, help="Run browser in headless mode"
+)
+@click.option(
+    "--force-refresh", "-f", is_flag=True, help="Force scraping even if data is cached"
+)
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def calendar_fetch(
+    year: int | None,
+    month: int | None,
+    months: int,
+    currency: tuple,
+    impact: str | None,
+    headless: bool,
+    force_refresh: bool,
+    json_output: bool,
+) -> None:
+    """Fetch economic calendar for a month.
+
+    Uses cached data from PostgreSQL when available.
+    Use --force-refresh to always scrape fresh data.
+    Use --months to fetch several consecutive months in parallel.
+
+    Examples:
+        blackbox calendar fetch --year 2026 --month 1
+        blackbox calendar fetch --year 2025 --month 1 --months 12
+        blackbox calendar fetch -c USD -c EUR --impact high
+        blackbox calendar fetch --force-refresh
+    """
+    # Default to current month
+    today = date.today()
+    year = year or today.year
+    month = month or today.month
+
+    currencies = [c.upper() for c in currency] if currency else None
+
+    try:
+        events = None
+        if not force_refresh and months == 1:
+            events = _complete_month_events(year, month, currencies, impact)
+
+        if events is None:
+            # Only load the scraper stack when some days must be scraped
+            from blackbox.data.config import BrowserConfig, ForexFactoryConfig
+            from blackbox.data.services import CalendarService
+
+            config = ForexFactoryConfig(
+                browser=BrowserConfig(headless=headless),
+            )
+            service = CalendarService(config)
+            if months == 1:
+                events = service.fetch_month(
+                    year, month, currencies, impact, force_refresh
+                )
+            else:
+                events = service.fetch_months(
+                    _month_sequence(year, month, months),
+                    currencies,
+                    impact,
+                    force_refresh,
+                )
+
+        if json_output:
+            output = {
+                "year": year,
+                "month": month,
+                "events": [
+                    {
+                        "date": e.date,
+                        "time": e.time,
+                        "currency": e.currency,
+                        "impact": e.impact,
+                        "event_name": e.event_name,
+                        "actual": e.actual,
+                        "forecast": e.forecast,
+                        "previous": e.previous,
+                    }
+                    for e in events
+                ],
+            }
+            click.echo(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode())
+        else:
+            lines = [f"\nFound {len(events)} events:\n"]
+            lines += _event_lines(events, DATED_EVENT_LINE)
+            click.echo("\n".join(lines))
+
+    except Exception as e:
+        click.echo(f"Error fetching calendar: {e}", err=True)
+        raise click.Abort()
+
+
+@click.command("today")
+@click.option("--currency", "-c", multiple=True, help="Filter by currency")
+@click.option(
+    "--high-impact-only", "-H", is_flag=True, help="Show only high impact events"
+)
+@click.option(
+    "--headless/--no-headless", default=True, help="Run browser in headless mode"
+)
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def calendar_today(
+    currency: tuple,
+    high_impact_only: bool,
+    headless: bool,
+    json_output: bool,
+) -> None:
+    """Fetch today's economic calendar.
+
+    Uses cached data from PostgreSQL when available.
+
+    Examples:
+        blackbox calendar today
+        blackbox calendar today -c USD --high-impact-only
+    """
+    from blackbox.data.config import BrowserConfig, ForexFactoryConfig
+    from blackbox.data.services import CalendarService
+
+    config = ForexFactoryConfig(
+        browser=BrowserConfig(headless=headless),
+    )
+
+    currencies = [c.upper() for c in currency] if currency else None
+
+    try:
+        service = CalendarService(config)
+        events = service.fetch_today(currencies, high_impact_only)
+
+        if json_output:
+            output = {
+                "date": date.today(),
+                "events": [
+                    {
+                        "time": e.time,
+                        "currency": e.currency,
+                        "impact": e.impact,
+                        "event_name": e.event_name,
+                        "actual": e.actual,
+                        "forecast": e.forecast,
+                        "previous": e.previous,
+                    }
+                    for e in events
+                ],
+            }
+            click.echo(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode())
+        else:
+            lines = [f"\nToday ({date.today()}) - {len(events)} events:\n"]
+            lines += _event_lines(events)
+            click.echo("\n".join(lines))
+
+    except Exception as e:
+        click.echo(f"Error fetching calendar: {e}", err=True)
+        raise click.Abort()
@@ -0,0 +1,282 @@
+"""Database CLI commands.
+
+Loaded on demand by the ``db`` group of blackbox.cli.main.
+"""
+
+import csv
+import io
+import sys
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from datetime import date
+from typing import TextIO
+
+import click
+import orjson
+
+# db export streams rows in batches through a buffered writer
+EXPORT_BATCH_SIZE = 1000
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def _buffered_stdout() -> Iterator[TextIO]:
+    """Write to stdout through an EXPORT_BUFFER_SIZE buffer.
+
+    The wrappers are detached on exit, leaving the process stdout open.
+
+    Yields:
+        Text stream flushed to stdout in large chunks.
+    """
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if stdout_buffer is None:
+        yield sys.stdout
+        return
+
+    sys.stdout.flush()
+    buffered = io.BufferedWriter(stdout_buffer, buffer_size=EXPORT_BUFFER_SIZE)
+    stream = io.TextIOWrapper(
+        buffered, encoding=sys.stdout.encoding or "utf-8", newline=""
+    )
+    try:
+        yield stream
+    finally:
+        stream.flush()
+        stream.detach()
+        buffered.detach()
+
+
+@click.command("init")
+def db_init() -> None:
+    """Initialize the database tables (deprecated, use 'db migrate').
+
+    Creates all required tables in PostgreSQL using SQLAlchemy create_all.
+    For production, prefer using 'blackbox db migrate' which uses Alembic.
+
+    Examples:
+        blackbox db init
+    """
+    from blackbox.data.storage.database import init_db
+
+    try:
+        init_db()
+        click.echo("Database tables created successfully.")
+        click.echo("Note: For production, use 'blackbox db migrate' instead.")
+    except Exception as e:
+        click.echo(f"Error initializing database: {e}", err=True)
+        raise click.Abort()
+
+
+@click.command("migrate")
+@click.option(
+    "--revision",
+    "-r",
+    default="head",
+    help="Target revision (default: head for latest)",
+)
+def db_migrate(revision: str) -> None:
+    """Run database migrations using Alembic.
+
+    Applies pending migrations to bring the database up to date.
+    Use --revision to migrate to a specific version.
+
+    Examples:
+        blackbox db migrate           # Migrate to latest
+        blackbox db migrate -r 001    # Migrate to specific revision
+    """
+    try:
+        # Get the alembic.ini path (project root)
+        import os
+
+        from alembic import command
+        from alembic.config import Config
+
+        project_root = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        )
+        alembic_ini = os.path.join(project_root, "alembic.ini")
+
+        if not os.path.exists(alembic_ini):
+            click.echo(f"Error: alembic.ini not found at {alembic_ini}", err=True)
+            raise click.Abort()
+
+        alembic_cfg = Config(alembic_ini)
+        command.upgrade(alembic_cfg, revision)
+        click.echo(f"Database migrated to revision: {revision}")
+    except Exception as e:
+        click.echo(f"Error running migrations: {e}", err=True)
+        raise click.Abort()
+
+
+@click.command("migrate-status")
+def db_migrate_status() -> None:
+    """Show current migration status.
+
+    Displays which migrations have been applied and which are pending.
+
+    Examples:
+        blackbox db migrate-status
+    """
+    try:
+        import os
+
+        from alembic import command
+        from alembic.config import Config
+
+        project_root = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        )
+        alembic_ini = os.path.join(project_root, "alembic.ini")
+
+        if not os.path.exists(alembic_ini):
+            click.echo(f"Error: alembic.ini not found at {alembic_ini}", err=True)
+            raise click.Abort()
+
+        alembic_cfg = Config(alembic_ini)
+        click.echo("Current migration status:")
+        command.current(alembic_cfg, verbose=True)
+    except Exception as e:
+        click.echo(f"Error checking migration status: {e}", err=True)
+        raise click.Abort()
+
+
+@click.command("stats")
+def db_stats() -> None:
+    """Display statistics about stored events.
+
+    Shows total events, counts by currency and impact level,
+    and date range of stored data.
+
+    Examples:
+        blackbox db stats
+    """
+    from blackbox.data.services import CalendarService
+
+    try:
+        service = CalendarService()
+        stats = service.get_stats()
+
+        lines = [
+            "\nDatabase Statistics\n" + "=" * 40,
+            f"Total events: {stats['total_events']}",
+        ]
+
+        if stats["date_range"][0]:
+            lines.append(
+                f"Date range: {stats['date_range'][0]} to {stats['date_range'][1]}"
+            )
+        else:
+            lines.append("Date range: No data")
+
+        lines.append("\nBy Currency:")
+        for currency, count in stats["by_currency"].items():
+            lines.append(f"  {currency}: {count}")
+
+        lines.append("\nBy Impact:")
+        for impact, count in stats["by_impact"].items():
+            lines.append(f"  {impact}: {count}")
+
+        click.echo("\n".join(lines))
+
+    except Exception as e:
+        click.echo(f"Error getting stats: {e}", err=True)
+        raise click.Abort()
+
+
+@click.command("export")
+@click.option(
+    "--format",
+    "-f",
+    type=click.Choice(["csv", "json"]),
+    default="json",
+    help="Export format",
+)
+@click.option("--year", "-y", type=int, default=None, help="Year to export")
+@click.option("--month", "-m", type=int, default=None, help="Month to export")
+@click.option("--output", "-o", type=click.Path(), help="Output file (default: stdout)")
+def db_export(
+    format: str,
+    year: int | None,
+    month: int | None,
+    output: str | None,
+) -> None:
+    """Export stored events to CSV or JSON.
+
+    Exports all events or filter by year/month.
+
+    Examples:
+        blackbox db export --format json
+        blackbox db export --format csv --year 2026 --month 1 -o events.csv
+    """
+    from blackbox.data.storage.database import get_session
+    from blackbox.data.storage.repository import EVENT_RECORD_FIELDS, EventRepository
+
+    try:
+        with get_session() as session:
+            repo = EventRepository(session)
+
+            # Determine date range
+            if year and month:
+                import calendar as cal
+
+                _, last_day = cal.monthrange(year, month)
+                start_date = date(year, month, 1)
+                end_date = date(year, month, last_day)
+            else:
+                # Export all data
+                start_date, end_date = repo.get_date_range()
+                if not start_date:
+                    click.echo("No data to export.", err=True)
+                    return
+
+            # Rows are streamed from a server-side cursor straight to the sink
+            batches = repo.iter_event_records(
+                start_date, end_date, batch_size=EXPORT_BATCH_SIZE
+            )
+            with ExitStack() as stack:
+                f = (
+                    stack.enter_context(
+                        open(output, "w", buffering=EXPORT_BUFFER_SIZE, newline="")
+                    )
+                    if output
+                    else stack.enter_context(_buffered_stdout())
+                )
+                if format == "json":
+                    # Same layout as json.dumps(indent=2), written event by
+                    # event; total_events comes from a COUNT query up front
+                    header = {
+                        "exported_at": date.today().isoformat(),
+                        "start_date": start_date.isoformat(),
+                        "end_date": end_date.isoformat(),
+                        "total_events": repo.count_events(start_date, end_date),
+                    }
+                    head = orjson.dumps(header, option=orjson.OPT_INDENT_2).decode()
+                    f.write(head[:-2] + ',\n  "events": [')
+                    count = 0
+                    for batch in batches:
+                        for record in batch:
+                            event = orjson.dumps(record, option=orjson.OPT_INDENT_2)
+                            f.write(",\n    " if count else "\n    ")
+                            f.write(event.decode().replace("\n", "\n    "))
+                            count += 1
+                    f.write("\n  ]\n}\n" if count else "]\n}\n")
+                else:  # csv
+                    writer = csv.writer(f)
+                    writer.writerow(EVENT_RECORD_FIELDS)
+                    count = 0
+                    for batch in batches:
+                        writer.writerows(
+                            [
+                                "" if value is None else value
+                                for value in record.values()
+                            ]
+                            for record in batch
+                        )
+                        count += len(batch)
+
+            if output:
+                click.echo(f"Exported {count} events to {output}")
+
+    except Exception as e:
+        click.echo(f"Error exporting data: {e}", err=True)
+        raise click.Abort()
@@ -0,0 +1,52 @@
+"""Click group that imports its subcommands on demand.
+
+Subcommands are declared as ``"module:attribute"`` import strings, so a
+command module is only loaded when one of its commands is invoked or listed.
+"""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Click group resolving subcommands from import strings.
+
+    Attributes:
+        lazy_subcommands: Mapping of command name to ``"module:attribute"``.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs,
+    ):
+        """Initialize the group.
+
+        Args:
+            *args: Positional arguments for click.Group.
+            lazy_subcommands: Mapping of command name to ``"module:attribute"``.
+            **kwargs: Keyword arguments for click.Group.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy subcommand names, sorted."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a subcommand, importing it on first use."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import a lazy subcommand and cache it on the group."""
+        module_name, attribute = self.lazy_subcommands.pop(cmd_name).split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}:{attribute} is not a click command")
+        self.add_command(command, cmd_name)
+        return command
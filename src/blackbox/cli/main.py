@@ -3,20 +3,30 @@
 This module defines the command-line interface using Click.
 """
 
-import csv
-import json
 import logging
-from datetime import date
-from io import StringIO
 
 import click
 
 from blackbox import __version__
+from blackbox.cli.lazy import LazyGroup
 from blackbox.core.logging import setup_logging
-from blackbox.data.config import BrowserConfig, ForexFactoryConfig
-from blackbox.data.services import CalendarService
-from blackbox.data.storage.database import get_session, init_db
-from blackbox.data.storage.repository import EventRepository
+
+# The calendar and db commands live in their own modules, imported by LazyGroup
+# only when invoked. Data layer modules (SQLAlchemy, scraper) are in turn
+# imported inside the commands that use them, so --help, shell completion and
+# trivial commands like status start quickly.
+
+
+def _configure_database() -> None:
+    """Configure the engine of a CLI process, before any database access.
+
+    Connections are fresh for the lifetime of a CLI process, so checkouts
+    skip pre-ping. Group callbacks only run once a subcommand is resolved,
+    so help on the group itself does not import the data layer.
+    """
+    from blackbox.data.storage.database import configure
+
+    configure(pool_pre_ping=False)
 
 
 @click.group()
@@ -89,435 +99,38 @@ def backtest(strategy_name: str) -> None:
 
 
 # Calendar commands group
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "fetch": "blackbox.cli.calendar:calendar_fetch",
+        "today": "blackbox.cli.calendar:calendar_today",
+    },
+)
 def calendar() -> None:
     """Economic calendar commands.
 
     Fetch and display economic events from Forex Factory.
     """
-
-
-@calendar.command("fetch")
-@click.option(
-    "--year", "-y", type=int, default=None, help="Year to fetch (default: current)"
-)
-@click.option(
-    "--month", "-m", type=int, default=None, help="Month to fetch (default: current)"
-)
-@click.option(
-    "--currency",
-    "-c",
-    multiple=True,
-    help="Filter by currency (can be used multiple times)",
-)
-@click.option(
-    "--impact",
-    "-i",
-    type=click.Choice(["low", "medium", "high"]),
-    help="Minimum impact level",
-)
-@click.option(
-    "--headless/--no-headless", default=True, help="Run browser in headless mode"
-)
-@click.option(
-    "--force-refresh", "-f", is_flag=True, help="Force scraping even if data is cached"
-)
-@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
-def calendar_fetch(
-    year: int | None,
-    month: int | None,
-    currency: tuple,
-    impact: str | None,
-    headless: bool,
-    force_refresh: bool,
-    json_output: bool,
-) -> None:
-    """Fetch economic calendar for a month.
-
-    Uses cached data from PostgreSQL when available.
-    Use --force-refresh to always scrape fresh data.
-
-    Examples:
-        blackbox calendar fetch --year 2026 --month 1
-        blackbox calendar fetch -c USD -c EUR --impact high
-        blackbox calendar fetch --force-refresh
-    """
-    # Default to current month
-    today = date.today()
-    year = year or today.year
-    month = month or today.month
-
-    # Configure service
-    config = ForexFactoryConfig(
-        browser=BrowserConfig(headless=headless),
-    )
-
-    currencies = list(currency) if currency else None
-
-    try:
-        service = CalendarService(config)
-        events = service.fetch_month(year, month, currencies, impact, force_refresh)
-
-        if json_output:
-            output = {
-                "year": year,
-                "month": month,
-                "events": [
-                    {
-                        "date": str(e.date),
-                        "time": str(e.time) if e.time else None,
-                        "currency": e.currency,
-                        "impact": e.impact.value,
-                        "event_name": e.event_name,
-                        "actual": e.actual,
-                        "forecast": e.forecast,
-                        "previous": e.previous,
-                    }
-                    for e in events
-                ],
-            }
-            click.echo(json.dumps(output, indent=2))
-        else:
-            click.echo(f"\nFound {len(events)} events:\n")
-            for event in events:
-                time_str = event.time.strftime("%H:%M") if event.time else "All Day"
-                impact_marker = {
-                    "high": "!!!",
-                    "medium": "!!",
-                    "low": "!",
-                    "holiday": "H",
-                    "unknown": "?",
-                }
-                marker = impact_marker.get(event.impact.value, "?")
-                click.echo(
-                    f"[{event.date}] [{time_str}] [{event.currency}] [{marker}] "
-                    f"{event.event_name} | A:{event.actual or '-'} F:{event.forecast or '-'} P:{event.previous or '-'}"
-                )
-
-    except Exception as e:
-        click.echo(f"Error fetching calendar: {e}", err=True)
-        raise click.Abort()
-
-
-@calendar.command("today")
-@click.option("--currency", "-c", multiple=True, help="Filter by currency")
-@click.option(
-    "--high-impact-only", "-H", is_flag=True, help="Show only high impact events"
-)
-@click.option(
-    "--headless/--no-headless", default=True, help="Run browser in headless mode"
-)
-@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
-def calendar_today(
-    currency: tuple,
-    high_impact_only: bool,
-    headless: bool,
-    json_output: bool,
-) -> None:
-    """Fetch today's economic calendar.
-
-    Uses cached data from PostgreSQL when available.
-
-    Examples:
-        blackbox calendar today
-        blackbox calendar today -c USD --high-impact-only
-    """
-    config = ForexFactoryConfig(
-        browser=BrowserConfig(headless=headless),
-    )
-
-    currencies = list(currency) if currency else None
-
-    try:
-        service = CalendarService(config)
-        events = service.fetch_today(currencies, high_impact_only)
-
-        if json_output:
-            output = {
-                "date": str(date.today()),
-                "events": [
-                    {
-                        "time": str(e.time) if e.time else None,
-                        "currency": e.currency,
-                        "impact": e.impact.value,
-                        "event_name": e.event_name,
-                        "actual": e.actual,
-                        "forecast": e.forecast,
-                        "previous": e.previous,
-                    }
-                    for e in events
-                ],
-            }
-            click.echo(json.dumps(output, indent=2))
-        else:
-            click.echo(f"\nToday ({date.today()}) - {len(events)} events:\n")
-            for event in events:
-                time_str = event.time.strftime("%H:%M") if event.time else "All Day"
-                impact_marker = {
-                    "high": "!!!",
-                    "medium": "!!",
-                    "low": "!",
-                    "holiday": "H",
-                    "unknown": "?",
-                }
-                marker = impact_marker.get(event.impact.value, "?")
-                click.echo(
-                    f"[{time_str}] [{event.currency}] [{marker}] "
-                    f"{event.event_name} | A:{event.actual or '-'} F:{event.forecast or '-'} P:{event.previous or '-'}"
-                )
-
-    except Exception as e:
-        click.echo(f"Error fetching calendar: {e}", err=True)
-        raise click.Abort()
+    _configure_database()
 
 
 # Database commands group
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "init": "blackbox.cli.db:db_init",
+        "migrate": "blackbox.cli.db:db_migrate",
+        "migrate-status": "blackbox.cli.db:db_migrate_status",
+        "stats": "blackbox.cli.db:db_stats",
+        "export": "blackbox.cli.db:db_export",
+    },
+)
 def db() -> None:
     """Database management commands.
 
     Initialize, inspect, and export calendar data from PostgreSQL.
     """
-
-
-@db.command("init")
-def db_init() -> None:
-    """Initialize the database tables (deprecated, use 'db migrate').
-
-    Creates all required tables in PostgreSQL using SQLAlchemy create_all.
-    For production, prefer using 'blackbox db migrate' which uses Alembic.
-
-    Examples:
-        blackbox db init
-    """
-    try:
-        init_db()
-        click.echo("Database tables created successfully.")
-        click.echo("Note: For production, use 'blackbox db migrate' instead.")
-    except Exception as e:
-        click.echo(f"Error initializing database: {e}", err=True)
-        raise click.Abort()
-
-
-@db.command("migrate")
-@click.option(
-    "--revision",
-    "-r",
-    default="head",
-    help="Target revision (default: head for latest)",
-)
-def db_migrate(revision: str) -> None:
-    """Run database migrations using Alembic.
-
-    Applies pending migrations to bring the database up to date.
-    Use --revision to migrate to a specific version.
-
-    Examples:
-        blackbox db migrate           # Migrate to latest
-        blackbox db migrate -r 001    # Migrate to specific revision
-    """
-    try:
-        # Get the alembic.ini path (project root)
-        import os
-
-        from alembic import command
-        from alembic.config import Config
-
-        project_root = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        )
-        alembic_ini = os.path.join(project_root, "alembic.ini")
-
-        if not os.path.exists(alembic_ini):
-            click.echo(f"Error: alembic.ini not found at {alembic_ini}", err=True)
-            raise click.Abort()
-
-        alembic_cfg = Config(alembic_ini)
-        command.upgrade(alembic_cfg, revision)
-        click.echo(f"Database migrated to revision: {revision}")
-    except Exception as e:
-        click.echo(f"Error running migrations: {e}", err=True)
-        raise click.Abort()
-
-
-@db.command("migrate-status")
-def db_migrate_status() -> None:
-    """Show current migration status.
-
-    Displays which migrations have been applied and which are pending.
-
-    Examples:
-        blackbox db migrate-status
-    """
-    try:
-        import os
-
-        from alembic import command
-        from alembic.config import Config
-
-        project_root = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        )
-        alembic_ini = os.path.join(project_root, "alembic.ini")
-
-        if not os.path.exists(alembic_ini):
-            click.echo(f"Error: alembic.ini not found at {alembic_ini}", err=True)
-            raise click.Abort()
-
-        alembic_cfg = Config(alembic_ini)
-        click.echo("Current migration status:")
-        command.current(alembic_cfg, verbose=True)
-    except Exception as e:
-        click.echo(f"Error checking migration status: {e}", err=True)
-        raise click.Abort()
-
-
-@db.command("stats")
-def db_stats() -> None:
-    """Display statistics about stored events.
-
-    Shows total events, counts by currency and impact level,
-    and date range of stored data.
-
-    Examples:
-        blackbox db stats
-    """
-    try:
-        service = CalendarService()
-        stats = service.get_stats()
-
-        click.echo("\nDatabase Statistics\n" + "=" * 40)
-        click.echo(f"Total events: {stats['total_events']}")
-
-        if stats["date_range"][0]:
-            click.echo(
-                f"Date range: {stats['date_range'][0]} to {stats['date_range'][1]}"
-            )
-        else:
-            click.echo("Date range: No data")
-
-        click.echo("\nBy Currency:")
-        for currency, count in sorted(
-            stats["by_currency"].items(), key=lambda x: -x[1]
-        ):
-            click.echo(f"  {currency}: {count}")
-
-        click.echo("\nBy Impact:")
-        for impact, count in sorted(stats["by_impact"].items(), key=lambda x: -x[1]):
-            click.echo(f"  {impact}: {count}")
-
-    except Exception as e:
-        click.echo(f"Error getting stats: {e}", err=True)
-        raise click.Abort()
-
-
-@db.command("export")
-@click.option(
-    "--format",
-    "-f",
-    type=click.Choice(["csv", "json"]),
-    default="json",
-    help="Export format",
-)
-@click.option("--year", "-y", type=int, default=None, help="Year to export")
-@click.option("--month", "-m", type=int, default=None, help="Month to export")
-@click.option("--output", "-o", type=click.Path(), help="Output file (default: stdout)")
-def db_export(
-    format: str,
-    year: int | None,
-    month: int | None,
-    output: str | None,
-) -> None:
-    """Export stored events to CSV or JSON.
-
-    Exports all events or filter by year/month.
-
-    Examples:
-        blackbox db export --format json
-        blackbox db export --format csv --year 2026 --month 1 -o events.csv
-    """
-    try:
-        with get_session() as session:
-            repo = EventRepository(session)
-
-            # Determine date range
-            if year and month:
-                import calendar as cal
-
-                _, last_day = cal.monthrange(year, month)
-                start_date = date(year, month, 1)
-                end_date = date(year, month, last_day)
-            else:
-                # Export all data
-                stats = repo.get_stats()
-                if not stats["date_range"][0]:
-                    click.echo("No data to export.", err=True)
-                    return
-                start_date, end_date = stats["date_range"]
-
-            events = repo.get_events(start_date, end_date)
-
-            if format == "json":
-                data = {
-                    "exported_at": date.today().isoformat(),
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                    "total_events": len(events),
-                    "events": [
-                        {
-                            "date": e.date.isoformat(),
-                            "time": e.time.isoformat() if e.time else None,
-                            "currency": e.currency,
-                            "impact": e.impact.value,
-                            "event_name": e.event_name,
-                            "actual": e.actual,
-                            "forecast": e.forecast,
-                            "previous": e.previous,
-                        }
-                        for e in events
-                    ],
-                }
-                content = json.dumps(data, indent=2)
-            else:  # csv
-                string_buffer = StringIO()
-                writer = csv.writer(string_buffer)
-                writer.writerow(
-                    [
-                        "date",
-                        "time",
-                        "currency",
-                        "impact",
-                        "event_name",
-                        "actual",
-                        "forecast",
-                        "previous",
-                    ]
-                )
-                for e in events:
-                    writer.writerow(
-                        [
-                            e.date.isoformat(),
-                            e.time.isoformat() if e.time else "",
-                            e.currency,
-                            e.impact.value,
-                            e.event_name,
-                            e.actual or "",
-                            e.forecast or "",
-                            e.previous or "",
-                        ]
-                    )
-                content = string_buffer.getvalue()
-
-            if output:
-                with open(output, "w") as f:
-                    f.write(content)
-                click.echo(f"Exported {len(events)} events to {output}")
-            else:
-                click.echo(content)
-
-    except Exception as e:
-        click.echo(f"Error exporting data: {e}", err=True)
-        raise click.Abort()
+    _configure_database()
 
 
 if __name__ == "__main__":
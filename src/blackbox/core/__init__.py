@@ -4,18 +4,53 @@ This module contains the business logic for the trading robot,
 including strategies, signals, and portfolio management.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from blackbox.core.logging import get_logger, setup_logging
-from blackbox.core.scoring import (
-    ScoringConfig,
-    ScoringService,
-    calculate_currency_score,
-    calculate_decay,
-    calculate_event_force,
-    calculate_pair_bias,
-    event_to_datetime,
-    get_bias_signal,
+
+if TYPE_CHECKING:
+    from blackbox.core.scoring import (
+        ScoringConfig,
+        ScoringService,
+        calculate_currency_score,
+        calculate_currency_score_arrays,
+        calculate_currency_scores,
+        calculate_decay,
+        calculate_event_force,
+        calculate_pair_bias,
+        event_to_datetime,
+        get_bias_signal,
+        get_bias_signals,
+    )
+
+# Scoring pulls in NumPy and the data layer, so its exports are only loaded on
+# first access (PEP 562) and importing the logging helpers stays cheap.
+_SCORING_EXPORTS = frozenset(
+    {
+        "ScoringConfig",
+        "ScoringService",
+        "calculate_currency_score",
+        "calculate_currency_score_arrays",
+        "calculate_currency_scores",
+        "calculate_decay",
+        "calculate_event_force",
+        "calculate_pair_bias",
+        "event_to_datetime",
+        "get_bias_signal",
+        "get_bias_signals",
+    }
 )
 
+
+def __getattr__(name: str) -> Any:
+    """Load scoring exports lazily."""
+    if name in _SCORING_EXPORTS:
+        from blackbox.core import scoring
+
+        return getattr(scoring, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Logging
     "get_logger",
@@ -26,7 +61,10 @@ __all__ = [
     "calculate_decay",
     "calculate_event_force",
     "calculate_currency_score",
+    "calculate_currency_score_arrays",
+    "calculate_currency_scores",
     "calculate_pair_bias",
     "event_to_datetime",
     "get_bias_signal",
+    "get_bias_signals",
 ]
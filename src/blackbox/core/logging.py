@@ -1,15 +1,19 @@
 """Logging configuration for Blackbox Trading Robot.
 
 This module provides a centralized logging system with:
-- Console output with colors
+- Console output with colors (plain text when not on a terminal)
 - Daily rotating log files
 - Configurable log levels
+- File writes done by a background thread, so disk I/O never blocks callers
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+import time
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 
 
@@ -38,32 +42,52 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: LogColors.CRITICAL,
     }
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record with colors."""
-        color = self.COLORS.get(record.levelno, LogColors.RESET)
+    def __init__(self):
+        super().__init__(fmt=self._template(LogColors.RESET), datefmt="%H:%M:%S")
+        # One precompiled template per level, picked in formatMessage
+        self._styles = {
+            levelno: logging.PercentStyle(self._template(color))
+            for levelno, color in self.COLORS.items()
+        }
+        # (second, formatted time) of the last record, reused within a second
+        self._ts_cache: tuple[int, str] = (-1, "")
+
+    @staticmethod
+    def _template(color: str) -> str:
+        """Build the colored format string for a level color."""
+        return (
+            f"{LogColors.TIMESTAMP}%(asctime)s{LogColors.RESET} "
+            f"{color}%(levelname)-8s{LogColors.RESET} "
+            f"{LogColors.NAME}[%(name)s]{LogColors.RESET} "
+            "%(message)s"
+        )
 
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Format the record time, reusing the string within the same second."""
+        if datefmt not in (None, self.datefmt):
+            return super().formatTime(record, datefmt)
 
-        # Format level name with fixed width
-        levelname = f"{record.levelname:<8}"
+        second = int(record.created)
+        if second != self._ts_cache[0]:
+            self._ts_cache = (
+                second,
+                time.strftime(self.datefmt, time.localtime(second)),
+            )
+        return self._ts_cache[1]
 
-        # Format message
-        message = record.getMessage()
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Format log record with the colors of its level."""
+        return self._styles.get(record.levelno, self._style).format(record)
 
-        # Build colored output
-        output = (
-            f"{LogColors.TIMESTAMP}{timestamp}{LogColors.RESET} "
-            f"{color}{levelname}{LogColors.RESET} "
-            f"{LogColors.NAME}[{record.name}]{LogColors.RESET} "
-            f"{message}"
-        )
 
-        # Add exception info if present
-        if record.exc_info:
-            output += f"\n{self.formatException(record.exc_info)}"
+class PlainFormatter(logging.Formatter):
+    """Console formatter without colors, for pipes, files and NO_COLOR."""
 
-        return output
+    def __init__(self):
+        super().__init__(
+            fmt="%(asctime)s %(levelname)-8s [%(name)s] %(message)s",
+            datefmt="%H:%M:%S",
+        )
 
 
 class FileFormatter(logging.Formatter):
@@ -78,7 +102,9 @@ class FileFormatter(logging.Formatter):
 
 # Global configuration
 _log_dir: Path | None = None
+_log_dir_ready: bool = False
 _initialized: bool = False
+_listener: QueueListener | None = None
 _console_level: int = logging.INFO
 _file_level: int = logging.DEBUG
 
@@ -89,13 +115,15 @@ def get_log_directory() -> Path:
     Returns:
         Path to the logs directory.
     """
-    global _log_dir
+    global _log_dir, _log_dir_ready
 
     if _log_dir is None:
         # Default to project root / logs
         _log_dir = Path.cwd() / "logs"
 
-    _log_dir.mkdir(parents=True, exist_ok=True)
+    if not _log_dir_ready:
+        _log_dir.mkdir(parents=True, exist_ok=True)
+        _log_dir_ready = True
     return _log_dir
 
 
@@ -105,9 +133,29 @@ def set_log_directory(path: Path | str) -> None:
     Args:
         path: Path to the log directory.
     """
-    global _log_dir
+    global _log_dir, _log_dir_ready
     _log_dir = Path(path)
     _log_dir.mkdir(parents=True, exist_ok=True)
+    _log_dir_ready = True
+
+
+def use_colors(stream=None) -> bool:
+    """Check whether console output should be colored.
+
+    Colors are used only on a terminal, and never when the NO_COLOR
+    environment variable is set (https://no-color.org).
+
+    Args:
+        stream: Console stream (default: sys.stdout).
+
+    Returns:
+        True if ANSI colors should be emitted.
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    stream = stream or sys.stdout
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
 
 
 def setup_logging(
@@ -122,7 +170,7 @@ def setup_logging(
         file_level: Log level for file output.
         log_dir: Optional custom log directory.
     """
-    global _initialized, _console_level, _file_level
+    global _initialized, _console_level, _file_level, _listener
 
     if _initialized:
         return
@@ -143,8 +191,9 @@ def setup_logging(
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(console_level)
-    console_handler.setFormatter(ColoredFormatter())
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(
+        ColoredFormatter() if use_colors(sys.stdout) else PlainFormatter()
+    )
 
     # File handler with daily rotation
     log_file = get_log_directory() / "blackbox.log"
@@ -158,7 +207,15 @@ def setup_logging(
     file_handler.setLevel(file_level)
     file_handler.setFormatter(FileFormatter())
     file_handler.suffix = "%Y-%m-%d"  # Add date to rotated files
-    root_logger.addHandler(file_handler)
+
+    # Console output stays synchronous so it interleaves with click.echo;
+    # file records are queued by the caller and written by the listener
+    root_logger.addHandler(console_handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
 
     _initialized = True
 
@@ -187,13 +244,25 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def _handlers() -> list[logging.Handler]:
+    """Get the handlers that actually write log records."""
+    handlers = [
+        handler
+        for handler in logging.getLogger().handlers
+        if not isinstance(handler, QueueHandler)
+    ]
+    if _listener is not None:
+        handlers.extend(_listener.handlers)
+    return handlers
+
+
 def set_console_level(level: int) -> None:
     """Change console log level at runtime.
 
     Args:
         level: New log level (e.g., logging.DEBUG).
     """
-    for handler in logging.getLogger().handlers:
+    for handler in _handlers():
         if isinstance(handler, logging.StreamHandler) and not isinstance(
             handler, TimedRotatingFileHandler
         ):
@@ -206,6 +275,6 @@ def set_file_level(level: int) -> None:
     Args:
         level: New log level (e.g., logging.DEBUG).
     """
-    for handler in logging.getLogger().handlers:
+    for handler in _handlers():
         if isinstance(handler, TimedRotatingFileHandler):
             handler.setLevel(level)
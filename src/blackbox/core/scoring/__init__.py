@@ -6,11 +6,14 @@ based on economic events, with temporal decay and directional biases.
 
 from blackbox.core.scoring.calculator import (
     calculate_currency_score,
+    calculate_currency_score_arrays,
+    calculate_currency_scores,
     calculate_decay,
     calculate_event_force,
     calculate_pair_bias,
     event_to_datetime,
     get_bias_signal,
+    get_bias_signals,
 )
 from blackbox.core.scoring.config import ScoringConfig
 from blackbox.core.scoring.service import ScoringService
@@ -24,7 +27,10 @@ __all__ = [
     "calculate_decay",
     "calculate_event_force",
     "calculate_currency_score",
+    "calculate_currency_score_arrays",
+    "calculate_currency_scores",
     "calculate_pair_bias",
     "event_to_datetime",
     "get_bias_signal",
+    "get_bias_signals",
 ]
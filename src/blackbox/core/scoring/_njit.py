@@ -0,0 +1,31 @@
+"""Optional Numba JIT compilation for scoring kernels.
+
+Numba is an optional dependency (``pip install blackbox[fast]``). Without it,
+``njit`` leaves functions as plain Python, ``prange`` is ``range``, a single
+thread is reported and NUMBA_AVAILABLE is False, so callers can keep their
+NumPy implementation instead.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from numba import get_num_threads, njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def get_num_threads() -> int:
+        """Stand-in for numba.get_num_threads: no parallel threads."""
+        return 1
+
+    def njit(*args: Any, **kwargs: Any) -> Callable:
+        """Stand-in for numba.njit returning the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+
+__all__ = ["NUMBA_AVAILABLE", "get_num_threads", "njit", "prange"]
@@ -4,17 +4,98 @@ This module contains stateless functions for calculating scores,
 decay factors, and directional biases based on economic events.
 """
 
+import math
+from collections.abc import Collection, Sequence
 from datetime import datetime
 from datetime import time as dt_time
+from typing import TYPE_CHECKING
 
+import numpy as np
+
+from blackbox.core.scoring._njit import (
+    NUMBA_AVAILABLE,
+    get_num_threads,
+    njit,
+    prange,
+)
 from blackbox.core.scoring.config import ScoringConfig
-from blackbox.data.models import EconomicEvent
+from blackbox.data.models import EconomicEvent, wall_clock_seconds
+
+if TYPE_CHECKING:
+    from blackbox.data.storage.repository import EventArrays
+
+_LN2 = math.log(2)
+
+# Below this many events, starting Numba's worker threads costs more than it saves
+PARALLEL_MIN_EVENTS = 20_000
+
+# Kernels are compiled with fastmath, which assumes finite floats, so an
+# infinite decay cutoff is passed to them as the lowest finite float
+_NO_CUTOFF_SECONDS = float(np.finfo(np.float64).min)
+
+
+def _decay_coefficient(half_life_hours: float) -> float:
+    """Return the exponent coefficient k such that decay = exp(k * hours).
+
+    Since 0.5^(hours / half_life) == exp(-ln(2) / half_life * hours), hoisting
+    k out of a loop leaves a single multiplication and exp per event.
+
+    Args:
+        half_life_hours: Number of hours for decay to reach 50%.
+
+    Returns:
+        The (negative) decay coefficient, in 1/hours.
+
+    Raises:
+        ValueError: If half_life_hours is not positive.
+    """
+    if half_life_hours <= 0:
+        raise ValueError("half_life_hours must be positive")
+    return -_LN2 / half_life_hours
+
+
+def _calculate_decay_fast(hours_elapsed: float, k: float) -> float:
+    """Calculate the decay factor from a precomputed coefficient.
+
+    Args:
+        hours_elapsed: Hours between the event and the reference time.
+        k: Decay coefficient, as in ScoringConfig.decay_k.
+
+    Returns:
+        Decay factor between 0 and 1. Returns 1.0 for future events.
+    """
+    # Clamp instead of branching: exp(0) is already 1.0
+    return math.exp(k * max(hours_elapsed, 0.0))
+
+
+def _decay_array(
+    event_seconds: np.ndarray, reference_seconds: float, k: float
+) -> np.ndarray:
+    """Calculate the decay factor of each event in one vectorized pass.
+
+    Works in a single scratch array, clamping future events to zero hours
+    rather than masking them.
+
+    Args:
+        event_seconds: Event times on the _seconds_since_epoch axis.
+        reference_seconds: Reference time on the same axis.
+        k: Decay coefficient, as in ScoringConfig.decay_k.
+
+    Returns:
+        Decay factor of each event. Future events get 1.0.
+    """
+    decay = reference_seconds - event_seconds
+    decay *= k / 3600
+    # k is negative, so future events have a positive exponent to clamp
+    np.minimum(decay, 0.0, out=decay)
+    return np.exp(decay, out=decay)
 
 
 def calculate_decay(
     event_time: datetime,
     reference_time: datetime,
     half_life_hours: float,
+    k: float | None = None,
 ) -> float:
     """Calculate temporal decay factor for an event.
 
@@ -25,26 +106,25 @@ def calculate_decay(
         event_time: When the event occurred (timezone-aware or naive).
         reference_time: Reference point for decay calculation.
         half_life_hours: Number of hours for decay to reach 50%.
+        k: Precomputed decay coefficient (e.g., ScoringConfig.decay_k).
+            When given, it is used instead of deriving one from
+            half_life_hours.
 
     Returns:
         Decay factor between 0 and 1. Returns 1.0 for future events.
 
     Raises:
-        ValueError: If half_life_hours is not positive.
+        ValueError: If half_life_hours is not positive and k is not given.
     """
-    if half_life_hours <= 0:
-        raise ValueError("half_life_hours must be positive")
+    if k is None:
+        k = _decay_coefficient(half_life_hours)
 
     # Calculate hours elapsed
     elapsed = reference_time - event_time
     hours_elapsed = elapsed.total_seconds() / 3600
 
-    # Future events have no decay
-    if hours_elapsed < 0:
-        return 1.0
-
-    # Exponential decay: 0.5^(hours/half_life)
-    return 0.5 ** (hours_elapsed / half_life_hours)
+    # Exponential decay: 0.5^(hours/half_life), future events have none
+    return _calculate_decay_fast(hours_elapsed, k)
 
 
 def calculate_event_force(
@@ -95,19 +175,165 @@ def event_to_datetime(
     return event_dt
 
 
+def _seconds_since_epoch(value: datetime) -> float:
+    """Convert a wall-clock datetime to seconds on the wall_clock_seconds axis.
+
+    Ignores timezone offsets so that differences match naive datetime
+    subtraction, which is what the scalar decay uses for events sharing
+    the reference's tzinfo.
+    """
+    return wall_clock_seconds(value.date(), value.time())
+
+
 def calculate_currency_score(
     events: list[EconomicEvent],
-    currency: str,
+    currency: str | None,
     reference_time: datetime,
     config: ScoringConfig,
 ) -> float:
     """Calculate aggregate score for a currency from its events.
 
     Filters events by currency, calculates force for each valid event
-    (with non-None surprise), and sums them with temporal decay.
+    (with non-None surprise), and sums them with temporal decay. The
+    decay and force are computed over NumPy arrays in a single pass.
 
     Args:
         events: List of economic events to process.
+        currency: Currency code to filter by (e.g., "USD", "EUR"), or None
+            when the events were already fetched for a single currency.
+        reference_time: Reference point for decay calculation.
+        config: Scoring configuration with decay parameters.
+
+    Returns:
+        Aggregate score for the currency. Returns 0.0 if no valid events.
+    """
+    if currency is None:
+        valid_events = [event for event in events if event.surprise is not None]
+    else:
+        currency_upper = currency.upper()
+        valid_events = [
+            event
+            for event in events
+            if event.currency == currency_upper and event.surprise is not None
+        ]
+    if not valid_events:
+        return 0.0
+
+    count = len(valid_events)
+    event_seconds = np.fromiter(
+        (wall_clock_seconds(e.date, e.time) for e in valid_events),
+        dtype=np.float64,
+        count=count,
+    )
+    forces = np.fromiter(
+        (e.surprise * e.weight for e in valid_events),
+        dtype=np.float64,
+        count=count,
+    )
+
+    return _decayed_sum(event_seconds, forces, reference_time, config)
+
+
+def calculate_currency_scores(
+    arrays: "EventArrays",
+    currencies: Collection[str],
+    reference_time: datetime,
+    config: ScoringConfig,
+) -> dict[str, float]:
+    """Calculate aggregate scores for several currencies from event arrays.
+
+    Array counterpart of calculate_currency_score, for events loaded with
+    AsyncEventRepository.get_event_arrays. The decayed force of every event
+    is computed once and summed per currency in the same pass, so scoring a
+    pair costs no more than scoring one currency.
+
+    Args:
+        arrays: Scoring inputs of the events.
+        currencies: Currency codes to score (e.g., ["EUR", "USD"]).
+        reference_time: Reference point for decay calculation.
+        config: Scoring configuration with decay parameters.
+
+    Returns:
+        Mapping of each currency code, as given, to its score. Currencies
+        without valid events score 0.0.
+    """
+    if not arrays.currency_ids:
+        return dict.fromkeys(currencies, 0.0)
+
+    k = config.decay_k
+
+    reference_seconds = _seconds_since_epoch(reference_time)
+    cutoff_seconds = max(
+        reference_seconds - config.decay_cutoff_seconds, _NO_CUTOFF_SECONDS
+    )
+    if NUMBA_AVAILABLE:
+        threads = get_num_threads()
+        if threads > 1 and len(arrays.seconds) >= PARALLEL_MIN_EVENTS:
+            # Each thread sums its own slice of events, then slices are added
+            totals = _score_loop_parallel(
+                arrays.seconds,
+                arrays.surprise,
+                arrays.weight,
+                arrays.currency_id,
+                len(arrays.currency_ids),
+                reference_seconds,
+                cutoff_seconds,
+                k,
+                threads,
+            )
+        else:
+            # One compiled loop, accumulating straight into per-currency totals
+            totals = _score_loop(
+                arrays.seconds,
+                arrays.surprise,
+                arrays.weight,
+                arrays.currency_id,
+                len(arrays.currency_ids),
+                reference_seconds,
+                cutoff_seconds,
+                k,
+            )
+    else:
+        seconds = arrays.seconds
+        surprise = arrays.surprise
+        weight = arrays.weight
+        currency_id = arrays.currency_id
+        # Drop events past the cutoff before evaluating exp on the rest
+        recent = seconds >= cutoff_seconds
+        if not recent.all():
+            seconds = seconds[recent]
+            surprise = surprise[recent]
+            weight = weight[recent]
+            currency_id = currency_id[recent]
+
+        contributions = _decay_array(seconds, reference_seconds, k)
+        contributions *= surprise
+        contributions *= weight
+        totals = np.bincount(
+            currency_id,
+            weights=contributions,
+            minlength=len(arrays.currency_ids),
+        )
+
+    scores: dict[str, float] = {}
+    for currency in currencies:
+        currency_id = arrays.currency_ids.get(currency.upper())
+        scores[currency] = 0.0 if currency_id is None else float(totals[currency_id])
+    return scores
+
+
+def calculate_currency_score_arrays(
+    arrays: "EventArrays",
+    currency: str,
+    reference_time: datetime,
+    config: ScoringConfig,
+) -> float:
+    """Calculate aggregate score for a currency from event arrays.
+
+    Single-currency shortcut for calculate_currency_scores.
+
+    Args:
+        arrays: Scoring inputs of the events.
         currency: Currency code to filter by (e.g., "USD", "EUR").
         reference_time: Reference point for decay calculation.
         config: Scoring configuration with decay parameters.
@@ -115,27 +341,127 @@ def calculate_currency_score(
     Returns:
         Aggregate score for the currency. Returns 0.0 if no valid events.
     """
-    currency_upper = currency.upper()
-    total_score = 0.0
+    return calculate_currency_scores(arrays, [currency], reference_time, config)[
+        currency
+    ]
+
+
+@njit(cache=True, fastmath=True)
+def _score_loop(
+    seconds: np.ndarray,
+    surprise: np.ndarray,
+    weight: np.ndarray,
+    currency_id: np.ndarray,
+    currency_count: int,
+    reference_seconds: float,
+    cutoff_seconds: float,
+    k: float,
+) -> np.ndarray:
+    """Sum the decayed forces of events per currency in a single loop.
+
+    Compiled with Numba when it is installed; used by
+    calculate_currency_scores only in that case.
 
-    for event in events:
-        # Filter by currency
-        if event.currency.upper() != currency_upper:
-            continue
+    Args:
+        seconds: Event times on the _seconds_since_epoch axis.
+        surprise: Surprise scores.
+        weight: Importance weights.
+        currency_id: Currency index of each event.
+        currency_count: Number of distinct currency indexes.
+        reference_seconds: Reference time on the same axis.
+        cutoff_seconds: Events before this time are skipped. Must be finite,
+            as the kernel is compiled with fastmath.
+        k: Decay coefficient, as in ScoringConfig.decay_k.
 
-        # Skip events without surprise score
-        if event.surprise is None:
+    Returns:
+        Aggregate score of each currency index.
+    """
+    totals = np.zeros(currency_count)
+    for i in range(seconds.shape[0]):
+        if seconds[i] < cutoff_seconds:
             continue
+        # Future events have no decay
+        hours_elapsed = max((reference_seconds - seconds[i]) / 3600.0, 0.0)
+        totals[currency_id[i]] += surprise[i] * weight[i] * math.exp(k * hours_elapsed)
+    return totals
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _score_loop_parallel(
+    seconds: np.ndarray,
+    surprise: np.ndarray,
+    weight: np.ndarray,
+    currency_id: np.ndarray,
+    currency_count: int,
+    reference_seconds: float,
+    cutoff_seconds: float,
+    k: float,
+    chunks: int,
+) -> np.ndarray:
+    """Multi-threaded variant of _score_loop for large event arrays.
+
+    Events are split into contiguous chunks, each summed into its own row
+    of per-currency totals on a separate thread, so threads never write to
+    the same accumulator.
 
-        # Calculate decay based on event time
-        event_dt = event_to_datetime(event, reference_time)
-        decay = calculate_decay(event_dt, reference_time, config.half_life_hours)
+    Args:
+        seconds: Event times on the _seconds_since_epoch axis.
+        surprise: Surprise scores.
+        weight: Importance weights.
+        currency_id: Currency index of each event.
+        currency_count: Number of distinct currency indexes.
+        reference_seconds: Reference time on the same axis.
+        cutoff_seconds: Events before this time are skipped. Must be finite,
+            as the kernel is compiled with fastmath.
+        k: Decay coefficient, as in ScoringConfig.decay_k.
+        chunks: Number of chunks, normally the number of Numba threads.
+
+    Returns:
+        Aggregate score of each currency index.
+    """
+    count = seconds.shape[0]
+    size = (count + chunks - 1) // chunks
+    partial = np.zeros((chunks, currency_count))
+    for chunk in prange(chunks):
+        for i in range(chunk * size, min((chunk + 1) * size, count)):
+            if seconds[i] < cutoff_seconds:
+                continue
+            # Future events have no decay
+            hours_elapsed = max((reference_seconds - seconds[i]) / 3600.0, 0.0)
+            partial[chunk, currency_id[i]] += (
+                surprise[i] * weight[i] * math.exp(k * hours_elapsed)
+            )
+    return partial.sum(axis=0)
+
+
+def _decayed_sum(
+    event_seconds: np.ndarray,
+    forces: np.ndarray,
+    reference_time: datetime,
+    config: ScoringConfig,
+) -> float:
+    """Sum event forces weighted by their temporal decay.
+
+    Events older than the configured cutoff are left out.
+
+    Args:
+        event_seconds: Event times on the _seconds_since_epoch axis.
+        forces: Surprise times weight of each event.
+        reference_time: Reference point for decay calculation.
+        config: Scoring configuration with decay parameters.
 
-        # Calculate and accumulate force
-        force = calculate_event_force(event.surprise, event.weight, decay)
-        total_score += force
+    Returns:
+        Sum of force × decay over the events.
+    """
+    reference_seconds = _seconds_since_epoch(reference_time)
+    recent = event_seconds >= reference_seconds - config.decay_cutoff_seconds
+    if not recent.all():
+        event_seconds = event_seconds[recent]
+        forces = forces[recent]
+
+    decay = _decay_array(event_seconds, reference_seconds, config.decay_k)
 
-    return total_score
+    return float(np.dot(forces, decay))
 
 
 def calculate_pair_bias(base_score: float, quote_score: float) -> float:
@@ -174,3 +500,28 @@ def get_bias_signal(bias: float, threshold: float) -> str:
         return "BEARISH"
     else:
         return "NEUTRAL"
+
+
+def get_bias_signals(
+    biases: Sequence[float] | np.ndarray, threshold: float
+) -> list[str]:
+    """Convert several bias values to directional signals at once.
+
+    Batch counterpart of get_bias_signal for baskets of pairs: the
+    thresholds are applied to the whole array instead of one branch per
+    pair.
+
+    Args:
+        biases: Pair bias values.
+        threshold: Minimum absolute bias for directional signal.
+
+    Returns:
+        Signal of each bias, in order, as get_bias_signal would return it.
+    """
+    values = np.asarray(biases, dtype=np.float64)
+    labels = np.where(
+        values > threshold,
+        "BULLISH",
+        np.where(values < -threshold, "BEARISH", "NEUTRAL"),
+    )
+    return labels.tolist()
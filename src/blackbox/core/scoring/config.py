@@ -3,7 +3,8 @@
 This module defines configuration dataclasses for the scoring system.
 """
 
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -17,17 +18,43 @@ class ScoringConfig:
         min_bias_threshold: Minimum absolute bias value to generate
             a directional signal (BULLISH/BEARISH). Below this threshold,
             the signal is NEUTRAL.
+        cache_ttl_seconds: How long an event cache from
+            ScoringService.create_event_cache keeps the events of a lookback
+            window (0 to disable).
+        decay_cutoff_halflives: Events older than this many half-lives are
+            skipped instead of decayed (10 half-lives leave under 0.1% of
+            their force). Use math.inf to score every event.
+        decay_k: Derived coefficient -ln(2) / half_life_hours, such that
+            decay = exp(decay_k * hours_elapsed).
+        decay_cutoff_seconds: Derived age, in seconds, past which events
+            are skipped.
     """
 
     half_life_hours: float = 48.0
     lookback_days: int = 7
     min_bias_threshold: float = 1.0
+    cache_ttl_seconds: float = 60.0
+    decay_cutoff_halflives: float = 10.0
+    decay_k: float = field(init=False, repr=False, compare=False)
+    decay_cutoff_seconds: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate configuration values."""
+        """Validate configuration values and derive decay constants."""
         if self.half_life_hours <= 0:
             raise ValueError("half_life_hours must be positive")
         if self.lookback_days <= 0:
             raise ValueError("lookback_days must be positive")
         if self.min_bias_threshold < 0:
             raise ValueError("min_bias_threshold must be non-negative")
+        if self.cache_ttl_seconds < 0:
+            raise ValueError("cache_ttl_seconds must be non-negative")
+        if self.decay_cutoff_halflives <= 0:
+            raise ValueError("decay_cutoff_halflives must be positive")
+
+        # Derived once here so scoring calls only load them
+        object.__setattr__(self, "decay_k", -math.log(2) / self.half_life_hours)
+        object.__setattr__(
+            self,
+            "decay_cutoff_seconds",
+            self.decay_cutoff_halflives * self.half_life_hours * 3600,
+        )
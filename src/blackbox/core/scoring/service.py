@@ -4,39 +4,69 @@ This module provides a high-level interface for calculating currency
 scores and pair biases, integrating with the event repository.
 """
 
-from datetime import datetime, timedelta
+from collections.abc import Collection, Sequence
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from cachetools import TTLCache
 
 from blackbox.core.scoring.calculator import (
-    calculate_currency_score,
+    calculate_currency_scores,
     calculate_pair_bias,
     get_bias_signal,
+    get_bias_signals,
 )
 from blackbox.core.scoring.config import ScoringConfig
-from blackbox.data.storage.repository import EventRepository
+from blackbox.data.storage.repository import AsyncEventRepository, EventArrays
+
+# Lookback windows kept per event cache
+EVENT_CACHE_SIZE = 32
 
 
 class ScoringService:
     """Service for calculating fundamental scores and biases.
 
-    Integrates with EventRepository to fetch events and calculate
-    scores with temporal decay.
+    Integrates with AsyncEventRepository to fetch events and calculate
+    scores with temporal decay. All methods are coroutines so database
+    round trips do not block the caller's event loop.
     """
 
     def __init__(
         self,
         config: ScoringConfig,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        event_cache: TTLCache | None = None,
     ) -> None:
         """Initialize the scoring service.
 
         Args:
             config: Scoring configuration with decay and threshold parameters.
             event_repository: Repository for fetching economic events.
+            event_cache: Optional cache of the events of each lookback window
+                (see create_event_cache). It may be shared by short-lived
+                services, e.g. one per request; without it, each call only
+                fetches the events of the currencies it scores.
         """
         self.config = config
         self.repository = event_repository
+        self._event_cache = event_cache
+
+    @staticmethod
+    def create_event_cache(config: ScoringConfig) -> TTLCache | None:
+        """Create an event cache keeping windows for config.cache_ttl_seconds.
 
-    def get_currency_score(
+        Args:
+            config: Scoring configuration.
+
+        Returns:
+            A cache to pass to ScoringService, or None when caching is
+            disabled (cache_ttl_seconds of 0).
+        """
+        if config.cache_ttl_seconds <= 0:
+            return None
+        return TTLCache(maxsize=EVENT_CACHE_SIZE, ttl=config.cache_ttl_seconds)
+
+    async def get_currency_score(
         self,
         currency: str,
         at_time: datetime | None = None,
@@ -53,22 +83,41 @@ class ScoringService:
         Returns:
             Aggregate score for the currency.
         """
+        scores = await self.get_currency_scores([currency], at_time)
+        return scores[currency]
+
+    async def get_currency_scores(
+        self,
+        currencies: Collection[str],
+        at_time: datetime | None = None,
+    ) -> dict[str, float]:
+        """Calculate aggregate scores for several currencies at once.
+
+        Events for all currencies are fetched with a single query, as NumPy
+        arrays scored without building event objects, and every currency is
+        scored in the same pass over them. With an event cache, the events of
+        a lookback window are reused while the cache keeps them.
+
+        Args:
+            currencies: Currency codes (e.g., ["EUR", "USD"]).
+            at_time: Reference time for calculations. Defaults to now.
+
+        Returns:
+            Mapping of each currency code, as given, to its score.
+        """
         reference_time = at_time if at_time is not None else datetime.now()
 
         # Calculate date range for lookback
         end_date = reference_time.date()
         start_date = end_date - timedelta(days=self.config.lookback_days)
 
-        # Fetch events for the currency in the lookback window
-        events = self.repository.get_events(
-            start_date=start_date,
-            end_date=end_date,
-            currencies=[currency],
-        )
+        arrays = await self._get_event_arrays(start_date, end_date, currencies)
 
-        return calculate_currency_score(events, currency, reference_time, self.config)
+        return calculate_currency_scores(
+            arrays, currencies, reference_time, self.config
+        )
 
-    def get_pair_bias(
+    async def get_pair_bias(
         self,
         base: str,
         quote: str,
@@ -88,12 +137,11 @@ class ScoringService:
         """
         reference_time = at_time if at_time is not None else datetime.now()
 
-        base_score = self.get_currency_score(base, reference_time)
-        quote_score = self.get_currency_score(quote, reference_time)
+        scores = await self.get_currency_scores([base, quote], reference_time)
 
-        return calculate_pair_bias(base_score, quote_score)
+        return calculate_pair_bias(scores[base], scores[quote])
 
-    def get_bias_signal(
+    async def get_bias_signal(
         self,
         base: str,
         quote: str,
@@ -111,5 +159,72 @@ class ScoringService:
             "BEARISH" if bias < -threshold,
             "NEUTRAL" otherwise.
         """
-        bias = self.get_pair_bias(base, quote, at_time)
+        bias = await self.get_pair_bias(base, quote, at_time)
         return get_bias_signal(bias, self.config.min_bias_threshold)
+
+    async def get_bias_signals(
+        self,
+        pairs: Sequence[tuple[str, str]],
+        at_time: datetime | None = None,
+    ) -> list[str]:
+        """Get directional signals for a basket of currency pairs.
+
+        Every currency of the basket is scored in a single pass and the
+        signals are derived from the bias array at once.
+
+        Args:
+            pairs: (base, quote) currency codes of each pair.
+            at_time: Reference time for calculations. Defaults to now.
+
+        Returns:
+            Signal of each pair, in order (see get_bias_signal).
+        """
+        if not pairs:
+            return []
+
+        currencies = list(dict.fromkeys(code for pair in pairs for code in pair))
+        scores = await self.get_currency_scores(currencies, at_time)
+
+        base_scores = np.fromiter(
+            (scores[base] for base, _ in pairs), dtype=np.float64, count=len(pairs)
+        )
+        quote_scores = np.fromiter(
+            (scores[quote] for _, quote in pairs), dtype=np.float64, count=len(pairs)
+        )
+        return get_bias_signals(
+            base_scores - quote_scores, self.config.min_bias_threshold
+        )
+
+    async def _get_event_arrays(
+        self,
+        start_date: date,
+        end_date: date,
+        currencies: Collection[str],
+    ) -> EventArrays:
+        """Fetch the scoring inputs of a lookback window, through the event cache.
+
+        The cache holds every currency of the window, so any later pair or
+        basket over the same window is served without a query. Without a
+        cache, only the requested currencies are fetched.
+
+        Args:
+            start_date: Start of the lookback window (inclusive).
+            end_date: End of the lookback window (inclusive).
+            currencies: Currencies needed when there is no cache.
+
+        Returns:
+            EventArrays for the window.
+        """
+        if self._event_cache is None:
+            return await self.repository.get_event_arrays(
+                start_date=start_date, end_date=end_date, currencies=currencies
+            )
+
+        key = (start_date, end_date)
+        arrays = self._event_cache.get(key)
+        if arrays is None:
+            arrays = await self.repository.get_event_arrays(
+                start_date=start_date, end_date=end_date
+            )
+            self._event_cache[key] = arrays
+        return arrays
@@ -4,13 +4,27 @@ This module provides data fetching capabilities including
 economic calendar scraping from various sources.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from blackbox.data.models import (
     CalendarDay,
     CalendarMonth,
     EconomicEvent,
     Impact,
 )
-from blackbox.data.scraper.forex_factory import ForexFactoryScraper
+
+if TYPE_CHECKING:
+    from blackbox.data.scraper.forex_factory import ForexFactoryScraper
+
+
+def __getattr__(name: str) -> Any:
+    """Load the scraper lazily, so storage-only imports skip Selenium."""
+    if name == "ForexFactoryScraper":
+        from blackbox.data.scraper.forex_factory import ForexFactoryScraper
+
+        return ForexFactoryScraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "EconomicEvent",
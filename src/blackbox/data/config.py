@@ -5,15 +5,25 @@ scraping delays, and specific scraper implementations.
 """
 
 import random
+import threading
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import accumulate
 
+import numpy as np
 
-@dataclass
+# Delays drawn at once per range, then handed out one per call
+DELAY_BATCH_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
 class ScraperDelays:
     """Configuration for scraper timing delays.
 
     Delays are randomized within min/max ranges to simulate
-    human-like behavior and avoid detection.
+    human-like behavior and avoid detection. They are drawn in batches
+    of DELAY_BATCH_SIZE from a NumPy generator, seeded for reproducible
+    runs.
 
     Attributes:
         page_load_min: Minimum wait after page load (seconds).
@@ -22,6 +32,7 @@ class ScraperDelays:
         action_max: Maximum wait between actions (seconds).
         pagination_min: Minimum wait between pagination (seconds).
         pagination_max: Maximum wait between pagination (seconds).
+        seed: Seed of the random generator (None for a fresh one).
     """
 
     page_load_min: float = 2.0
@@ -30,21 +41,43 @@ class ScraperDelays:
     action_max: float = 1.5
     pagination_min: float = 3.0
     pagination_max: float = 6.0
+    seed: int | None = None
+    _rng: np.random.Generator = field(init=False, repr=False, compare=False)
+    _queues: dict[tuple[float, float], deque[float]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    # Scrapers in worker threads share one instance; guards the queues and
+    # the generator, neither of which is thread-safe
+    _lock: threading.Lock = field(
+        init=False, repr=False, compare=False, default_factory=threading.Lock
+    )
+
+    def __post_init__(self) -> None:
+        """Create the random generator."""
+        object.__setattr__(self, "_rng", np.random.default_rng(self.seed))
 
     def get_page_load_delay(self) -> float:
         """Get a random page load delay within configured range."""
-        return random.uniform(self.page_load_min, self.page_load_max)
+        return self._next_delay(self.page_load_min, self.page_load_max)
 
     def get_action_delay(self) -> float:
         """Get a random action delay within configured range."""
-        return random.uniform(self.action_min, self.action_max)
+        return self._next_delay(self.action_min, self.action_max)
 
     def get_pagination_delay(self) -> float:
         """Get a random pagination delay within configured range."""
-        return random.uniform(self.pagination_min, self.pagination_max)
+        return self._next_delay(self.pagination_min, self.pagination_max)
+
+    def _next_delay(self, low: float, high: float) -> float:
+        """Pop the next delay of a range, drawing a new batch when empty."""
+        with self._lock:
+            queue = self._queues.setdefault((low, high), deque())
+            if not queue:
+                queue.extend(self._rng.uniform(low, high, DELAY_BATCH_SIZE).tolist())
+            return queue.popleft()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BrowserConfig:
     """Configuration for browser/WebDriver settings.
 
@@ -55,6 +88,8 @@ class BrowserConfig:
         implicit_wait: Implicit wait timeout (seconds).
         window_width: Browser window width.
         window_height: Browser window height.
+        idle_timeout: Seconds a pooled browser may stay idle before it is
+            closed (0 keeps it open until the pool shuts down).
     """
 
     headless: bool = True
@@ -63,9 +98,10 @@ class BrowserConfig:
     implicit_wait: int = 10
     window_width: int = 1920
     window_height: int = 1080
+    idle_timeout: float = 300.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ForexFactoryConfig:
     """Configuration specific to Forex Factory scraper.
 
@@ -76,6 +112,8 @@ class ForexFactoryConfig:
         max_retries: Maximum retry attempts for failed requests.
         retry_delay: Base delay between retries (exponential backoff).
         cache_ttl: Cache time-to-live in seconds (0 to disable).
+        refresh_workers: Number of scrapers (each with its own browser)
+            running in parallel when refreshing a full month.
     """
 
     base_url: str = "https://www.forexfactory.com/calendar"
@@ -84,21 +122,33 @@ class ForexFactoryConfig:
     max_retries: int = 3
     retry_delay: float = 5.0
     cache_ttl: int = 300
+    refresh_workers: int = 3
 
 
 # Default configurations
 DEFAULT_FOREX_FACTORY_CONFIG = ForexFactoryConfig()
 
 # User agent pool for rotation
-USER_AGENTS = [
+USER_AGENTS = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
-]
+)
+
+# Relative frequency of each USER_AGENTS entry, roughly following browser share
+USER_AGENT_WEIGHTS = (0.35, 0.35, 0.15, 0.1, 0.05)
+_USER_AGENT_CUM_WEIGHTS = tuple(accumulate(USER_AGENT_WEIGHTS))
+
+
+# Per-thread generators, so parallel scrapers do not share the global one
+_thread_local = threading.local()
 
 
 def get_random_user_agent() -> str:
     """Get a random user agent from the pool."""
-    return random.choice(USER_AGENTS)
+    rng = getattr(_thread_local, "rng", None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random()
+    return rng.choices(USER_AGENTS, cum_weights=_USER_AGENT_CUM_WEIGHTS)[0]
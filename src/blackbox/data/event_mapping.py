@@ -9,12 +9,16 @@ The mapping system uses two strategies:
 """
 
 import re
-from dataclasses import dataclass
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from types import MappingProxyType
 
 from blackbox.data.models import EventType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventMetadata:
     """Metadata for an economic event.
 
@@ -29,12 +33,13 @@ class EventMetadata:
     weight: int  # 1 to 10
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventPattern:
     """Pattern-based event matcher.
 
     Attributes:
-        pattern: Compiled regex pattern.
+        pattern: Compiled regex pattern, matched against normalized
+            (lowercase) event names.
         metadata: Metadata to apply when pattern matches.
         priority: Higher priority patterns are checked first (default: 0).
     """
@@ -44,32 +49,50 @@ class EventPattern:
     priority: int = 0
 
 
+# One shared instance per distinct metadata value, filled at import
+_METADATA_POOL: dict[EventMetadata, EventMetadata] = {}
+
+
+def _shared(metadata: EventMetadata) -> EventMetadata:
+    """Return the pooled instance equal to metadata.
+
+    Args:
+        metadata: Metadata value.
+
+    Returns:
+        The first instance registered with this value.
+    """
+    return _METADATA_POOL.setdefault(metadata, metadata)
+
+
 # Regex patterns for event categorization, ordered by priority
 # Higher priority = more specific patterns checked first
-EVENT_PATTERNS: list[EventPattern] = [
+# Names are lowercased before matching, so patterns are lowercase and
+# compiled without re.IGNORECASE
+EVENT_PATTERNS: tuple[EventPattern, ...] = (
     # === INTEREST RATE (priority 100) - Most important ===
     EventPattern(
-        re.compile(r"\b(federal funds rate|interest rate decision)\b", re.IGNORECASE),
+        re.compile(r"\b(federal funds rate|interest rate decision)\b"),
         EventMetadata(EventType.INTEREST_RATE, +1, 10),
         priority=100,
     ),
     EventPattern(
-        re.compile(r"\b(official bank rate|main refinancing rate)\b", re.IGNORECASE),
+        re.compile(r"\b(official bank rate|main refinancing rate)\b"),
         EventMetadata(EventType.INTEREST_RATE, +1, 10),
         priority=100,
     ),
     EventPattern(
-        re.compile(r"\bfomc\s+(statement|press conference)\b", re.IGNORECASE),
+        re.compile(r"\bfomc\s+(statement|press conference)\b"),
         EventMetadata(EventType.INTEREST_RATE, +1, 10),
         priority=100,
     ),
     EventPattern(
-        re.compile(r"\bfomc\s+meeting\s+minutes\b", re.IGNORECASE),
+        re.compile(r"\bfomc\s+meeting\s+minutes\b"),
         EventMetadata(EventType.INTEREST_RATE, +1, 8),
         priority=100,
     ),
     EventPattern(
-        re.compile(r"\becb\s+press\s+conference\b", re.IGNORECASE),
+        re.compile(r"\becb\s+press\s+conference\b"),
         EventMetadata(EventType.INTEREST_RATE, +1, 9),
         priority=100,
     ),
@@ -77,7 +100,6 @@ EVENT_PATTERNS: list[EventPattern] = [
         re.compile(
             r"\b(boj|snb|rba|rbnz|boc|boe)\s+"
             r"(policy\s+rate|cash\s+rate|overnight\s+rate|official\s+(cash\s+)?rate)\b",
-            re.IGNORECASE,
         ),
         EventMetadata(EventType.INTEREST_RATE, +1, 10),
         priority=100,
@@ -85,290 +107,296 @@ EVENT_PATTERNS: list[EventPattern] = [
     EventPattern(
         re.compile(
             r"\bboj\s+(monetary\s+policy\s+statement|press\s+conference|outlook\s+report)\b",
-            re.IGNORECASE,
         ),
         EventMetadata(EventType.INTEREST_RATE, +1, 9),
         priority=100,
     ),
     # === EMPLOYMENT (priority 90) ===
     EventPattern(
-        re.compile(r"\bnon-?farm\s+(employment|payroll)", re.IGNORECASE),
+        re.compile(r"\bnon-?farm\s+(employment|payroll)"),
         EventMetadata(EventType.EMPLOYMENT, +1, 10),
         priority=90,
     ),
     EventPattern(
-        re.compile(r"\bunemployment\s+rate\b", re.IGNORECASE),
+        re.compile(r"\bunemployment\s+rate\b"),
         EventMetadata(EventType.EMPLOYMENT, -1, 10),
         priority=90,
     ),
     EventPattern(
-        re.compile(r"\bunemployment\s+(claims|change)\b", re.IGNORECASE),
+        re.compile(r"\bunemployment\s+(claims|change)\b"),
         EventMetadata(EventType.EMPLOYMENT, -1, 8),
         priority=90,
     ),
     EventPattern(
-        re.compile(r"\b(initial|continuing)\s+jobless\s+claims\b", re.IGNORECASE),
+        re.compile(r"\b(initial|continuing)\s+jobless\s+claims\b"),
         EventMetadata(EventType.EMPLOYMENT, -1, 8),
         priority=90,
     ),
     EventPattern(
-        re.compile(r"\badp\s+.*employment", re.IGNORECASE),
+        re.compile(r"\badp\s+.*employment"),
         EventMetadata(EventType.EMPLOYMENT, +1, 7),
         priority=90,
     ),
     EventPattern(
-        re.compile(r"\baverage\s+hourly\s+earnings\b", re.IGNORECASE),
+        re.compile(r"\baverage\s+hourly\s+earnings\b"),
         EventMetadata(EventType.EMPLOYMENT, +1, 7),
         priority=90,
     ),
     EventPattern(
-        re.compile(r"\bemployment\s+change\b", re.IGNORECASE),
+        re.compile(r"\bemployment\s+change\b"),
         EventMetadata(EventType.EMPLOYMENT, +1, 8),
         priority=90,
     ),
     EventPattern(
-        re.compile(r"\bclaimant\s+count\b", re.IGNORECASE),
+        re.compile(r"\bclaimant\s+count\b"),
         EventMetadata(EventType.EMPLOYMENT, -1, 7),
         priority=90,
     ),
     EventPattern(
-        re.compile(r"\bjob\s+(openings|cuts)\b", re.IGNORECASE),
+        re.compile(r"\bjob\s+(openings|cuts)\b"),
         EventMetadata(EventType.EMPLOYMENT, +1, 6),
         priority=90,
     ),
     EventPattern(
-        re.compile(r"\bjolts\b", re.IGNORECASE),
+        re.compile(r"\bjolts\b"),
         EventMetadata(EventType.EMPLOYMENT, +1, 7),
         priority=90,
     ),
     # === INFLATION (priority 85) ===
     EventPattern(
-        re.compile(r"\bcore\s+pce\b", re.IGNORECASE),
+        re.compile(r"\bcore\s+pce\b"),
         EventMetadata(EventType.INFLATION, +1, 10),
         priority=85,
     ),
     EventPattern(
-        re.compile(r"\bpce\s+price\s+index\b", re.IGNORECASE),
+        re.compile(r"\bpce\s+price\s+index\b"),
         EventMetadata(EventType.INFLATION, +1, 9),
         priority=85,
     ),
     EventPattern(
-        re.compile(r"\bcore\s+cpi\b", re.IGNORECASE),
+        re.compile(r"\bcore\s+cpi\b"),
         EventMetadata(EventType.INFLATION, +1, 10),
         priority=85,
     ),
     EventPattern(
-        re.compile(r"\bcpi\b", re.IGNORECASE),
+        re.compile(r"\bcpi\b"),
         EventMetadata(EventType.INFLATION, +1, 9),
         priority=85,
     ),
     EventPattern(
-        re.compile(r"\bcore\s+ppi\b", re.IGNORECASE),
+        re.compile(r"\bcore\s+ppi\b"),
         EventMetadata(EventType.INFLATION, +1, 8),
         priority=85,
     ),
     EventPattern(
-        re.compile(r"\bppi\b", re.IGNORECASE),
+        re.compile(r"\bppi\b"),
         EventMetadata(EventType.INFLATION, +1, 7),
         priority=85,
     ),
     EventPattern(
-        re.compile(r"\bhicp\b", re.IGNORECASE),
+        re.compile(r"\bhicp\b"),
         EventMetadata(EventType.INFLATION, +1, 9),
         priority=85,
     ),
     EventPattern(
-        re.compile(r"\binflation\s+expectations?\b", re.IGNORECASE),
+        re.compile(r"\binflation\s+expectations?\b"),
         EventMetadata(EventType.INFLATION, +1, 5),
         priority=85,
     ),
     # === GROWTH (priority 80) ===
     EventPattern(
-        re.compile(r"\b(advance|preliminary|prelim|final)?\s*gdp\b", re.IGNORECASE),
+        re.compile(r"\b(advance|preliminary|prelim|final)?\s*gdp\b"),
         EventMetadata(EventType.GROWTH, +1, 9),
         priority=80,
     ),
     EventPattern(
-        re.compile(r"\bretail\s+sales\b", re.IGNORECASE),
+        re.compile(r"\bretail\s+sales\b"),
         EventMetadata(EventType.GROWTH, +1, 7),
         priority=80,
     ),
     EventPattern(
-        re.compile(r"\bindustrial\s+production\b", re.IGNORECASE),
+        re.compile(r"\bindustrial\s+production\b"),
         EventMetadata(EventType.GROWTH, +1, 6),
         priority=80,
     ),
     EventPattern(
-        re.compile(r"\bfactory\s+orders\b", re.IGNORECASE),
+        re.compile(r"\bfactory\s+orders\b"),
         EventMetadata(EventType.GROWTH, +1, 5),
         priority=80,
     ),
     EventPattern(
-        re.compile(r"\bmanufacturing\s+(production|sales)\b", re.IGNORECASE),
+        re.compile(r"\bmanufacturing\s+(production|sales)\b"),
         EventMetadata(EventType.GROWTH, +1, 5),
         priority=80,
     ),
     EventPattern(
-        re.compile(r"\bwholesale\s+sales\b", re.IGNORECASE),
+        re.compile(r"\bwholesale\s+sales\b"),
         EventMetadata(EventType.GROWTH, +1, 4),
         priority=80,
     ),
     # === PMI (priority 75) ===
     EventPattern(
-        re.compile(r"\bism\s+.*pmi\b", re.IGNORECASE),
+        re.compile(r"\bism\s+.*pmi\b"),
         EventMetadata(EventType.PMI, +1, 8),
         priority=75,
     ),
     EventPattern(
-        re.compile(r"\bflash\s+.*pmi\b", re.IGNORECASE),
+        re.compile(r"\bflash\s+.*pmi\b"),
         EventMetadata(EventType.PMI, +1, 8),
         priority=75,
     ),
     EventPattern(
-        re.compile(r"\bpmi\b", re.IGNORECASE),
+        re.compile(r"\bpmi\b"),
         EventMetadata(EventType.PMI, +1, 6),
         priority=75,
     ),
     EventPattern(
         re.compile(
-            r"\b(empire\s+state|philly\s+fed)\s+manufacturing\s+index\b", re.IGNORECASE
+            r"\b(empire\s+state|philly\s+fed)\s+manufacturing\s+index\b",
         ),
         EventMetadata(EventType.PMI, +1, 5),
         priority=75,
     ),
     EventPattern(
-        re.compile(r"\bmanufacturing\s+index\b", re.IGNORECASE),
+        re.compile(r"\bmanufacturing\s+index\b"),
         EventMetadata(EventType.PMI, +1, 5),
         priority=75,
     ),
     # === HOUSING (priority 70) ===
     EventPattern(
-        re.compile(r"\bbuilding\s+(permits?|approvals?|consents?)\b", re.IGNORECASE),
+        re.compile(r"\bbuilding\s+(permits?|approvals?|consents?)\b"),
         EventMetadata(EventType.HOUSING, +1, 4),
         priority=70,
     ),
     EventPattern(
-        re.compile(r"\bhousing\s+starts\b", re.IGNORECASE),
+        re.compile(r"\bhousing\s+starts\b"),
         EventMetadata(EventType.HOUSING, +1, 4),
         priority=70,
     ),
     EventPattern(
-        re.compile(r"\b(existing|new|pending)\s+home\s+sales\b", re.IGNORECASE),
+        re.compile(r"\b(existing|new|pending)\s+home\s+sales\b"),
         EventMetadata(EventType.HOUSING, +1, 4),
         priority=70,
     ),
     EventPattern(
-        re.compile(r"\bhpi\b", re.IGNORECASE),
+        re.compile(r"\bhpi\b"),
         EventMetadata(EventType.HOUSING, +1, 3),
         priority=70,
     ),
     EventPattern(
-        re.compile(r"\bhouse\s+price\b", re.IGNORECASE),
+        re.compile(r"\bhouse\s+price\b"),
         EventMetadata(EventType.HOUSING, +1, 3),
         priority=70,
     ),
     EventPattern(
-        re.compile(r"\bconstruction\s+(spending|output)\b", re.IGNORECASE),
+        re.compile(r"\bconstruction\s+(spending|output)\b"),
         EventMetadata(EventType.HOUSING, +1, 3),
         priority=70,
     ),
     EventPattern(
-        re.compile(r"\bmortgage\s+approvals?\b", re.IGNORECASE),
+        re.compile(r"\bmortgage\s+approvals?\b"),
         EventMetadata(EventType.HOUSING, +1, 3),
         priority=70,
     ),
     # === SENTIMENT (priority 65) ===
     EventPattern(
-        re.compile(r"\bconsumer\s+(confidence|sentiment)\b", re.IGNORECASE),
+        re.compile(r"\bconsumer\s+(confidence|sentiment)\b"),
         EventMetadata(EventType.SENTIMENT, +1, 5),
         priority=65,
     ),
     EventPattern(
-        re.compile(r"\bbusiness\s+(confidence|sentiment|climate)\b", re.IGNORECASE),
+        re.compile(r"\bbusiness\s+(confidence|sentiment|climate)\b"),
         EventMetadata(EventType.SENTIMENT, +1, 4),
         priority=65,
     ),
     EventPattern(
-        re.compile(r"\binvestor\s+(confidence|sentiment)\b", re.IGNORECASE),
+        re.compile(r"\binvestor\s+(confidence|sentiment)\b"),
         EventMetadata(EventType.SENTIMENT, +1, 4),
         priority=65,
     ),
     EventPattern(
-        re.compile(r"\bzew\s+economic\s+sentiment\b", re.IGNORECASE),
+        re.compile(r"\bzew\s+economic\s+sentiment\b"),
         EventMetadata(EventType.SENTIMENT, +1, 5),
         priority=65,
     ),
     EventPattern(
-        re.compile(r"\bifo\s+business\s+climate\b", re.IGNORECASE),
+        re.compile(r"\bifo\s+business\s+climate\b"),
         EventMetadata(EventType.SENTIMENT, +1, 5),
         priority=65,
     ),
     EventPattern(
-        re.compile(r"\bgfk\s+consumer\s+climate\b", re.IGNORECASE),
+        re.compile(r"\bgfk\s+consumer\s+climate\b"),
         EventMetadata(EventType.SENTIMENT, +1, 4),
         priority=65,
     ),
     EventPattern(
-        re.compile(r"\beconomic\s+optimism\b", re.IGNORECASE),
+        re.compile(r"\beconomic\s+optimism\b"),
         EventMetadata(EventType.SENTIMENT, +1, 4),
         priority=65,
     ),
     EventPattern(
-        re.compile(r"\bsentiment\b", re.IGNORECASE),
+        re.compile(r"\bsentiment\b"),
         EventMetadata(EventType.SENTIMENT, +1, 4),
         priority=65,
     ),
     # === TRADE (priority 60) ===
     EventPattern(
-        re.compile(r"\btrade\s+balance\b", re.IGNORECASE),
+        re.compile(r"\btrade\s+balance\b"),
         EventMetadata(EventType.TRADE, +1, 4),
         priority=60,
     ),
     EventPattern(
-        re.compile(r"\bcurrent\s+account\b", re.IGNORECASE),
+        re.compile(r"\bcurrent\s+account\b"),
         EventMetadata(EventType.TRADE, +1, 4),
         priority=60,
     ),
     EventPattern(
-        re.compile(r"\bgoods\s+trade\s+balance\b", re.IGNORECASE),
+        re.compile(r"\bgoods\s+trade\s+balance\b"),
         EventMetadata(EventType.TRADE, +1, 3),
         priority=60,
     ),
     EventPattern(
-        re.compile(r"\b(import|export)\s+prices?\b", re.IGNORECASE),
+        re.compile(r"\b(import|export)\s+prices?\b"),
         EventMetadata(EventType.TRADE, +1, 3),
         priority=60,
     ),
     # === OTHER (priority 10) - Low priority catchalls ===
     EventPattern(
-        re.compile(r"\bbank\s+holiday\b", re.IGNORECASE),
+        re.compile(r"\bbank\s+holiday\b"),
         EventMetadata(EventType.OTHER, +1, 1),
         priority=10,
     ),
     EventPattern(
-        re.compile(r"\b(fomc|mpc|ecb)\s+member\s+.*speaks\b", re.IGNORECASE),
+        re.compile(r"\b(fomc|mpc|ecb)\s+member\s+.*speaks\b"),
         EventMetadata(EventType.OTHER, +1, 3),
         priority=10,
     ),
     EventPattern(
-        re.compile(r"\bpresident\s+.*speaks\b", re.IGNORECASE),
+        re.compile(r"\bpresident\s+.*speaks\b"),
         EventMetadata(EventType.OTHER, +1, 4),
         priority=10,
     ),
     EventPattern(
-        re.compile(r"\bbond\s+auction\b", re.IGNORECASE),
+        re.compile(r"\bbond\s+auction\b"),
         EventMetadata(EventType.OTHER, +1, 2),
         priority=10,
     ),
-]
+)
 
 # Sort patterns by priority (highest first)
-EVENT_PATTERNS.sort(key=lambda p: p.priority, reverse=True)
+EVENT_PATTERNS = tuple(
+    replace(p, metadata=_shared(p.metadata))
+    for p in sorted(EVENT_PATTERNS, key=lambda p: p.priority, reverse=True)
+)
+
+# (search, metadata) pairs in priority order, read by _match_pattern
+_PATTERN_MATCHERS = tuple((p.pattern.search, p.metadata) for p in EVENT_PATTERNS)
 
 
-# Exact match mapping for specific events with known metadata
+# Exact match mapping for specific events with known metadata, completed and
+# frozen into EXACT_EVENT_MAPPING below
 # Keys are lowercase, trimmed event names
-EXACT_EVENT_MAPPING: dict[str, EventMetadata] = {
+_EXACT_EVENT_NAMES: dict[str, EventMetadata] = {
     # Employment - High Impact
     "non-farm employment change": EventMetadata(EventType.EMPLOYMENT, +1, 10),
     "nonfarm payrolls": EventMetadata(EventType.EMPLOYMENT, +1, 10),
@@ -483,36 +511,131 @@ EXACT_EVENT_MAPPING: dict[str, EventMetadata] = {
 }
 
 
-def _normalize_event_name(event_name: str) -> str:
-    """Normalize event name for matching.
+# Metadata of events matching neither an exact name nor a pattern
+DEFAULT_EVENT_METADATA = _shared(EventMetadata(EventType.OTHER, +1, 1))
+
+
+def _match_pattern(event_name: str) -> EventMetadata | None:
+    """Try to match event name against regex patterns.
+
+    Args:
+        event_name: The event name to match, trimmed and lowercased
+            (patterns only match lowercase text).
+
+    Returns:
+        EventMetadata if a pattern matches, None otherwise.
+    """
+    for search, metadata in _PATTERN_MATCHERS:
+        if search(event_name):
+            return metadata
+    return None
+
+
+def _pattern_literal(pattern: re.Pattern[str]) -> str | None:
+    """Return the name a pattern stands for, if it is a plain keyword.
 
     Args:
-        event_name: Raw event name from scraper.
+        pattern: Compiled event pattern.
 
     Returns:
-        Normalized name (lowercase, trimmed).
+        The keyword with single spaces (e.g., "trade balance" for
+        ``\\btrade\\s+balance\\b``), or None if the pattern uses any other
+        regex syntax.
     """
-    return event_name.strip().lower()
+    source = pattern.pattern.removeprefix(r"\b").removesuffix(r"\b")
+    literal = source.replace(r"\s+", " ")
+    if re.search(r"[\\^$.|?*+()\[\]{}]", literal):
+        return None
+    return literal
 
 
-def _match_pattern(event_name: str) -> EventMetadata | None:
-    """Try to match event name against regex patterns.
+def _build_exact_mapping(
+    names: dict[str, EventMetadata],
+) -> Mapping[str, EventMetadata]:
+    """Complete the exact mapping and freeze it.
+
+    Adds names that are exactly a keyword pattern, with the metadata the
+    pattern scan would return for them, and the "nonfarm"/"non-farm"
+    spelling of existing entries; existing entries are never replaced.
+    Keys are interned, equal metadata values share one instance and the
+    result is read-only.
 
     Args:
-        event_name: The event name to match.
+        names: Hand-written exact entries.
 
     Returns:
-        EventMetadata if a pattern matches, None otherwise.
+        Read-only mapping of normalized event name to metadata.
     """
+    mapping = dict(names)
     for event_pattern in EVENT_PATTERNS:
-        if event_pattern.pattern.search(event_name):
-            return event_pattern.metadata
-    return None
+        literal = _pattern_literal(event_pattern.pattern)
+        if literal is not None and literal not in mapping:
+            mapping[literal] = _match_pattern(literal)
+
+    for name, metadata in list(mapping.items()):
+        if "non-farm" in name:
+            mapping.setdefault(name.replace("non-farm", "nonfarm"), metadata)
+        elif "nonfarm" in name:
+            mapping.setdefault(name.replace("nonfarm", "non-farm"), metadata)
+
+    return MappingProxyType(
+        {sys.intern(name): _shared(metadata) for name, metadata in mapping.items()}
+    )
 
 
+EXACT_EVENT_MAPPING = _build_exact_mapping(_EXACT_EVENT_NAMES)
+
+
+def _index_by_type(
+    mapping: Mapping[str, EventMetadata],
+) -> dict[EventType, Mapping[str, EventMetadata]]:
+    """Split the exact mapping into one read-only subtable per event type.
+
+    Args:
+        mapping: Normalized event name to metadata.
+
+    Returns:
+        Read-only subtables keyed by event type.
+    """
+    by_type: dict[EventType, dict[str, EventMetadata]] = {}
+    for name, metadata in mapping.items():
+        by_type.setdefault(metadata.event_type, {})[name] = metadata
+    return {
+        event_type: MappingProxyType(names) for event_type, names in by_type.items()
+    }
+
+
+_MAPPING_BY_TYPE = _index_by_type(EXACT_EVENT_MAPPING)
+_EMPTY_MAPPING: Mapping[str, EventMetadata] = MappingProxyType({})
+
+
+def get_events_by_type(event_type: EventType) -> Mapping[str, EventMetadata]:
+    """Get the exact-mapping entries of one event type.
+
+    Subtables are built once at import, so filtering by type is a lookup
+    instead of a scan over EXACT_EVENT_MAPPING.
+
+    Args:
+        event_type: Event type to select.
+
+    Returns:
+        Read-only mapping of normalized event name to metadata; empty when
+        no known event has this type.
+    """
+    return _MAPPING_BY_TYPE.get(event_type, _EMPTY_MAPPING)
+
+
+# Distinct event names seen by the scraper; they repeat every week
+EVENT_METADATA_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=EVENT_METADATA_CACHE_SIZE)
 def get_event_metadata(event_name: str) -> EventMetadata:
     """Get metadata for an economic event.
 
+    Results are memoized per name, so a recurring event is normalized and
+    matched only once (use ``get_event_metadata.cache_clear()`` to reset).
+
     Uses a two-tier matching strategy:
     1. First, tries exact match in EXACT_EVENT_MAPPING
     2. If not found, tries regex pattern matching in EVENT_PATTERNS
@@ -524,16 +647,33 @@ def get_event_metadata(event_name: str) -> EventMetadata:
     Returns:
         EventMetadata with type, direction, and weight.
     """
-    normalized = _normalize_event_name(event_name)
+    # Normalize for matching: trimmed, lowercase
+    normalized = event_name.strip().lower()
 
     # Try exact match first
-    if normalized in EXACT_EVENT_MAPPING:
-        return EXACT_EVENT_MAPPING[normalized]
+    exact_match = EXACT_EVENT_MAPPING.get(normalized)
+    if exact_match is not None:
+        return exact_match
 
     # Try pattern matching
-    pattern_match = _match_pattern(event_name)
+    pattern_match = _match_pattern(normalized)
     if pattern_match is not None:
         return pattern_match
 
     # Default fallback
-    return EventMetadata(EventType.OTHER, +1, 1)
+    return DEFAULT_EVENT_METADATA
+
+
+def get_event_metadata_many(event_names: Iterable[str]) -> list[EventMetadata]:
+    """Get metadata for several economic events at once.
+
+    Each name goes through the memoized get_event_metadata, so a batch
+    pays for normalization and matching once per distinct name.
+
+    Args:
+        event_names: Names of the economic events.
+
+    Returns:
+        Metadata of each event, in input order.
+    """
+    return list(map(get_event_metadata, event_names))
@@ -8,30 +8,44 @@ during data fetching and scraping operations.
 class DataModuleError(Exception):
     """Base exception for all data module errors."""
 
+    __slots__ = ()
+
 
 class ScraperError(DataModuleError):
     """Base exception for scraper-related errors."""
 
+    __slots__ = ()
+
 
 class BrowserError(ScraperError):
     """Error related to browser/WebDriver operations."""
 
+    __slots__ = ()
+
 
 class BrowserInitializationError(BrowserError):
     """Failed to initialize the browser/WebDriver."""
 
+    __slots__ = ()
+
 
 class BrowserNavigationError(BrowserError):
     """Failed to navigate to the target URL."""
 
+    __slots__ = ()
+
 
 class PageLoadError(ScraperError):
     """Page failed to load within timeout."""
 
+    __slots__ = ()
+
 
 class ElementNotFoundError(ScraperError):
     """Expected element was not found on the page."""
 
+    __slots__ = ("selector", "_message")
+
     def __init__(self, selector: str, message: str | None = None):
         """Initialize with selector that failed to match.
 
@@ -40,25 +54,39 @@ class ElementNotFoundError(ScraperError):
             message: Optional custom error message.
         """
         self.selector = selector
-        default_message = f"Element not found: {selector}"
-        super().__init__(message or default_message)
+        self._message = message
+        super().__init__(message or selector)
+
+    def __str__(self) -> str:
+        """Return the custom message, or the default one built on demand."""
+        return self._message or f"Element not found: {self.selector}"
 
 
 class ParsingError(ScraperError):
     """Failed to parse data from the page."""
 
+    __slots__ = ()
+
 
 class RateLimitError(ScraperError):
     """Request was rate limited by the target server."""
 
+    __slots__ = ()
+
 
 class BlockedError(ScraperError):
     """Request was blocked (Cloudflare, CAPTCHA, etc.)."""
 
+    __slots__ = ()
+
 
 class InvalidDateError(DataModuleError):
     """Invalid date provided for calendar lookup."""
 
+    __slots__ = ()
+
 
 class ConfigurationError(DataModuleError):
     """Invalid or missing configuration."""
+
+    __slots__ = ()
@@ -4,9 +4,14 @@ This module defines the data structures used to represent
 economic events and calendar data.
 """
 
+import sys
+from collections.abc import Mapping
 from datetime import date
 from datetime import time as dt_time
 from enum import Enum
+from functools import cache, cached_property
+from itertools import chain
+from typing import Any, Self
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
@@ -23,6 +28,20 @@ class Impact(str, Enum):
     HOLIDAY = "holiday"
     UNKNOWN = "unknown"
 
+    @property
+    def marker(self) -> str:
+        """Short marker used when listing events (e.g. "!!!" for high)."""
+        return _IMPACT_MARKERS[self]
+
+
+_IMPACT_MARKERS = {
+    Impact.HIGH: "!!!",
+    Impact.MEDIUM: "!!",
+    Impact.LOW: "!",
+    Impact.HOLIDAY: "H",
+    Impact.UNKNOWN: "?",
+}
+
 
 class EventType(str, Enum):
     """Type/category of an economic event for fundamental scoring."""
@@ -38,13 +57,38 @@ class EventType(str, Enum):
     OTHER = "other"
 
 
+_SECONDS_PER_DAY = 86400
+
+
+def wall_clock_seconds(day: date, at: dt_time | None = None) -> float:
+    """Convert a date and optional time of day to seconds on a linear axis.
+
+    Seconds count from the proleptic Gregorian ordinal of ``day`` (see
+    date.toordinal), with all-day events at midnight and timezones ignored.
+    Differences between two values match naive datetime subtraction, without
+    building datetime objects.
+
+    Args:
+        day: Calendar date.
+        at: Optional time of day (None for midnight).
+
+    Returns:
+        Seconds on that axis (0001-01-01 00:00 is 86400).
+    """
+    seconds = day.toordinal() * _SECONDS_PER_DAY
+    if at is not None:
+        seconds += at.hour * 3600 + at.minute * 60 + at.second
+        return seconds + at.microsecond / 1_000_000
+    return float(seconds)
+
+
 class EconomicEvent(BaseModel):
     """Represents a single economic event from the calendar.
 
     Attributes:
         date: The date of the event.
         time: The time of the event (None if all day or tentative).
-        currency: The currency affected (e.g., USD, EUR).
+        currency: The currency affected (e.g., USD, EUR), uppercased.
         impact: The expected impact level of the event.
         event_name: The name/title of the event.
         actual: The actual reported value (None if not yet released).
@@ -91,6 +135,16 @@ class EconomicEvent(BaseModel):
             data["surprise"] = calculate_surprise(actual, forecast, direction)
         return data
 
+    @field_validator("currency")
+    @classmethod
+    def normalize_currency(cls, v: str) -> str:
+        """Uppercase and intern the currency code.
+
+        Codes are compared per event when filtering and scoring; normalizing
+        them once here lets those comparisons skip upper() on every event.
+        """
+        return sys.intern(v.upper())
+
     @field_validator("actual", "forecast", "previous", mode="before")
     @classmethod
     def normalize_economic_value(cls, v: str | float | None) -> float | None:
@@ -105,7 +159,46 @@ class EconomicEvent(BaseModel):
         return normalize_value(v)
 
 
-class CalendarDay(BaseModel):
+@cache
+def _cached_property_names(cls: type) -> tuple[str, ...]:
+    """Names of the cached properties defined on a class or its bases."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, cached_property)
+    )
+
+
+class _CachedPropertiesModel(BaseModel):
+    """Frozen model whose cached_property values derive from its fields.
+
+    model_copy copies the instance __dict__, cached values included, so a
+    copy with updated fields drops them to recompute them from its own.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the model, dropping cached values when fields are updated.
+
+        Args:
+            update: Values to change in the copy.
+            deep: Whether to make a deep copy.
+
+        Returns:
+            The copied model.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _cached_property_names(type(self)):
+                copied.__dict__.pop(name, None)
+        return copied
+
+
+class CalendarDay(_CachedPropertiesModel):
     """Represents all economic events for a single day.
 
     Attributes:
@@ -116,10 +209,10 @@ class CalendarDay(BaseModel):
     date: date
     events: list[EconomicEvent] = Field(default_factory=list)
 
-    @property
+    @cached_property
     def high_impact_events(self) -> list[EconomicEvent]:
-        """Return only high impact events for this day."""
-        return [e for e in self.events if e.impact == Impact.HIGH]
+        """Return only high impact events for this day (computed once)."""
+        return [e for e in self.events if e.impact is Impact.HIGH]
 
     @property
     def has_high_impact(self) -> bool:
@@ -127,9 +220,17 @@ class CalendarDay(BaseModel):
         return len(self.high_impact_events) > 0
 
 
-class CalendarMonth(BaseModel):
+# Impact levels compared by filter_by_impact; other impacts rank below LOW
+_IMPACT_ORDER = {Impact.LOW: 1, Impact.MEDIUM: 2, Impact.HIGH: 3}
+
+
+class CalendarMonth(_CachedPropertiesModel):
     """Represents the economic calendar for a full month.
 
+    The model is frozen, so the flattened event list and the currency and
+    impact indexes used by the filters are built once, on first use (and
+    again for a model_copy with updated days).
+
     Attributes:
         year: The year of the calendar month.
         month: The month (1-12).
@@ -140,18 +241,36 @@ class CalendarMonth(BaseModel):
     month: int = Field(..., ge=1, le=12)
     days: list[CalendarDay] = Field(default_factory=list)
 
-    @property
+    @cached_property
     def all_events(self) -> list[EconomicEvent]:
-        """Return all events across all days in the month."""
-        events = []
-        for day in self.days:
-            events.extend(day.events)
-        return events
+        """Return all events across all days in the month (computed once)."""
+        return list(chain.from_iterable(day.events for day in self.days))
 
-    @property
+    @cached_property
     def high_impact_events(self) -> list[EconomicEvent]:
-        """Return all high impact events in the month."""
-        return [e for e in self.all_events if e.impact == Impact.HIGH]
+        """Return all high impact events in the month (computed once)."""
+        return self._events_at(self._positions_by_impact.get(Impact.HIGH, []))
+
+    @cached_property
+    def _positions_by_currency(self) -> dict[str, list[int]]:
+        """Positions in all_events of each currency's events."""
+        positions: dict[str, list[int]] = {}
+        for position, event in enumerate(self.all_events):
+            positions.setdefault(event.currency, []).append(position)
+        return positions
+
+    @cached_property
+    def _positions_by_impact(self) -> dict[Impact, list[int]]:
+        """Positions in all_events of each impact level's events."""
+        positions: dict[Impact, list[int]] = {}
+        for position, event in enumerate(self.all_events):
+            positions.setdefault(event.impact, []).append(position)
+        return positions
+
+    def _events_at(self, positions: list[int]) -> list[EconomicEvent]:
+        """Return the events at the given positions of all_events."""
+        events = self.all_events
+        return [events[position] for position in positions]
 
     def filter_by_currency(self, currencies: list[str]) -> list[EconomicEvent]:
         """Filter events by currency codes.
@@ -160,10 +279,13 @@ class CalendarMonth(BaseModel):
             currencies: List of currency codes to filter by (e.g., ['USD', 'EUR']).
 
         Returns:
-            List of events matching the specified currencies.
+            List of events matching the specified currencies, in calendar order.
         """
-        currencies_upper = [c.upper() for c in currencies]
-        return [e for e in self.all_events if e.currency.upper() in currencies_upper]
+        index = self._positions_by_currency
+        positions = chain.from_iterable(
+            index.get(currency, ()) for currency in {c.upper() for c in currencies}
+        )
+        return self._events_at(sorted(positions))
 
     def filter_by_impact(self, min_impact: Impact) -> list[EconomicEvent]:
         """Filter events by minimum impact level.
@@ -172,10 +294,16 @@ class CalendarMonth(BaseModel):
             min_impact: Minimum impact level to include.
 
         Returns:
-            List of events at or above the specified impact level.
+            List of events at or above the specified impact level, in calendar
+            order.
         """
-        impact_order = {Impact.LOW: 1, Impact.MEDIUM: 2, Impact.HIGH: 3}
-        min_level = impact_order.get(min_impact, 0)
-        return [
-            e for e in self.all_events if impact_order.get(e.impact, 0) >= min_level
-        ]
+        min_level = _IMPACT_ORDER.get(min_impact, 0)
+        if min_level == 0:
+            return list(self.all_events)
+        index = self._positions_by_impact
+        positions = chain.from_iterable(
+            index.get(impact, ())
+            for impact, level in _IMPACT_ORDER.items()
+            if level >= min_level
+        )
+        return self._events_at(sorted(positions))
@@ -5,6 +5,7 @@ such as "223K" → 223000, "2.5%" → 0.025, etc.
 """
 
 import re
+from functools import lru_cache
 
 # Multipliers for unit suffixes (case-insensitive)
 UNIT_MULTIPLIERS = {
@@ -27,6 +28,9 @@ VALUE_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Distinct value strings seen by the scraper; calendars repeat them a lot
+VALUE_CACHE_SIZE = 4096
+
 
 def normalize_value(raw_value: str | None) -> float | None:
     """Normalize an economic value string to a float.
@@ -63,6 +67,22 @@ def normalize_value(raw_value: str | None) -> float | None:
     if not cleaned:
         return None
 
+    return _parse_value(cleaned)
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE)
+def _parse_value(cleaned: str) -> float | None:
+    """Parse a stripped, non-empty value string.
+
+    Results are memoized, so a repeated value such as "0.1%" is matched
+    only once (use ``_parse_value.cache_clear()`` to reset).
+
+    Args:
+        cleaned: The value string, already stripped.
+
+    Returns:
+        The normalized float value, or None if it cannot be parsed.
+    """
     # Try to match the pattern
     match = VALUE_PATTERN.match(cleaned)
     if not match:
@@ -4,9 +4,27 @@ This module contains web scraping implementations for various
 economic data sources.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from blackbox.data.scraper.base import BaseScraper
-from blackbox.data.scraper.browser import BrowserManager
-from blackbox.data.scraper.forex_factory import ForexFactoryScraper
+
+if TYPE_CHECKING:
+    from blackbox.data.scraper.browser import BrowserManager
+    from blackbox.data.scraper.forex_factory import ForexFactoryScraper
+
+
+def __getattr__(name: str) -> Any:
+    """Load browser-backed scrapers lazily, on first access."""
+    if name == "BrowserManager":
+        from blackbox.data.scraper.browser import BrowserManager
+
+        return BrowserManager
+    if name == "ForexFactoryScraper":
+        from blackbox.data.scraper.forex_factory import ForexFactoryScraper
+
+        return ForexFactoryScraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseScraper",
@@ -4,13 +4,11 @@ This module provides a wrapper around undetected-chromedriver
 with anti-detection features and human-like behavior simulation.
 """
 
+import queue
+import threading
 import time
-
-import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+import weakref
+from typing import TYPE_CHECKING
 
 from blackbox.core.logging import get_logger
 from blackbox.data.config import BrowserConfig, ScraperDelays, get_random_user_agent
@@ -20,8 +18,16 @@ from blackbox.data.exceptions import (
     ElementNotFoundError,
 )
 
+if TYPE_CHECKING:
+    import undetected_chromedriver as uc
+    from selenium.webdriver.remote.webelement import WebElement
+
 logger = get_logger("blackbox.scraper.browser")
 
+# Value of selenium's By.CSS_SELECTOR; Selenium is only imported once a
+# browser is actually driven
+CSS_SELECTOR = "css selector"
+
 
 class BrowserManager:
     """Manages browser lifecycle and provides anti-detection features.
@@ -46,7 +52,7 @@ class BrowserManager:
         self._driver: uc.Chrome | None = None
 
     @property
-    def driver(self) -> uc.Chrome:
+    def driver(self) -> "uc.Chrome":
         """Get or create the WebDriver instance.
 
         Returns:
@@ -59,7 +65,7 @@ class BrowserManager:
             self._driver = self._create_driver()
         return self._driver
 
-    def _create_driver(self) -> uc.Chrome:
+    def _create_driver(self) -> "uc.Chrome":
         """Create and configure the Chrome WebDriver.
 
         Returns:
@@ -69,6 +75,8 @@ class BrowserManager:
             BrowserInitializationError: If browser fails to initialize.
         """
         try:
+            import undetected_chromedriver as uc
+
             logger.info("Initializing Chrome browser...")
             logger.debug(f"Headless mode: {self.config.headless}")
 
@@ -146,9 +154,9 @@ class BrowserManager:
     def wait_for_element(
         self,
         selector: str,
-        by: By = By.CSS_SELECTOR,
+        by: str = CSS_SELECTOR,
         timeout: int = 10,
-    ) -> WebElement:
+    ) -> "WebElement":
         """Wait for an element to be present and visible.
 
         Args:
@@ -162,6 +170,9 @@ class BrowserManager:
         Raises:
             ElementNotFoundError: If element is not found within timeout.
         """
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
             wait = WebDriverWait(self.driver, timeout)
             element = wait.until(EC.presence_of_element_located((by, selector)))
@@ -172,8 +183,8 @@ class BrowserManager:
     def find_elements(
         self,
         selector: str,
-        by: By = By.CSS_SELECTOR,
-    ) -> list[WebElement]:
+        by: str = CSS_SELECTOR,
+    ) -> list["WebElement"]:
         """Find all elements matching the selector.
 
         Args:
@@ -203,6 +214,20 @@ class BrowserManager:
         delay = self.delays.get_pagination_delay()
         time.sleep(delay)
 
+    def is_alive(self) -> bool:
+        """Check whether the browser can still be driven.
+
+        Returns:
+            True if no driver was started yet or the started one responds.
+        """
+        if self._driver is None:
+            return True
+        try:
+            self._driver.current_url  # noqa: B018 - round trip to the driver
+        except Exception:
+            return False
+        return True
+
     def close(self) -> None:
         """Close the browser and clean up resources."""
         if self._driver is not None:
@@ -221,3 +246,139 @@ class BrowserManager:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit - ensure browser is closed."""
         self.close()
+
+
+def _close_idle(idle: "queue.LifoQueue[tuple[float, BrowserManager]]") -> None:
+    """Close every browser waiting in a pool's idle queue."""
+    while True:
+        try:
+            _, browser = idle.get_nowait()
+        except queue.Empty:
+            return
+        browser.close()
+
+
+def _evict_pool(pool_ref: "weakref.ref[BrowserPool]") -> None:
+    """Evict expired browsers of a pool, unless it was garbage collected."""
+    pool = pool_ref()
+    if pool is not None:
+        pool.evict_idle(from_timer=True)
+
+
+class BrowserPool:
+    """Keeps browsers open between scrapes so each one is launched once.
+
+    A scraper acquires a BrowserManager, drives it alone, then releases it.
+    Released browsers wait idle (at most ``max_idle`` of them) for the next
+    scrape instead of being closed, which spares a Chrome launch per scrape.
+    Each idle browser is a resident Chrome process, so browsers left idle for
+    ``config.idle_timeout`` seconds are closed by a background timer. The rest
+    are closed by shutdown, or when the pool is garbage collected or the
+    interpreter exits.
+    """
+
+    def __init__(
+        self,
+        config: BrowserConfig | None = None,
+        delays: ScraperDelays | None = None,
+        max_idle: int = 1,
+    ):
+        """Initialize the pool.
+
+        Args:
+            config: Browser configuration of the browsers created.
+            delays: Timing delay configuration of the browsers created.
+            max_idle: Maximum number of idle browsers kept open.
+        """
+        self.config = config or BrowserConfig()
+        self.delays = delays or ScraperDelays()
+        # Last in, first out, so the most recently used browser is reused.
+        # Entries are (release time, browser) for idle eviction.
+        self._idle: queue.LifoQueue[tuple[float, BrowserManager]] = queue.LifoQueue(
+            maxsize=max_idle
+        )
+        self._timer: threading.Timer | None = None
+        self._timer_lock = threading.Lock()
+        # Unlike an atexit handler, a finalizer does not keep the pool alive
+        weakref.finalize(self, _close_idle, self._idle)
+
+    def acquire(self) -> BrowserManager:
+        """Take an idle browser, or create one if none is usable.
+
+        Returns:
+            A BrowserManager for the caller's exclusive use until released.
+        """
+        while True:
+            try:
+                _, browser = self._idle.get_nowait()
+            except queue.Empty:
+                return BrowserManager(config=self.config, delays=self.delays)
+            if browser.is_alive():
+                return browser
+            logger.info("Discarding unresponsive pooled browser")
+            browser.close()
+
+    def release(self, browser: BrowserManager) -> None:
+        """Return a browser to the pool, closing it if the pool is full.
+
+        Args:
+            browser: A browser obtained from acquire.
+        """
+        try:
+            self._idle.put_nowait((time.monotonic(), browser))
+        except queue.Full:
+            browser.close()
+            return
+        self._schedule_eviction(self.config.idle_timeout)
+
+    def evict_idle(self, from_timer: bool = False) -> None:
+        """Close the browsers idle for longer than the idle timeout.
+
+        Args:
+            from_timer: Whether the call comes from the eviction timer, which
+                then lets a new timer be scheduled for the remaining browsers.
+        """
+        if from_timer:
+            with self._timer_lock:
+                self._timer = None
+        timeout = self.config.idle_timeout
+        if timeout <= 0:
+            return
+        cutoff = time.monotonic() - timeout
+        with self._idle.mutex:
+            entries = self._idle.queue
+            expired = [browser for released, browser in entries if released <= cutoff]
+            entries[:] = [entry for entry in entries if entry[0] > cutoff]
+            oldest = min((released for released, _ in entries), default=None)
+            self._idle.not_full.notify(len(expired))
+        for browser in expired:
+            logger.info(f"Closing browser idle for more than {timeout}s")
+            browser.close()
+        if oldest is not None:
+            self._schedule_eviction(oldest + timeout - time.monotonic())
+
+    def _schedule_eviction(self, delay: float) -> None:
+        """Start the eviction timer unless it is disabled or already running.
+
+        Args:
+            delay: Seconds before the timer fires.
+        """
+        if self.config.idle_timeout <= 0:
+            return
+        with self._timer_lock:
+            if self._timer is not None:
+                return
+            # The timer only holds a weak reference, so it never pins the pool
+            self._timer = threading.Timer(
+                max(delay, 0.0), _evict_pool, (weakref.ref(self),)
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def shutdown(self) -> None:
+        """Close all idle browsers."""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        _close_idle(self._idle)
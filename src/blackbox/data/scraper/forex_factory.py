@@ -16,8 +16,9 @@ from blackbox.data.config import ForexFactoryConfig
 from blackbox.data.event_mapping import get_event_metadata
 from blackbox.data.exceptions import ParsingError, ScraperError
 from blackbox.data.models import CalendarDay, CalendarMonth, EconomicEvent, Impact
+from blackbox.data.normalizer import normalize_value
 from blackbox.data.scraper.base import BaseScraper
-from blackbox.data.scraper.browser import BrowserManager
+from blackbox.data.scraper.browser import BrowserManager, BrowserPool
 
 logger = get_logger("blackbox.scraper.forex_factory")
 
@@ -45,13 +46,20 @@ class ForexFactoryScraper(BaseScraper):
     impact levels, and actual/forecast/previous values.
     """
 
-    def __init__(self, config: ForexFactoryConfig | None = None):
+    def __init__(
+        self,
+        config: ForexFactoryConfig | None = None,
+        browsers: BrowserPool | None = None,
+    ):
         """Initialize the Forex Factory scraper.
 
         Args:
             config: Scraper configuration (uses defaults if not provided).
+            browsers: Optional pool to borrow the browser from and return it
+                to on close, instead of launching and quitting one.
         """
         self.config = config or ForexFactoryConfig()
+        self._browsers = browsers
         self._browser: BrowserManager | None = None
 
     @property
@@ -62,10 +70,13 @@ class ForexFactoryScraper(BaseScraper):
             BrowserManager instance.
         """
         if self._browser is None:
-            self._browser = BrowserManager(
-                config=self.config.browser,
-                delays=self.config.delays,
-            )
+            if self._browsers is not None:
+                self._browser = self._browsers.acquire()
+            else:
+                self._browser = BrowserManager(
+                    config=self.config.browser,
+                    delays=self.config.delays,
+                )
         return self._browser
 
     def _build_day_url(self, target_date: date) -> str:
@@ -245,15 +256,17 @@ class ForexFactoryScraper(BaseScraper):
                 # Get event metadata for enrichment
                 metadata = get_event_metadata(event_name)
 
+                # Values are normalized here, so the model's validators only
+                # see floats and never parse the same string twice
                 event = EconomicEvent(
                     date=current_date,
                     time=current_time,
                     currency=currency,
                     impact=impact,
                     event_name=event_name,
-                    actual=actual_raw,
-                    forecast=forecast_raw,
-                    previous=previous_raw,
+                    actual=normalize_value(actual_raw),
+                    forecast=normalize_value(forecast_raw),
+                    previous=normalize_value(previous_raw),
                     actual_raw=actual_raw,
                     forecast_raw=forecast_raw,
                     previous_raw=previous_raw,
@@ -370,9 +383,7 @@ class ForexFactoryScraper(BaseScraper):
                 # Filter by currencies if specified
                 if currencies:
                     currencies_upper = [c.upper() for c in currencies]
-                    events = [
-                        e for e in events if e.currency.upper() in currencies_upper
-                    ]
+                    events = [e for e in events if e.currency in currencies_upper]
                     filtered_count = len(events)
                     logger.debug(
                         f"Filtered {events_count} -> {filtered_count} events (currencies: {currencies})"
@@ -430,7 +441,7 @@ class ForexFactoryScraper(BaseScraper):
                 if currencies:
                     currencies_upper = [c.upper() for c in currencies]
                     day_events = [
-                        e for e in day_events if e.currency.upper() in currencies_upper
+                        e for e in day_events if e.currency in currencies_upper
                     ]
 
                 events.extend(day_events)
@@ -444,7 +455,10 @@ class ForexFactoryScraper(BaseScraper):
         return events
 
     def close(self) -> None:
-        """Close the browser and clean up resources."""
+        """Close the browser (or return it to its pool) and clean up."""
         if self._browser is not None:
-            self._browser.close()
+            if self._browsers is not None:
+                self._browsers.release(self._browser)
+            else:
+                self._browser.close()
             self._browser = None
@@ -6,11 +6,15 @@ caching and data management.
 """
 
 import calendar as cal
+from collections.abc import Collection, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from typing import Any
 
 from blackbox.core.logging import get_logger
 from blackbox.data.config import ForexFactoryConfig
 from blackbox.data.models import EconomicEvent, Impact
+from blackbox.data.scraper.browser import BrowserPool
 from blackbox.data.scraper.forex_factory import ForexFactoryScraper
 from blackbox.data.storage.database import get_session
 from blackbox.data.storage.repository import EventRepository
@@ -18,6 +22,12 @@ from blackbox.data.storage.repository import EventRepository
 logger = get_logger("blackbox.services")
 
 
+def _month_bounds(year: int, month: int) -> tuple[date, date]:
+    """Get the first and last day of a month."""
+    _, last_day = cal.monthrange(year, month)
+    return date(year, month, 1), date(year, month, last_day)
+
+
 class CalendarService:
     """Service for managing economic calendar data with intelligent caching.
 
@@ -35,12 +45,22 @@ class CalendarService:
             config: Optional scraper configuration.
         """
         self.config = config or ForexFactoryConfig()
+        # Browsers are reused across scrapes, one kept per concurrent worker
+        self._browsers = BrowserPool(
+            self.config.browser,
+            self.config.delays,
+            max_idle=self.config.refresh_workers,
+        )
+
+    def close(self) -> None:
+        """Close the browsers kept open between scrapes."""
+        self._browsers.shutdown()
 
     def fetch_month(
         self,
         year: int,
         month: int,
-        currencies: list[str] | None = None,
+        currencies: Collection[str] | None = None,
         impact: str | None = None,
         force_refresh: bool = False,
     ) -> list[EconomicEvent]:
@@ -60,49 +80,129 @@ class CalendarService:
         Args:
             year: The year to fetch.
             month: The month to fetch (1-12).
-            currencies: Optional list of currencies to filter by.
+            currencies: Optional collection of currencies to filter by.
             impact: Optional minimum impact level.
             force_refresh: If True, ignore cache and scrape everything.
 
         Returns:
             List of EconomicEvent objects.
         """
-        _, last_day = cal.monthrange(year, month)
-        start_date = date(year, month, 1)
-        end_date = date(year, month, last_day)
+        start_date, end_date = _month_bounds(year, month)
 
         with get_session() as session:
             repo = EventRepository(session)
-
-            if force_refresh:
-                # Force refresh: scrape everything, overwrite existing
-                logger.info(f"Force refresh requested for {year}-{month:02d}")
-                self._scrape_and_store_month(year, month, repo, skip_existing=False)
-            else:
-                # Normal mode: scrape missing days, update days needing actual values
-                logger.info(f"Scraping missing days for {year}-{month:02d}...")
-                self._scrape_and_store_month(year, month, repo, skip_existing=True)
-
-                # Check for events needing updates (actual IS NULL for past/today)
-                dates_to_update = repo.get_events_needing_update(start_date, end_date)
-                if dates_to_update:
-                    logger.info(
-                        f"Updating {len(dates_to_update)} dates with missing actuals"
-                    )
-                    self._scrape_and_store_dates(dates_to_update, repo)
+            self._sync_month(year, month, repo, force_refresh)
 
             # Return filtered events from database
             return repo.get_events(start_date, end_date, currencies, impact)
 
+    def fetch_months(
+        self,
+        months: Sequence[tuple[int, int]],
+        currencies: Collection[str] | None = None,
+        impact: str | None = None,
+        force_refresh: bool = False,
+        max_concurrency: int | None = None,
+    ) -> list[EconomicEvent]:
+        """Fetch economic events for several months, syncing them in parallel.
+
+        Each month is synced as in fetch_month by its own thread, with its own
+        scraper and database session, so at most ``max_concurrency`` browsers
+        are open at once. Events are then read back in a single session.
+
+        Args:
+            months: (year, month) pairs to fetch, in output order.
+            currencies: Optional collection of currencies to filter by.
+            impact: Optional minimum impact level.
+            force_refresh: If True, ignore cache and scrape everything.
+            max_concurrency: Maximum number of months synced at once
+                (default: ``config.refresh_workers``).
+
+        Returns:
+            List of EconomicEvent objects, month by month.
+        """
+        if not months:
+            return []
+
+        limit = max_concurrency or self.config.refresh_workers
+        workers = max(1, min(limit, len(months)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results so a failing month raises here
+            list(
+                executor.map(
+                    lambda pair: self.sync_month(*pair, force_refresh=force_refresh),
+                    months,
+                )
+            )
+
+        events: list[EconomicEvent] = []
+        with get_session() as session:
+            repo = EventRepository(session)
+            for year, month in months:
+                start_date, end_date = _month_bounds(year, month)
+                events.extend(repo.get_events(start_date, end_date, currencies, impact))
+        return events
+
+    def sync_month(self, year: int, month: int, force_refresh: bool = False) -> None:
+        """Make sure a month is stored and up to date in the database.
+
+        Runs the scraping steps of fetch_month without reading the events
+        back, for callers that stream them with iter_month_records afterwards.
+
+        Args:
+            year: The year to sync.
+            month: The month to sync (1-12).
+            force_refresh: If True, scrape every day again.
+        """
+        with get_session() as session:
+            self._sync_month(year, month, EventRepository(session), force_refresh)
+
+    def iter_month_records(
+        self,
+        year: int,
+        month: int,
+        currencies: Collection[str] | None = None,
+        impact: str | None = None,
+        batch_size: int = 256,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream a month's stored events from the database in batches.
+
+        Events are yielded as plain dicts of their public fields (see
+        EventRepository.iter_event_records). No scraping happens here; call
+        sync_month first if needed. The database session stays open until
+        the iterator is exhausted or closed.
+
+        Args:
+            year: The year to read.
+            month: The month to read (1-12).
+            currencies: Optional collection of currencies to filter by.
+            impact: Optional minimum impact level.
+            batch_size: Number of events per yielded batch.
+
+        Yields:
+            Batches of event dicts, in date order.
+        """
+        start_date, end_date = _month_bounds(year, month)
+
+        with get_session() as session:
+            repo = EventRepository(session)
+            yield from repo.iter_event_records(
+                start_date, end_date, currencies, impact, batch_size
+            )
+
     def fetch_today(
         self,
-        currencies: list[str] | None = None,
+        currencies: Collection[str] | None = None,
         high_impact_only: bool = False,
     ) -> list[EconomicEvent]:
         """Fetch today's economic events with caching.
 
+        Filters are applied in the database query rather than on the
+        fetched events.
+
         Args:
-            currencies: Optional list of currencies to filter by.
+            currencies: Optional collection of currencies to filter by.
             high_impact_only: If True, only return high impact events.
 
         Returns:
@@ -114,25 +214,20 @@ class CalendarService:
             repo = EventRepository(session)
 
             # Check if we have data for today
-            events = repo.get_events_for_date(today)
-
-            if not events:
+            if not repo.has_events_for_date(today):
                 logger.info("No cached data for today, scraping...")
-                events = self._scrape_and_store_day(today, repo)
+                self._scrape_and_store_day(today, repo)
+                repo.refresh_stats()
 
-            # Apply filters
-            if currencies:
-                currencies_upper = [c.upper() for c in currencies]
-                events = [e for e in events if e.currency.upper() in currencies_upper]
-
-            if high_impact_only:
-                events = [e for e in events if e.impact == Impact.HIGH]
-
-            return events
+            impact = Impact.HIGH.value if high_impact_only else None
+            return repo.get_events(today, today, currencies, impact)
 
     def refresh_month(self, year: int, month: int) -> int:
         """Force refresh all events for a month.
 
+        Days are spread across ``config.refresh_workers`` scrapers running
+        in parallel threads, each with its own browser and database session.
+
         Args:
             year: The year to refresh.
             month: The month to refresh.
@@ -140,9 +235,17 @@ class CalendarService:
         Returns:
             Number of events upserted.
         """
+        _, num_days = cal.monthrange(year, month)
+        dates = [date(year, month, day) for day in range(1, num_days + 1)]
+        total_count = self._scrape_and_store_dates_parallel(dates)
+
         with get_session() as session:
-            repo = EventRepository(session)
-            return self._scrape_and_store_month(year, month, repo, return_count=True)
+            EventRepository(session).refresh_stats()
+
+        logger.info(
+            f"Completed {year}-{month:02d}: {total_count} events across {num_days} days"
+        )
+        return total_count
 
     def get_stats(self) -> dict:
         """Get statistics about stored events.
@@ -154,6 +257,48 @@ class CalendarService:
             repo = EventRepository(session)
             return repo.get_stats()
 
+    def _sync_month(
+        self,
+        year: int,
+        month: int,
+        repo: EventRepository,
+        force_refresh: bool,
+    ) -> None:
+        """Scrape the days of a month that are missing or need updates.
+
+        Args:
+            year: The year to sync.
+            month: The month to sync (1-12).
+            repo: Repository instance.
+            force_refresh: If True, scrape every day and overwrite existing data.
+        """
+        if force_refresh:
+            # Force refresh: scrape everything, overwrite existing
+            logger.info(f"Force refresh requested for {year}-{month:02d}")
+            self._scrape_and_store_month(year, month, repo, skip_existing=False)
+            repo.refresh_stats()
+            return
+
+        # Nothing to scrape: skip starting a browser
+        if repo.is_month_complete(year, month):
+            logger.debug(f"{year}-{month:02d} is complete in database")
+            return
+
+        # Normal mode: scrape missing days, update days needing actual values
+        logger.info(f"Scraping missing days for {year}-{month:02d}...")
+        scraped = self._scrape_and_store_month(year, month, repo, skip_existing=True)
+
+        # Check for events needing updates (actual IS NULL for past/today)
+        start_date, end_date = _month_bounds(year, month)
+        dates_to_update = repo.get_events_needing_update(start_date, end_date)
+        updated = 0
+        if dates_to_update:
+            logger.info(f"Updating {len(dates_to_update)} dates with missing actuals")
+            updated = self._scrape_and_store_dates(dates_to_update, repo)
+
+        if scraped or updated:
+            repo.refresh_stats()
+
     def _scrape_and_store_month(
         self,
         year: int,
@@ -172,7 +317,7 @@ class CalendarService:
             month: The month to scrape.
             repo: Repository instance.
             return_count: If True, return count instead of events.
-            skip_existing: If True, skip days that already have events in DB.
+            skip_existing: If True, skip days already scraped or with events in DB.
 
         Returns:
             List of events or count if return_count is True.
@@ -186,12 +331,13 @@ class CalendarService:
         if skip_existing:
             start_date = date(year, month, 1)
             end_date = date(year, month, num_days)
-            existing_events = repo.get_events(start_date, end_date)
-            dates_to_skip = {e.date for e in existing_events}
+            dates_to_skip = repo.get_scraped_dates(
+                start_date, end_date
+            ) | repo.get_dates_with_events(start_date, end_date)
             if dates_to_skip:
-                logger.info(f"Skipping {len(dates_to_skip)} days with existing data")
+                logger.info(f"Skipping {len(dates_to_skip)} days already scraped")
 
-        with ForexFactoryScraper(self.config) as scraper:
+        with ForexFactoryScraper(self.config, self._browsers) as scraper:
             for day in range(1, num_days + 1):
                 target_date = date(year, month, day)
                 progress = (day / num_days) * 100
@@ -210,7 +356,7 @@ class CalendarService:
                     events = scraper.fetch_day(target_date)
 
                     # Persist immediately and commit to make visible
-                    count = repo.upsert_events(events)
+                    count = repo.save_scraped_day(target_date, events)
                     repo.session.commit()
                     total_count += count
                     all_events.extend(events)
@@ -253,16 +399,73 @@ class CalendarService:
         """
         total_count = 0
 
-        with ForexFactoryScraper(self.config) as scraper:
+        with ForexFactoryScraper(self.config, self._browsers) as scraper:
             for target_date in dates:
                 events = scraper.fetch_day(target_date)
-                count = repo.upsert_events(events)
+                count = repo.save_scraped_day(target_date, events)
                 repo.session.commit()
                 total_count += count
                 logger.info(f"Upserted {count} events for {target_date}")
 
         return total_count
 
+    def _scrape_and_store_dates_parallel(self, dates: list[date]) -> int:
+        """Scrape dates with several scrapers in parallel and store them.
+
+        Dates are interleaved across workers so each browser still walks
+        its days in chronological order, with pagination delays in between.
+
+        Args:
+            dates: List of dates to scrape.
+
+        Returns:
+            Number of events upserted.
+        """
+        if not dates:
+            return 0
+
+        workers = max(1, min(self.config.refresh_workers, len(dates)))
+        batches = [dates[i::workers] for i in range(workers)]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(self._scrape_and_store_batch, batches))
+
+    def _scrape_and_store_batch(self, dates: list[date]) -> int:
+        """Scrape a batch of dates with a dedicated scraper and session.
+
+        Each day is persisted immediately; failed days are logged and
+        skipped so the rest of the batch still completes.
+
+        Args:
+            dates: Dates handled by this worker.
+
+        Returns:
+            Number of events upserted.
+        """
+        total_count = 0
+
+        with (
+            get_session() as session,
+            ForexFactoryScraper(self.config, self._browsers) as scraper,
+        ):
+            repo = EventRepository(session)
+            for index, target_date in enumerate(dates):
+                try:
+                    events = scraper.fetch_day(target_date)
+                    count = repo.save_scraped_day(target_date, events)
+                    session.commit()
+                    total_count += count
+                    logger.info(f"Persisted {count} events for {target_date}")
+
+                    if index < len(dates) - 1:
+                        scraper.browser.pagination_delay()
+
+                except Exception as e:
+                    session.rollback()
+                    logger.warning(f"Failed to scrape {target_date}: {e}")
+
+        return total_count
+
     def _scrape_and_store_day(
         self,
         target_date: date,
@@ -277,9 +480,9 @@ class CalendarService:
         Returns:
             List of scraped events.
         """
-        with ForexFactoryScraper(self.config) as scraper:
+        with ForexFactoryScraper(self.config, self._browsers) as scraper:
             events = scraper.fetch_day(target_date)
-            count = repo.upsert_events(events)
+            count = repo.save_scraped_day(target_date, events)
             repo.session.commit()
             logger.info(f"Upserted {count} events for {target_date}")
             return events
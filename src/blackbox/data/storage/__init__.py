@@ -4,14 +4,23 @@ This module provides database models, connection management,
 and repository patterns for storing economic calendar data.
 """
 
-from blackbox.data.storage.database import get_engine, get_session, init_db
+from blackbox.data.storage.database import (
+    get_async_engine,
+    get_async_session,
+    get_engine,
+    get_session,
+    init_db,
+)
 from blackbox.data.storage.models import Base, EconomicEventDB
-from blackbox.data.storage.repository import EventRepository
+from blackbox.data.storage.repository import AsyncEventRepository, EventRepository
 
 __all__ = [
+    "AsyncEventRepository",
     "Base",
     "EconomicEventDB",
     "EventRepository",
+    "get_async_engine",
+    "get_async_session",
     "get_engine",
     "get_session",
     "init_db",
@@ -0,0 +1,44 @@
+"""Add a composite index on impact and date.
+
+High-impact-only calendar queries filter on impact = 'high' within a
+date range; this index lets PostgreSQL answer them without scanning
+every event of the period.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-01-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    indexes = [index["name"] for index in inspector.get_indexes(table_name)]
+    return index_name in indexes
+
+
+def upgrade() -> None:
+    """Create the impact/date index."""
+    if not index_exists("economic_events", "idx_impact_date"):
+        op.create_index(
+            "idx_impact_date",
+            "economic_events",
+            ["impact", "date"],
+        )
+
+
+def downgrade() -> None:
+    """Drop the impact/date index."""
+    op.drop_index("idx_impact_date", table_name="economic_events")
@@ -0,0 +1,47 @@
+"""Add the event_stats materialized view.
+
+Pre-aggregates event counts and date bounds per currency and impact so
+calendar statistics no longer scan the whole economic_events table. The
+unique index allows REFRESH MATERIALIZED VIEW CONCURRENTLY.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-01-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create and populate the event_stats materialized view."""
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS event_stats AS
+        SELECT currency,
+               impact,
+               COUNT(*) AS event_count,
+               MIN(date) AS first_date,
+               MAX(date) AS last_date
+        FROM economic_events
+        GROUP BY currency, impact
+        """
+    )
+    op.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_event_stats_key
+        ON event_stats (currency, impact)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the event_stats materialized view."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS event_stats")
@@ -0,0 +1,44 @@
+"""Add a composite index on currency and date.
+
+Scoring reads the events of a few currencies within a lookback window;
+this index lets PostgreSQL answer currency IN (...) AND date BETWEEN ...
+from the index instead of intersecting the single-column ones.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-01-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    indexes = [index["name"] for index in inspector.get_indexes(table_name)]
+    return index_name in indexes
+
+
+def upgrade() -> None:
+    """Create the currency/date index."""
+    if not index_exists("economic_events", "idx_currency_date"):
+        op.create_index(
+            "idx_currency_date",
+            "economic_events",
+            ["currency", "date"],
+        )
+
+
+def downgrade() -> None:
+    """Drop the currency/date index."""
+    op.drop_index("idx_currency_date", table_name="economic_events")
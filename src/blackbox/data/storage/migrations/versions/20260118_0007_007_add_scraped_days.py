@@ -0,0 +1,44 @@
+"""Add the scraped_days table.
+
+Days without events (weekends, holidays) leave no trace in economic_events,
+so a month containing one never looked complete and was scraped again on
+every request. Scraped days are now recorded in their own table; days that
+already have events are backfilled as scraped.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-01-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create scraped_days and record the days that already have events."""
+    op.create_table(
+        "scraped_days",
+        sa.Column("date", sa.Date(), primary_key=True),
+        sa.Column(
+            "scraped_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.execute(
+        "INSERT INTO scraped_days (date) SELECT DISTINCT date FROM economic_events"
+    )
+
+
+def downgrade() -> None:
+    """Drop scraped_days table."""
+    op.drop_table("scraped_days")
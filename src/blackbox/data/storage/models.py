@@ -1,17 +1,21 @@
 """SQLAlchemy models for economic calendar persistence.
 
-This module defines the database schema for storing economic events.
+This module defines the database schema for storing economic events and
+the days they were scraped for.
 """
 
 from datetime import date, datetime, time
 
 from sqlalchemy import (
+    Column,
     Date,
     DateTime,
     Float,
     Index,
     Integer,
+    MetaData,
     String,
+    Table,
     Time,
     UniqueConstraint,
 )
@@ -69,7 +73,46 @@ class EconomicEventDB(Base):
     __table_args__ = (
         UniqueConstraint("date", "time", "currency", "event_name", name="uq_event"),
         Index("idx_needs_update", "date", "actual"),
+        Index("idx_impact_date", "impact", "date"),
+        Index("idx_currency_date", "currency", "date"),
     )
 
     def __repr__(self) -> str:
         return f"<EconomicEventDB(date={self.date}, currency={self.currency}, event_name={self.event_name})>"
+
+
+class ScrapedDayDB(Base):
+    """Database model for the days whose calendar page was scraped.
+
+    Days without any event (weekends, holidays) leave no row in
+    economic_events, so scraping is recorded here to tell them apart
+    from days never scraped.
+
+    Attributes:
+        date: The scraped date.
+        scraped_at: Timestamp when the day was last scraped.
+    """
+
+    __tablename__ = "scraped_days"
+
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    scraped_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<ScrapedDayDB(date={self.date}, scraped_at={self.scraped_at})>"
+
+
+# Per (currency, impact) aggregate of economic_events, created as a PostgreSQL
+# materialized view by migration 005. It lives outside Base.metadata so that
+# create_all never creates it as a plain table.
+event_stats = Table(
+    "event_stats",
+    MetaData(),
+    Column("currency", String(5)),
+    Column("impact", String(10)),
+    Column("event_count", Integer),
+    Column("first_date", Date),
+    Column("last_date", Date),
+)
@@ -4,15 +4,26 @@ This module provides a clean interface for CRUD operations
 on economic events in the database.
 """
 
-from collections.abc import Sequence
+import sys
+from collections.abc import Collection, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import date
+from typing import Any
 
-from sqlalchemy import and_, func, select
+import numpy as np
+from sqlalchemy import Select, and_, func, select, text
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from blackbox.data.models import EconomicEvent, EventType, Impact
-from blackbox.data.storage.models import EconomicEventDB
+from blackbox.data.models import (
+    EconomicEvent,
+    EventType,
+    Impact,
+    wall_clock_seconds,
+)
+from blackbox.data.scoring import calculate_surprise
+from blackbox.data.storage.models import EconomicEventDB, ScrapedDayDB, event_stats
 
 
 class EventRepository:
@@ -61,6 +72,9 @@ class EventRepository:
     def upsert_events(self, events: list[EconomicEvent]) -> int:
         """Insert or update events (ON CONFLICT).
 
+        All events are written with a single multi-row statement. Events
+        sharing the same date, time, currency and name are collapsed first.
+
         Args:
             events: List of EconomicEvent pydantic models to upsert.
 
@@ -70,8 +84,10 @@ class EventRepository:
         if not events:
             return 0
 
-        values = [
-            {
+        # Key rows on uq_event: PostgreSQL rejects an ON CONFLICT DO UPDATE
+        # batch that touches the same row twice, so the last duplicate wins.
+        rows = {
+            (e.date, e.time, e.currency, e.event_name): {
                 "date": e.date,
                 "time": e.time,
                 "currency": e.currency,
@@ -86,9 +102,9 @@ class EventRepository:
                 "surprise": e.surprise,
             }
             for e in events
-        ]
+        }
 
-        stmt = insert(EconomicEventDB).values(values)
+        stmt = insert(EconomicEventDB).values(list(rows.values()))
         stmt = stmt.on_conflict_do_update(
             constraint="uq_event",
             set_={
@@ -107,11 +123,47 @@ class EventRepository:
         result = self.session.execute(stmt)
         return result.rowcount
 
+    def save_scraped_day(self, target_date: date, events: list[EconomicEvent]) -> int:
+        """Store the events scraped for a day and record the day as scraped.
+
+        The day is recorded even without events, so empty days (weekends,
+        holidays) count as stored.
+
+        Args:
+            target_date: The scraped date.
+            events: Every event scraped for that date.
+
+        Returns:
+            Number of affected event rows.
+        """
+        count = self.upsert_events(events)
+        stmt = insert(ScrapedDayDB).values(date=target_date)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScrapedDayDB.date], set_={"scraped_at": func.now()}
+        )
+        self.session.execute(stmt)
+        return count
+
+    def get_scraped_dates(self, start_date: date, end_date: date) -> set[date]:
+        """Get the dates recorded as scraped, with or without events.
+
+        Args:
+            start_date: Start of the date range (inclusive).
+            end_date: End of the date range (inclusive).
+
+        Returns:
+            Set of scraped dates.
+        """
+        stmt = select(ScrapedDayDB.date).where(
+            and_(ScrapedDayDB.date >= start_date, ScrapedDayDB.date <= end_date)
+        )
+        return set(self.session.scalars(stmt))
+
     def get_events(
         self,
         start_date: date,
         end_date: date,
-        currencies: list[str] | None = None,
+        currencies: Collection[str] | None = None,
         impact: str | None = None,
     ) -> list[EconomicEvent]:
         """Retrieve events with optional filters.
@@ -119,35 +171,71 @@ class EventRepository:
         Args:
             start_date: Start of the date range (inclusive).
             end_date: End of the date range (inclusive).
-            currencies: Optional list of currency codes to filter by.
+            currencies: Optional collection of currency codes to filter by.
             impact: Optional minimum impact level to filter by.
 
         Returns:
             List of EconomicEvent pydantic models.
         """
-        stmt = select(EconomicEventDB).where(
-            and_(
-                EconomicEventDB.date >= start_date,
-                EconomicEventDB.date <= end_date,
-            )
-        )
+        stmt = _build_events_query(start_date, end_date, currencies, impact)
+        result = self.session.execute(stmt)
+        rows: Sequence[EconomicEventDB] = result.scalars().all()
 
-        if currencies:
-            currencies_upper = [c.upper() for c in currencies]
-            stmt = stmt.where(EconomicEventDB.currency.in_(currencies_upper))
+        return [_to_pydantic(row) for row in rows]
 
-        if impact:
-            impact_order = {"low": 1, "medium": 2, "high": 3}
-            min_level = impact_order.get(impact.lower(), 0)
-            if min_level > 0:
-                impact_values = [k for k, v in impact_order.items() if v >= min_level]
-                stmt = stmt.where(EconomicEventDB.impact.in_(impact_values))
+    def iter_event_records(
+        self,
+        start_date: date,
+        end_date: date,
+        currencies: Collection[str] | None = None,
+        impact: str | None = None,
+        batch_size: int = 256,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream events as plain dicts of their public fields, in batches.
 
-        stmt = stmt.order_by(EconomicEventDB.date, EconomicEventDB.time)
-        result = self.session.execute(stmt)
-        rows: Sequence[EconomicEventDB] = result.scalars().all()
+        Only the EVENT_RECORD_FIELDS columns are selected and rows are
+        returned as mappings, skipping ORM and Pydantic model construction.
+        Values are native date, time, str and float objects, ready for JSON
+        encoding.
 
-        return [self._to_pydantic(row) for row in rows]
+        Args:
+            start_date: Start of the date range (inclusive).
+            end_date: End of the date range (inclusive).
+            currencies: Optional collection of currency codes to filter by.
+            impact: Optional minimum impact level to filter by.
+            batch_size: Number of rows fetched per round trip.
+
+        Yields:
+            Non-empty lists of at most batch_size event dicts.
+        """
+        stmt = _build_events_query(
+            start_date, end_date, currencies, impact, columns=_EVENT_RECORD_COLUMNS
+        )
+        result = self.session.execute(stmt.execution_options(yield_per=batch_size))
+        for rows in result.mappings().partitions():
+            yield [dict(row) for row in rows]
+
+    def count_events(self, start_date: date, end_date: date) -> int:
+        """Count the events stored within a date range.
+
+        Args:
+            start_date: Start of the date range (inclusive).
+            end_date: End of the date range (inclusive).
+
+        Returns:
+            Number of events.
+        """
+        stmt = (
+            select(func.count())
+            .select_from(EconomicEventDB)
+            .where(
+                and_(
+                    EconomicEventDB.date >= start_date,
+                    EconomicEventDB.date <= end_date,
+                )
+            )
+        )
+        return self.session.execute(stmt).scalar_one()
 
     def get_events_for_date(self, event_date: date) -> list[EconomicEvent]:
         """Retrieve all events for a specific date.
@@ -160,6 +248,18 @@ class EventRepository:
         """
         return self.get_events(event_date, event_date)
 
+    def has_events_for_date(self, event_date: date) -> bool:
+        """Check if any event exists for a given date.
+
+        Args:
+            event_date: The date to check.
+
+        Returns:
+            True if events exist, False otherwise.
+        """
+        stmt = select(EconomicEventDB.id).where(EconomicEventDB.date == event_date)
+        return self.session.execute(stmt.limit(1)).first() is not None
+
     def has_events_for_month(self, year: int, month: int) -> bool:
         """Check if events exist for a given month.
 
@@ -190,55 +290,144 @@ class EventRepository:
         count = result.scalar()
         return count > 0 if count else False
 
+    def get_dates_with_events(self, start_date: date, end_date: date) -> set[date]:
+        """Get the distinct dates that have at least one stored event.
+
+        Args:
+            start_date: Start of the date range (inclusive).
+            end_date: End of the date range (inclusive).
+
+        Returns:
+            Set of dates with events.
+        """
+        stmt = (
+            select(EconomicEventDB.date)
+            .where(
+                and_(
+                    EconomicEventDB.date >= start_date,
+                    EconomicEventDB.date <= end_date,
+                )
+            )
+            .distinct()
+        )
+        return set(self.session.scalars(stmt))
+
+    def get_date_range(self) -> tuple[date | None, date | None]:
+        """Get the earliest and latest stored event dates.
+
+        Reads the events table directly (two index lookups), so the range is
+        always current, unlike the materialized statistics.
+
+        Returns:
+            (earliest_date, latest_date), or (None, None) if there are no events.
+        """
+        stmt = select(func.min(EconomicEventDB.date), func.max(EconomicEventDB.date))
+        first_date, last_date = self.session.execute(stmt).one()
+        return first_date, last_date
+
+    def is_month_complete(self, year: int, month: int) -> bool:
+        """Check if a month is fully stored and needs no scraping.
+
+        A month is complete when every day was scraped (see
+        save_scraped_day), even days without events, and no event from
+        today onwards is still waiting for its actual value.
+
+        Args:
+            year: The year to check.
+            month: The month to check.
+
+        Returns:
+            True if the month can be served from the database as-is.
+        """
+        from calendar import monthrange
+
+        _, last_day = monthrange(year, month)
+        start_date = date(year, month, 1)
+        end_date = date(year, month, last_day)
+
+        if len(self.get_scraped_dates(start_date, end_date)) < last_day:
+            return False
+        return not self.get_events_needing_update(start_date, end_date)
+
     def get_stats(self) -> dict:
         """Get statistics about stored events.
 
+        When the database has the event_stats materialized view (PostgreSQL
+        after migration 005), the statistics are read from it (one row per
+        currency and impact), so they reflect the last refresh_stats call.
+        Otherwise the events table is aggregated directly.
+
         Returns:
             Dictionary with statistics:
             - total_events: Total number of events
-            - by_currency: Count per currency
-            - by_impact: Count per impact level
+            - by_currency: Count per currency, largest first
+            - by_impact: Count per impact level, largest first
             - date_range: (earliest_date, latest_date)
         """
-        # Total count
-        total_stmt = select(func.count()).select_from(EconomicEventDB)
-        total = self.session.execute(total_stmt).scalar() or 0
-
-        # Count by currency
-        currency_stmt = select(EconomicEventDB.currency, func.count()).group_by(
-            EconomicEventDB.currency
-        )
-        currency_result = self.session.execute(currency_stmt)
-        by_currency = {row[0]: row[1] for row in currency_result}
-
-        # Count by impact
-        impact_stmt = select(EconomicEventDB.impact, func.count()).group_by(
-            EconomicEventDB.impact
-        )
-        impact_result = self.session.execute(impact_stmt)
-        by_impact = {row[0]: row[1] for row in impact_result}
-
-        # Date range
-        date_range_stmt = select(
-            func.min(EconomicEventDB.date), func.max(EconomicEventDB.date)
-        )
-        date_range_result = self.session.execute(date_range_stmt).first()
-        date_range = (
-            (date_range_result[0], date_range_result[1])
-            if date_range_result and date_range_result[0]
-            else (None, None)
-        )
+        if self._has_stats_view():
+            stmt = select(
+                event_stats.c.currency,
+                event_stats.c.impact,
+                event_stats.c.event_count,
+                event_stats.c.first_date,
+                event_stats.c.last_date,
+            )
+        else:
+            stmt = _stats_query()
+
+        total = 0
+        by_currency: dict[str, int] = {}
+        by_impact: dict[str, int] = {}
+        first_date: date | None = None
+        last_date: date | None = None
+
+        for currency, impact, count, group_first, group_last in self.session.execute(
+            stmt
+        ):
+            total += count
+            by_currency[currency] = by_currency.get(currency, 0) + count
+            by_impact[impact] = by_impact.get(impact, 0) + count
+            if first_date is None or group_first < first_date:
+                first_date = group_first
+            if last_date is None or group_last > last_date:
+                last_date = group_last
 
         return {
             "total_events": total,
-            "by_currency": by_currency,
-            "by_impact": by_impact,
-            "date_range": date_range,
+            "by_currency": _by_count_desc(by_currency),
+            "by_impact": _by_count_desc(by_impact),
+            "date_range": (first_date, last_date),
         }
 
+    def refresh_stats(self) -> None:
+        """Recompute the event_stats materialized view.
+
+        Uses REFRESH ... CONCURRENTLY so readers keep seeing the previous
+        statistics meanwhile. Does nothing on databases without the view.
+        """
+        if self._has_stats_view():
+            self.session.execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY event_stats")
+            )
+
+    def _has_stats_view(self) -> bool:
+        """Check whether the session's database provides event_stats.
+
+        The view only exists on PostgreSQL databases migrated past revision
+        005; tables created with Base.metadata.create_all do not have it.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return False
+        return (
+            self.session.execute(text("SELECT to_regclass('event_stats')")).scalar()
+            is not None
+        )
+
     def delete_events_for_month(self, year: int, month: int) -> int:
         """Delete all events for a given month.
 
+        The month's days are also no longer recorded as scraped.
+
         Args:
             year: The year.
             month: The month.
@@ -254,6 +443,11 @@ class EventRepository:
         start_date = date(year, month, 1)
         end_date = date(year, month, last_day)
 
+        self.session.execute(
+            delete(ScrapedDayDB).where(
+                and_(ScrapedDayDB.date >= start_date, ScrapedDayDB.date <= end_date)
+            )
+        )
         stmt = delete(EconomicEventDB).where(
             and_(
                 EconomicEventDB.date >= start_date,
@@ -272,17 +466,268 @@ class EventRepository:
         Returns:
             EconomicEvent Pydantic model.
         """
-        return EconomicEvent(
-            date=db_event.date,
-            time=db_event.time,
-            currency=db_event.currency,
-            impact=Impact(db_event.impact),
-            event_name=db_event.event_name,
-            actual=db_event.actual,
-            forecast=db_event.forecast,
-            previous=db_event.previous,
-            event_type=EventType(db_event.event_type),
-            direction=db_event.direction,
-            weight=db_event.weight,
-            surprise=db_event.surprise,
+        return _to_pydantic(db_event)
+
+
+class AsyncEventRepository:
+    """Async repository for reading economic events.
+
+    Mirrors the read API of EventRepository on top of an AsyncSession,
+    for callers running inside an event loop (e.g. the API).
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize the repository with an async database session.
+
+        Args:
+            session: SQLAlchemy AsyncSession instance.
+        """
+        self.session = session
+
+    async def get_events(
+        self,
+        start_date: date,
+        end_date: date,
+        currencies: Collection[str] | None = None,
+        impact: str | None = None,
+    ) -> list[EconomicEvent]:
+        """Retrieve events with optional filters.
+
+        Args:
+            start_date: Start of the date range (inclusive).
+            end_date: End of the date range (inclusive).
+            currencies: Optional collection of currency codes to filter by.
+            impact: Optional minimum impact level to filter by.
+
+        Returns:
+            List of EconomicEvent pydantic models.
+        """
+        stmt = _build_events_query(start_date, end_date, currencies, impact)
+        result = await self.session.execute(stmt)
+        rows: Sequence[EconomicEventDB] = result.scalars().all()
+
+        return [_to_pydantic(row) for row in rows]
+
+    async def get_event_arrays(
+        self,
+        start_date: date,
+        end_date: date,
+        currencies: Collection[str] | None = None,
+    ) -> "EventArrays":
+        """Retrieve the scoring inputs of several currencies in a single query.
+
+        Only the columns needed for scoring are selected, and rows go straight
+        into NumPy arrays without building EconomicEvent models.
+
+        Args:
+            start_date: Start of the date range (inclusive).
+            end_date: End of the date range (inclusive).
+            currencies: Currency codes to fetch (default: all currencies).
+
+        Returns:
+            EventArrays of the events with a surprise score.
+        """
+        stmt = _build_events_query(
+            start_date, end_date, currencies, columns=_EVENT_ARRAY_COLUMNS
+        )
+        result = await self.session.execute(stmt)
+        return EventArrays.from_rows(result.all())
+
+
+@dataclass(frozen=True)
+class EventArrays:
+    """Scoring inputs of a set of events, as parallel NumPy arrays.
+
+    Surprise and weight are stored in the narrowest types that hold them
+    (float32 and int8, weights being 1-10), which halves the memory of
+    cached windows; scores are still accumulated in float64.
+
+    Attributes:
+        seconds: Event times as wall_clock_seconds (all-day events at
+            midnight, timezones ignored).
+        surprise: Surprise scores (float32).
+        weight: Importance weights (int8).
+        currency_id: Index of each event's currency in ``currency_ids``.
+        currency_ids: Mapping of uppercase currency code to its index.
+    """
+
+    seconds: np.ndarray
+    surprise: np.ndarray
+    weight: np.ndarray
+    currency_id: np.ndarray
+    currency_ids: dict[str, int]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> "EventArrays":
+        """Build the arrays from rows of _EVENT_ARRAY_COLUMNS.
+
+        Rows without a stored surprise get it computed from actual and
+        forecast, as EconomicEvent does; rows with no surprise are dropped.
+
+        Args:
+            rows: (date, time, currency, weight, surprise, actual, forecast,
+                direction) rows.
+
+        Returns:
+            EventArrays of the rows with a surprise score.
+        """
+        currency_ids: dict[str, int] = {}
+        # Stored codes as read, so each distinct spelling is uppercased once
+        raw_currency_ids: dict[str, int] = {}
+        seconds: list[float] = []
+        surprises: list[float] = []
+        weights: list[int] = []
+        ids: list[int] = []
+
+        for day, at, currency, weight, surprise, actual, forecast, direction in rows:
+            if surprise is None:
+                surprise = calculate_surprise(actual, forecast, direction)
+                if surprise is None:
+                    continue
+            seconds.append(wall_clock_seconds(day, at))
+            surprises.append(surprise)
+            weights.append(weight)
+            currency_id = raw_currency_ids.get(currency)
+            if currency_id is None:
+                currency_id = currency_ids.setdefault(
+                    currency.upper(), len(currency_ids)
+                )
+                raw_currency_ids[currency] = currency_id
+            ids.append(currency_id)
+
+        return cls(
+            seconds=np.array(seconds, dtype=np.float64),
+            surprise=np.array(surprises, dtype=np.float32),
+            weight=np.array(weights, dtype=np.int8),
+            currency_id=np.array(ids, dtype=np.int32),
+            currency_ids=currency_ids,
+        )
+
+
+# Event fields exposed by the API, selected as plain columns for record queries
+EVENT_RECORD_FIELDS = (
+    "date",
+    "time",
+    "currency",
+    "impact",
+    "event_name",
+    "actual",
+    "forecast",
+    "previous",
+)
+_EVENT_RECORD_COLUMNS = tuple(
+    getattr(EconomicEventDB, field) for field in EVENT_RECORD_FIELDS
+)
+
+# Columns read by AsyncEventRepository.get_event_arrays, in EventArrays.from_rows
+# unpacking order
+_EVENT_ARRAY_COLUMNS = (
+    EconomicEventDB.date,
+    EconomicEventDB.time,
+    EconomicEventDB.currency,
+    EconomicEventDB.weight,
+    EconomicEventDB.surprise,
+    EconomicEventDB.actual,
+    EconomicEventDB.forecast,
+    EconomicEventDB.direction,
+)
+
+
+def _build_events_query(
+    start_date: date,
+    end_date: date,
+    currencies: Collection[str] | None = None,
+    impact: str | None = None,
+    columns: Sequence[Any] | None = None,
+) -> Select:
+    """Build the filtered, ordered events query shared by both repositories.
+
+    Args:
+        start_date: Start of the date range (inclusive).
+        end_date: End of the date range (inclusive).
+        currencies: Optional collection of currency codes to filter by.
+        impact: Optional minimum impact level to filter by.
+        columns: Optional columns to select instead of whole entities.
+
+    Returns:
+        SQLAlchemy select statement over EconomicEventDB.
+    """
+    stmt = (select(*columns) if columns else select(EconomicEventDB)).where(
+        and_(
+            EconomicEventDB.date >= start_date,
+            EconomicEventDB.date <= end_date,
+        )
+    )
+
+    if currencies:
+        currencies_upper = [c.upper() for c in currencies]
+        stmt = stmt.where(EconomicEventDB.currency.in_(currencies_upper))
+
+    if impact:
+        impact_order = {"low": 1, "medium": 2, "high": 3}
+        min_level = impact_order.get(impact.lower(), 0)
+        if min_level > 0:
+            impact_values = [k for k, v in impact_order.items() if v >= min_level]
+            # A single level is an equality, which uses idx_impact_date
+            if len(impact_values) == 1:
+                stmt = stmt.where(EconomicEventDB.impact == impact_values[0])
+            else:
+                stmt = stmt.where(EconomicEventDB.impact.in_(impact_values))
+
+    return stmt.order_by(EconomicEventDB.date, EconomicEventDB.time)
+
+
+def _stats_query() -> Select:
+    """Build the per (currency, impact) aggregate backing event_stats.
+
+    Returns:
+        SQLAlchemy select of currency, impact, event_count, first_date and
+        last_date over EconomicEventDB.
+    """
+    return select(
+        EconomicEventDB.currency,
+        EconomicEventDB.impact,
+        func.count().label("event_count"),
+        func.min(EconomicEventDB.date).label("first_date"),
+        func.max(EconomicEventDB.date).label("last_date"),
+    ).group_by(EconomicEventDB.currency, EconomicEventDB.impact)
+
+
+def _by_count_desc(counts: dict[str, int]) -> dict[str, int]:
+    """Order a count mapping by descending count, then by key."""
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+def _to_pydantic(db_event: EconomicEventDB) -> EconomicEvent:
+    """Convert a database model to a Pydantic model.
+
+    Stored rows were validated when saved, so the model is built with
+    model_construct, skipping per-field validation. The two derived fields
+    the validators would fill are set here: the currency is uppercased and
+    interned, and a missing surprise is computed from actual and forecast.
+
+    Args:
+        db_event: Database event instance.
+
+    Returns:
+        EconomicEvent Pydantic model.
+    """
+    surprise = db_event.surprise
+    if surprise is None:
+        surprise = calculate_surprise(
+            db_event.actual, db_event.forecast, db_event.direction
         )
+    return EconomicEvent.model_construct(
+        date=db_event.date,
+        time=db_event.time,
+        currency=sys.intern(db_event.currency.upper()),
+        impact=Impact(db_event.impact),
+        event_name=db_event.event_name,
+        actual=db_event.actual,
+        forecast=db_event.forecast,
+        previous=db_event.previous,
+        event_type=EventType(db_event.event_type),
+        direction=db_event.direction,
+        weight=db_event.weight,
+        surprise=surprise,
+    )
@@ -1,10 +1,14 @@
 """Tests for API endpoints."""
 
-from unittest.mock import MagicMock, patch
+from datetime import date, datetime, time
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 from blackbox import __version__
+from blackbox.api import main as api_main
+from blackbox.data.exceptions import ScraperError
 
 
 def test_root_endpoint(api_client: TestClient):
@@ -61,6 +65,17 @@ def test_stop_strategy(api_client: TestClient):
     assert "test_strategy" in data["message"]
 
 
+def test_shutdown_closes_calendar_browsers():
+    """Test that the lifespan closes the calendar service's browsers."""
+    with (
+        patch.object(api_main._calendar_service, "close") as mock_close,
+        TestClient(api_main.app),
+    ):
+        mock_close.assert_not_called()
+
+    mock_close.assert_called_once()
+
+
 def test_openapi_docs(api_client: TestClient):
     """Test that OpenAPI docs are available."""
     response = api_client.get("/docs")
@@ -73,19 +88,258 @@ def test_redoc_docs(api_client: TestClient):
     assert response.status_code == 200
 
 
+# Calendar API tests
+class TestCalendarAPI:
+    """Tests for calendar API endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def clear_month_cache(self):
+        """Start each test with an empty month response cache."""
+        api_main._month_cache.clear()
+        yield
+        api_main._month_cache.clear()
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_get_calendar_month(self, mock_service: MagicMock, api_client: TestClient):
+        """Test month endpoint serializes events with ISO dates and times."""
+        mock_service.iter_month_records.return_value = [
+            [
+                {
+                    "date": date(2026, 1, 15),
+                    "time": time(8, 30),
+                    "currency": "USD",
+                    "impact": "high",
+                    "event_name": "Non-Farm Employment Change",
+                    "actual": 223000.0,
+                    "forecast": 215000.0,
+                    "previous": None,
+                },
+            ],
+            [
+                {
+                    "date": date(2026, 1, 16),
+                    "time": None,
+                    "currency": "JPY",
+                    "impact": "holiday",
+                    "event_name": "Bank Holiday",
+                    "actual": None,
+                    "forecast": None,
+                    "previous": None,
+                },
+            ],
+        ]
+
+        response = api_client.get("/api/v1/calendar/month?year=2026&month=1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["year"] == 2026
+        assert data["month"] == 1
+        assert data["total_events"] == 2
+        assert data["events"][0] == {
+            "date": "2026-01-15",
+            "time": "08:30:00",
+            "currency": "USD",
+            "impact": "high",
+            "event_name": "Non-Farm Employment Change",
+            "actual": 223000.0,
+            "forecast": 215000.0,
+            "previous": None,
+        }
+        assert data["events"][1]["time"] is None
+        mock_service.sync_month.assert_called_once_with(2026, 1, False)
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_get_calendar_month_empty(
+        self, mock_service: MagicMock, api_client: TestClient
+    ):
+        """Test month endpoint returns valid JSON when no events match."""
+        mock_service.iter_month_records.return_value = []
+
+        response = api_client.get("/api/v1/calendar/month?year=2026&month=1")
+
+        assert response.json() == {
+            "year": 2026,
+            "month": 1,
+            "events": [],
+            "total_events": 0,
+        }
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_get_calendar_month_currency_filter(
+        self, mock_service: MagicMock, api_client: TestClient
+    ):
+        """Test the currency filter is normalized before reaching the service."""
+        mock_service.iter_month_records.return_value = []
+
+        api_client.get("/api/v1/calendar/month?year=2026&month=1&currencies=usd, EUR")
+
+        currencies = mock_service.iter_month_records.call_args.args[2]
+        assert currencies == frozenset({"USD", "EUR"})
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_get_calendar_month_scraper_error(
+        self, mock_service: MagicMock, api_client: TestClient
+    ):
+        """Test scraping failures are reported before streaming starts."""
+        mock_service.sync_month.side_effect = ScraperError("blocked")
+
+        response = api_client.get("/api/v1/calendar/month?year=2026&month=1")
+
+        assert response.status_code == 503
+        mock_service.iter_month_records.assert_not_called()
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_get_calendar_month_cached(
+        self, mock_service: MagicMock, api_client: TestClient
+    ):
+        """Test identical month queries are served from the response cache."""
+        mock_service.iter_month_records.return_value = []
+
+        first = api_client.get("/api/v1/calendar/month?year=2026&month=1")
+        second = api_client.get("/api/v1/calendar/month?year=2026&month=1")
+        forced = api_client.get(
+            "/api/v1/calendar/month?year=2026&month=1&force_refresh=true"
+        )
+
+        assert first.json() == second.json() == forced.json()
+        assert mock_service.iter_month_records.call_count == 2
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_get_calendar_month_large_body_not_cached(
+        self, mock_service: MagicMock, api_client: TestClient
+    ):
+        """Test responses above the size limit are streamed but not cached."""
+        mock_service.iter_month_records.return_value = []
+
+        with patch.object(api_main, "MONTH_CACHE_MAX_BODY_BYTES", 10):
+            api_client.get("/api/v1/calendar/month?year=2026&month=1")
+            api_client.get("/api/v1/calendar/month?year=2026&month=1")
+
+        assert mock_service.iter_month_records.call_count == 2
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_refresh_invalidates_month_cache(
+        self, mock_service: MagicMock, api_client: TestClient
+    ):
+        """Test a completed refresh drops cached responses for that month."""
+        mock_service.iter_month_records.return_value = []
+        mock_service.refresh_month.return_value = 0
+
+        api_client.get("/api/v1/calendar/month?year=2026&month=1")
+        api_client.post("/api/v1/calendar/refresh?year=2026&month=1")
+        api_client.get("/api/v1/calendar/month?year=2026&month=1")
+
+        assert mock_service.iter_month_records.call_count == 2
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_force_refresh_invalidates_other_filters(
+        self, mock_service: MagicMock, api_client: TestClient
+    ):
+        """Test force_refresh drops cached responses of the month for any filter."""
+        mock_service.iter_month_records.return_value = []
+
+        api_client.get("/api/v1/calendar/month?year=2026&month=1&currencies=USD")
+        api_client.get("/api/v1/calendar/month?year=2026&month=1&force_refresh=true")
+        api_client.get("/api/v1/calendar/month?year=2026&month=1&currencies=USD")
+
+        assert mock_service.iter_month_records.call_count == 3
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_invalidation_during_stream_skips_cache(
+        self, mock_service: MagicMock, api_client: TestClient
+    ):
+        """Test a body streamed across an invalidation of its month is not cached."""
+
+        def records(*_args):
+            api_main._invalidate_month_cache(2026, 1)
+            yield []
+
+        mock_service.iter_month_records.side_effect = records
+
+        response = api_client.get("/api/v1/calendar/month?year=2026&month=1")
+
+        assert response.status_code == 200
+        assert not api_main._month_cache
+
+    @patch("blackbox.api.main._calendar_service")
+    def test_get_calendar_today(self, mock_service: MagicMock, api_client: TestClient):
+        """Test today endpoint returns today's date and event count."""
+        mock_service.fetch_today.return_value = []
+
+        response = api_client.get("/api/v1/calendar/today")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["date"] == date.today().isoformat()
+        assert data["total_events"] == 0
+        assert data["events"] == []
+
+
 # Scoring API tests
+def _mock_empty_async_session(mock_get_async_session: MagicMock) -> None:
+    """Make the patched async session factory yield a session with no events."""
+    mock_session = MagicMock()
+    result = MagicMock()
+    result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=result)
+    mock_get_async_session.return_value.__aenter__.return_value = mock_session
+
+
 class TestScoringAPI:
     """Tests for scoring API endpoints."""
 
-    @patch("blackbox.api.main.get_session")
+    @pytest.fixture(autouse=True)
+    def clear_score_cache(self):
+        """Start each test with empty score and event caches."""
+        api_main._score_cache.clear()
+        api_main._reset_event_cache()
+        yield
+        api_main._score_cache.clear()
+        api_main._reset_event_cache()
+
+    @patch("blackbox.api.main.get_async_session")
+    def test_scores_cached_within_minute(
+        self, mock_get_async_session: MagicMock, api_client: TestClient
+    ):
+        """Test repeated scoring in the same minute reuses cached scores."""
+        _mock_empty_async_session(mock_get_async_session)
+        reference = datetime(2026, 1, 15, 12, 30)
+
+        with patch.object(api_main, "_reference_minute", return_value=reference):
+            usd = api_client.get("/api/v1/scoring/currency/USD")
+            pair = api_client.get("/api/v1/scoring/pair/EUR/USD")
+            again = api_client.get("/api/v1/scoring/pair/EUR/USD")
+
+        assert usd.json()["reference_time"] == "2026-01-15T12:30:00"
+        assert pair.json() == again.json()
+        # USD, then EUR alone for the pair, then nothing
+        assert mock_get_async_session.call_count == 2
+
+    @patch("blackbox.api.main.get_async_session")
+    def test_requests_share_event_cache(
+        self, mock_get_async_session: MagicMock, api_client: TestClient
+    ):
+        """Test that scoring requests reuse the events another request loaded."""
+        _mock_empty_async_session(mock_get_async_session)
+        mock_session = mock_get_async_session.return_value.__aenter__.return_value
+        reference = datetime(2026, 1, 15, 12, 30)
+
+        with patch.object(api_main, "_reference_minute", return_value=reference):
+            api_client.get("/api/v1/scoring/currency/USD")
+            api_client.get("/api/v1/scoring/currency/EUR")
+
+        # Both requests opened a session, only the first queried the window
+        assert mock_get_async_session.call_count == 2
+        assert mock_session.execute.await_count == 1
+
+    @patch("blackbox.api.main.get_async_session")
     def test_get_currency_score(
-        self, mock_get_session: MagicMock, api_client: TestClient
+        self, mock_get_async_session: MagicMock, api_client: TestClient
     ):
         """Test currency score endpoint."""
         # Mock empty session (no events)
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
-        mock_get_session.return_value = mock_session
+        _mock_empty_async_session(mock_get_async_session)
 
         response = api_client.get("/api/v1/scoring/currency/USD")
 
@@ -98,14 +352,12 @@ class TestScoringAPI:
         assert data["config"]["half_life_hours"] == 48.0
         assert data["config"]["lookback_days"] == 7
 
-    @patch("blackbox.api.main.get_session")
+    @patch("blackbox.api.main.get_async_session")
     def test_get_currency_score_with_params(
-        self, mock_get_session: MagicMock, api_client: TestClient
+        self, mock_get_async_session: MagicMock, api_client: TestClient
     ):
         """Test currency score endpoint with custom parameters."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
-        mock_get_session.return_value = mock_session
+        _mock_empty_async_session(mock_get_async_session)
 
         response = api_client.get(
             "/api/v1/scoring/currency/EUR?half_life_hours=24&lookback_days=14"
@@ -117,14 +369,12 @@ class TestScoringAPI:
         assert data["config"]["half_life_hours"] == 24.0
         assert data["config"]["lookback_days"] == 14
 
-    @patch("blackbox.api.main.get_session")
+    @patch("blackbox.api.main.get_async_session")
     def test_get_currency_score_lowercase(
-        self, mock_get_session: MagicMock, api_client: TestClient
+        self, mock_get_async_session: MagicMock, api_client: TestClient
     ):
         """Test currency is normalized to uppercase."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
-        mock_get_session.return_value = mock_session
+        _mock_empty_async_session(mock_get_async_session)
 
         response = api_client.get("/api/v1/scoring/currency/usd")
 
@@ -132,12 +382,12 @@ class TestScoringAPI:
         data = response.json()
         assert data["currency"] == "USD"
 
-    @patch("blackbox.api.main.get_session")
-    def test_get_pair_bias(self, mock_get_session: MagicMock, api_client: TestClient):
+    @patch("blackbox.api.main.get_async_session")
+    def test_get_pair_bias(
+        self, mock_get_async_session: MagicMock, api_client: TestClient
+    ):
         """Test pair bias endpoint."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
-        mock_get_session.return_value = mock_session
+        _mock_empty_async_session(mock_get_async_session)
 
         response = api_client.get("/api/v1/scoring/pair/EUR/USD")
 
@@ -151,14 +401,12 @@ class TestScoringAPI:
         assert "bias" in data
         assert "reference_time" in data
 
-    @patch("blackbox.api.main.get_session")
+    @patch("blackbox.api.main.get_async_session")
     def test_get_pair_bias_lowercase(
-        self, mock_get_session: MagicMock, api_client: TestClient
+        self, mock_get_async_session: MagicMock, api_client: TestClient
     ):
         """Test pair currencies are normalized to uppercase."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
-        mock_get_session.return_value = mock_session
+        _mock_empty_async_session(mock_get_async_session)
 
         response = api_client.get("/api/v1/scoring/pair/eur/usd")
 
@@ -168,12 +416,12 @@ class TestScoringAPI:
         assert data["quote"] == "USD"
         assert data["pair"] == "EURUSD"
 
-    @patch("blackbox.api.main.get_session")
-    def test_get_pair_signal(self, mock_get_session: MagicMock, api_client: TestClient):
+    @patch("blackbox.api.main.get_async_session")
+    def test_get_pair_signal(
+        self, mock_get_async_session: MagicMock, api_client: TestClient
+    ):
         """Test pair signal endpoint."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
-        mock_get_session.return_value = mock_session
+        _mock_empty_async_session(mock_get_async_session)
 
         response = api_client.get("/api/v1/scoring/signal/EUR/USD")
 
@@ -187,14 +435,12 @@ class TestScoringAPI:
         assert data["threshold"] == 1.0
         assert "reference_time" in data
 
-    @patch("blackbox.api.main.get_session")
+    @patch("blackbox.api.main.get_async_session")
     def test_get_pair_signal_with_threshold(
-        self, mock_get_session: MagicMock, api_client: TestClient
+        self, mock_get_async_session: MagicMock, api_client: TestClient
     ):
         """Test pair signal endpoint with custom threshold."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
-        mock_get_session.return_value = mock_session
+        _mock_empty_async_session(mock_get_async_session)
 
         response = api_client.get(
             "/api/v1/scoring/signal/EUR/USD?min_bias_threshold=2.5"
@@ -1,9 +1,33 @@
 """Tests for CLI commands."""
 
+import csv
+import json
+import os
+import subprocess
+import sys
+from contextlib import contextmanager
+from datetime import date, time
+from unittest.mock import patch
+
+import click
+import pytest
 from click.testing import CliRunner
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 from blackbox import __version__
 from blackbox.cli.main import cli
+from blackbox.data.models import EconomicEvent, Impact
+from blackbox.data.storage import database
+from blackbox.data.storage.models import Base
+from blackbox.data.storage.repository import EventRepository
+
+
+@pytest.fixture(autouse=True)
+def reset_database_config():
+    """Undo the engine configuration done by database command groups."""
+    yield
+    database.configure()
 
 
 def test_cli_help(cli_runner: CliRunner):
@@ -47,3 +71,285 @@ def test_cli_backtest(cli_runner: CliRunner):
     result = cli_runner.invoke(cli, ["backtest", "test_strategy"])
     assert result.exit_code == 0
     assert "test_strategy" in result.output
+
+
+def test_cli_command_tree():
+    """Test the single CLI module exposes the expected command tree."""
+    ctx = click.Context(cli)
+
+    assert set(cli.commands) == {"status", "run", "backtest", "calendar", "db"}
+    assert cli.commands["calendar"].list_commands(ctx) == ["fetch", "today"]
+    assert cli.commands["db"].list_commands(ctx) == [
+        "export",
+        "init",
+        "migrate",
+        "migrate-status",
+        "stats",
+    ]
+
+
+def test_cli_import_skips_data_layer():
+    """Test importing the CLI does not load SQLAlchemy or the scraper."""
+    code = (
+        "import sys, blackbox.cli.main; "
+        "print(any(m in sys.modules for m in ('sqlalchemy', 'selenium')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_help_skips_command_modules():
+    """Test top-level help does not import the calendar and db commands."""
+    code = (
+        "import sys; from blackbox.cli.main import cli; "
+        "cli(['--help'], standalone_mode=False); "
+        "print(any(m in sys.modules for m in ('blackbox.cli.calendar', "
+        "'blackbox.cli.db')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert "calendar" in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_cli_lazy_group_lists_commands(cli_runner: CliRunner):
+    """Test lazily loaded subcommands appear in group help."""
+    result = cli_runner.invoke(cli, ["db", "--help"])
+    assert result.exit_code == 0
+    for name in ("init", "migrate", "migrate-status", "stats", "export"):
+        assert name in result.output
+
+
+def test_cli_database_groups_skip_pre_ping(cli_runner: CliRunner):
+    """Test database commands configure the engine without pre-ping."""
+    with patch("blackbox.data.services.CalendarService") as mock_service_cls:
+        mock_service_cls.return_value.fetch_today.return_value = []
+        result = cli_runner.invoke(cli, ["calendar", "today"])
+
+    assert result.exit_code == 0
+    assert database._pool_pre_ping is False
+    assert "DATABASE_POOL_PRE_PING" not in os.environ
+
+
+def test_cli_help_skips_data_layer():
+    """Test group help does not import SQLAlchemy or build an engine."""
+    code = (
+        "import sys; from blackbox.cli.main import cli; "
+        "cli(['db', '--help'], standalone_mode=False); "
+        "print('sqlalchemy' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+@pytest.fixture
+def export_session():
+    """Patch the CLI database session with an in-memory SQLite database."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    EventRepository(session).upsert_events(
+        [
+            EconomicEvent(
+                date=date(2026, 1, 15),
+                time=time(8, 30),
+                currency="USD",
+                impact=Impact.HIGH,
+                event_name="NFP",
+                actual="200K",
+                forecast="195K",
+            ),
+            EconomicEvent(
+                date=date(2026, 1, 16),
+                currency="JPY",
+                impact=Impact.HOLIDAY,
+                event_name="Bank Holiday",
+                actual="0",
+            ),
+        ]
+    )
+    session.commit()
+
+    @contextmanager
+    def get_session_mock():
+        yield session
+
+    with patch("blackbox.data.storage.database.get_session", get_session_mock):
+        yield
+    session.close()
+    engine.dispose()
+
+
+def test_db_export_json(cli_runner: CliRunner, export_session):
+    """Test JSON export streams every event in the indented layout."""
+    result = cli_runner.invoke(
+        cli, ["db", "export", "--format", "json", "-y", "2026", "-m", "1"]
+    )
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert list(data) == [
+        "exported_at",
+        "start_date",
+        "end_date",
+        "total_events",
+        "events",
+    ]
+    assert result.output == json.dumps(data, indent=2) + "\n"
+    assert data["start_date"] == "2026-01-01"
+    assert data["total_events"] == 2
+    assert data["events"][0]["time"] == "08:30:00"
+    assert data["events"][1]["time"] is None
+
+
+def test_db_export_json_empty_month(cli_runner: CliRunner, export_session):
+    """Test JSON export of a month without events keeps the same layout."""
+    result = cli_runner.invoke(
+        cli, ["db", "export", "--format", "json", "-y", "2026", "-m", "2"]
+    )
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["total_events"] == 0
+    assert data["events"] == []
+    assert result.output == json.dumps(data, indent=2) + "\n"
+
+
+def test_db_export_csv_to_file(cli_runner: CliRunner, export_session, tmp_path):
+    """Test CSV export writes a header and one row per event to a file."""
+    output = tmp_path / "events.csv"
+
+    result = cli_runner.invoke(
+        cli, ["db", "export", "--format", "csv", "-o", str(output)]
+    )
+
+    assert result.exit_code == 0
+    assert "Exported 2 events" in result.output
+    rows = list(csv.reader(output.open()))
+    assert rows[0][:3] == ["date", "time", "currency"]
+    assert rows[1][:4] == ["2026-01-15", "08:30:00", "USD", "high"]
+    assert rows[2][1] == ""
+    assert rows[2][5] == "0.0"
+
+
+@patch("blackbox.cli.calendar._complete_month_events", return_value=None)
+@patch("blackbox.data.services.CalendarService")
+def test_calendar_fetch_json_output(
+    mock_service_cls, _mock_complete, cli_runner: CliRunner
+):
+    """Test calendar fetch JSON output serializes dates, times and impacts."""
+    mock_service_cls.return_value.fetch_month.return_value = [
+        EconomicEvent(
+            date=date(2026, 1, 15),
+            time=time(8, 30),
+            currency="USD",
+            impact=Impact.HIGH,
+            event_name="NFP",
+            actual="200K",
+        ),
+    ]
+
+    result = cli_runner.invoke(
+        cli, ["calendar", "fetch", "-y", "2026", "-m", "1", "--json-output"]
+    )
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["events"][0]["date"] == "2026-01-15"
+    assert data["events"][0]["time"] == "08:30:00"
+    assert data["events"][0]["impact"] == "high"
+    assert data["events"][0]["actual"] == 200000.0
+
+
+@patch("blackbox.data.services.CalendarService")
+def test_calendar_fetch_complete_month_skips_scraper(
+    mock_service_cls, cli_runner: CliRunner
+):
+    """Test a fully stored month is read from the database without scraping."""
+    events = [
+        EconomicEvent(
+            date=date(2026, 1, 15),
+            currency="USD",
+            impact=Impact.HIGH,
+            event_name="NFP",
+        )
+    ]
+
+    with patch(
+        "blackbox.cli.calendar._complete_month_events", return_value=events
+    ) as mock_complete:
+        result = cli_runner.invoke(
+            cli, ["calendar", "fetch", "-y", "2026", "-m", "1", "-c", "usd"]
+        )
+
+    assert result.exit_code == 0
+    assert "Found 1 events" in result.output
+    mock_complete.assert_called_once_with(2026, 1, ["USD"], None)
+    mock_service_cls.assert_not_called()
+
+
+def test_calendar_fetch_text_output(cli_runner: CliRunner):
+    """Test calendar fetch prints one formatted line per event."""
+    events = [
+        EconomicEvent(
+            date=date(2026, 1, 9),
+            time=time(8, 30),
+            currency="USD",
+            impact=Impact.HIGH,
+            event_name="NFP",
+            actual="256K",
+        ),
+        EconomicEvent(
+            date=date(2026, 1, 19),
+            currency="USD",
+            impact=Impact.HOLIDAY,
+            event_name="Bank Holiday",
+        ),
+    ]
+
+    with patch("blackbox.cli.calendar._complete_month_events", return_value=events):
+        result = cli_runner.invoke(cli, ["calendar", "fetch", "-y", "2026", "-m", "1"])
+
+    assert result.exit_code == 0
+    assert "[2026-01-09] [08:30] [USD] [!!!] NFP | A:256000.0 F:- P:-" in result.output
+    assert "[2026-01-19] [All Day] [USD] [H] Bank Holiday | A:- F:- P:-" in (
+        result.output
+    )
+
+
+@patch("blackbox.data.services.CalendarService")
+def test_calendar_fetch_several_months(mock_service_cls, cli_runner: CliRunner):
+    """Test --months fetches consecutive months across the year boundary."""
+    mock_service_cls.return_value.fetch_months.return_value = []
+
+    result = cli_runner.invoke(
+        cli, ["calendar", "fetch", "-y", "2025", "-m", "11", "--months", "3"]
+    )
+
+    assert result.exit_code == 0
+    mock_service_cls.return_value.fetch_months.assert_called_once_with(
+        [(2025, 11), (2025, 12), (2026, 1)], None, None, False
+    )
+    mock_service_cls.return_value.fetch_month.assert_not_called()
+
+
+@patch("blackbox.data.services.CalendarService")
+def test_calendar_today_passes_filters_to_service(
+    mock_service_cls, cli_runner: CliRunner
+):
+    """Test calendar today delegates currency and impact filtering."""
+    mock_service_cls.return_value.fetch_today.return_value = []
+
+    result = cli_runner.invoke(
+        cli, ["calendar", "today", "-c", "usd", "-c", "EUR", "--high-impact-only"]
+    )
+
+    assert result.exit_code == 0
+    mock_service_cls.return_value.fetch_today.assert_called_once_with(
+        ["USD", "EUR"], True
+    )
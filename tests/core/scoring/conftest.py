@@ -3,13 +3,13 @@
 from datetime import date, time
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from blackbox.core.scoring.config import ScoringConfig
 from blackbox.data.models import EconomicEvent, EventType, Impact
 from blackbox.data.storage.models import Base
-from blackbox.data.storage.repository import EventRepository
+from blackbox.data.storage.repository import AsyncEventRepository, EventRepository
 
 
 @pytest.fixture
@@ -23,30 +23,48 @@ def scoring_config() -> ScoringConfig:
 
 
 @pytest.fixture
-def test_engine():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(bind=engine)
+async def test_engine():
+    """Create an in-memory async SQLite database for testing."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", echo=False, poolclass=StaticPool
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
     yield engine
-    engine.dispose()
+    await engine.dispose()
 
 
 @pytest.fixture
-def test_session(test_engine):
-    """Create a database session for testing."""
-    SessionLocal = sessionmaker(bind=test_engine, autocommit=False, autoflush=False)
+async def test_session(test_engine):
+    """Create an async database session for testing."""
+    SessionLocal = async_sessionmaker(
+        bind=test_engine, autoflush=False, expire_on_commit=False
+    )
     session = SessionLocal()
     try:
         yield session
     finally:
-        session.rollback()
-        session.close()
+        await session.rollback()
+        await session.close()
 
 
 @pytest.fixture
-def event_repository(test_session) -> EventRepository:
-    """Create an event repository with the test session."""
-    return EventRepository(test_session)
+def event_repository(test_session) -> AsyncEventRepository:
+    """Create an async event repository with the test session."""
+    return AsyncEventRepository(test_session)
+
+
+@pytest.fixture
+def store_events(test_session):
+    """Persist events through the sync repository upsert and commit them."""
+
+    async def _store(events: list[EconomicEvent]) -> None:
+        await test_session.run_sync(
+            lambda session: EventRepository(session).upsert_events(events)
+        )
+        await test_session.commit()
+
+    return _store
 
 
 @pytest.fixture
@@ -1,19 +1,32 @@
 """Unit tests for the scoring calculator functions."""
 
+import math
 from datetime import date, datetime, time, timedelta
 
+import numpy as np
 import pytest
 
+from blackbox.core.scoring import calculator
 from blackbox.core.scoring.calculator import (
+    _NO_CUTOFF_SECONDS,
+    _calculate_decay_fast,
+    _decay_coefficient,
+    _score_loop,
+    _score_loop_parallel,
+    _seconds_since_epoch,
     calculate_currency_score,
+    calculate_currency_score_arrays,
+    calculate_currency_scores,
     calculate_decay,
     calculate_event_force,
     calculate_pair_bias,
     event_to_datetime,
     get_bias_signal,
+    get_bias_signals,
 )
 from blackbox.core.scoring.config import ScoringConfig
 from blackbox.data.models import EconomicEvent, Impact
+from blackbox.data.storage.repository import EventArrays
 
 
 class TestCalculateDecay:
@@ -41,6 +54,30 @@ class TestCalculateDecay:
 
         assert result == pytest.approx(expected_decay, rel=0.01)
 
+    @pytest.mark.parametrize("hours_elapsed", [0.5, 12, 48, 333.25])
+    def test_fast_decay_matches_power_formula(self, hours_elapsed: float) -> None:
+        """Precomputed-coefficient decay equals 0.5^(hours/half_life)."""
+        k = _decay_coefficient(48)
+
+        result = _calculate_decay_fast(hours_elapsed, k)
+
+        assert result == pytest.approx(0.5 ** (hours_elapsed / 48), rel=1e-12)
+
+    @pytest.mark.parametrize("hours_elapsed", [-24.0, -0.5, 0.0])
+    def test_fast_decay_clamps_future_events(self, hours_elapsed: float) -> None:
+        """Non-positive elapsed time is clamped to a decay of exactly 1.0."""
+        assert _calculate_decay_fast(hours_elapsed, _decay_coefficient(48)) == 1.0
+
+    def test_precomputed_coefficient_matches(self) -> None:
+        """A precomputed k gives the same decay as the half-life."""
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+        event_time = reference - timedelta(hours=30)
+        config = ScoringConfig(half_life_hours=48.0)
+
+        result = calculate_decay(event_time, reference, 48.0, k=config.decay_k)
+
+        assert result == pytest.approx(calculate_decay(event_time, reference, 48.0))
+
     def test_future_event_no_decay(self) -> None:
         """Future events should have decay of 1.0."""
         reference = datetime(2026, 1, 15, 12, 0, 0)
@@ -154,6 +191,62 @@ class TestCalculateCurrencyScore:
         # force = 1.0 * 5 * 1.0 = 5.0
         assert result == pytest.approx(5.0, rel=0.01)
 
+    def test_skips_events_past_decay_cutoff(self) -> None:
+        """Events older than the cutoff are left out of the score."""
+        config = ScoringConfig(half_life_hours=1.0, decay_cutoff_halflives=2.0)
+        reference = datetime(2026, 1, 15, 8, 0, 0)
+        events = [
+            EconomicEvent(
+                date=date(2026, 1, 15),
+                time=time(hour, 0),
+                currency="USD",
+                impact=Impact.HIGH,
+                event_name=f"Event {hour}",
+                actual=1.0,
+                forecast=0.5,
+                direction=1,
+                weight=4,
+            )
+            for hour in (5, 6, 7)
+        ]
+        arrays = EventArrays.from_rows(
+            [
+                (e.date, e.time, e.currency, e.weight, e.surprise, None, None, 1)
+                for e in events
+            ]
+        )
+
+        result = calculate_currency_score(events, "USD", reference, config)
+
+        # The 05:00 event is 3 half-lives old, past the 2 half-life cutoff
+        assert result == pytest.approx(4 * (0.25 + 0.5), rel=1e-9)
+        assert calculate_currency_score_arrays(
+            arrays, "USD", reference, config
+        ) == pytest.approx(result, rel=1e-9)
+
+    def test_none_currency_scores_prefiltered_events(
+        self, config: ScoringConfig
+    ) -> None:
+        """A None currency skips the filter and scores every event given."""
+        events = [
+            EconomicEvent(
+                date=date(2026, 1, 15),
+                time=time(8, 0),
+                currency="USD",
+                impact=Impact.HIGH,
+                event_name="NFP",
+                actual=1.0,
+                forecast=0.5,
+                direction=1,
+                weight=5,
+            ),
+        ]
+        reference = datetime(2026, 1, 15, 8, 0, 0)
+
+        result = calculate_currency_score(events, None, reference, config)
+
+        assert result == calculate_currency_score(events, "USD", reference, config)
+
     def test_filters_by_currency(self, config: ScoringConfig) -> None:
         """Only events for the specified currency are included."""
         events = [
@@ -256,6 +349,209 @@ class TestCalculateCurrencyScore:
 
         assert upper_result == lower_result
 
+    def test_matches_per_event_calculation(self, config: ScoringConfig) -> None:
+        """Vectorized score equals the sum of per-event forces."""
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+        events = [
+            EconomicEvent(
+                date=reference.date() - timedelta(days=offset),
+                time=None if offset == 3 else time(8, 30),
+                currency="USD",
+                impact=Impact.HIGH,
+                event_name=f"Event {offset}",
+                actual=1.0 + offset,
+                forecast=0.5,
+                weight=offset + 2,
+            )
+            for offset in range(-1, 6)
+        ]
+
+        expected = sum(
+            calculate_event_force(
+                event.surprise,
+                event.weight,
+                calculate_decay(
+                    event_to_datetime(event, reference),
+                    reference,
+                    config.half_life_hours,
+                ),
+            )
+            for event in events
+        )
+
+        result = calculate_currency_score(events, "USD", reference, config)
+
+        assert result == pytest.approx(expected, rel=1e-9)
+
+    def test_arrays_match_event_list(self, config: ScoringConfig) -> None:
+        """Array scoring matches list scoring, surprises computed if missing."""
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+        events = [
+            EconomicEvent(
+                date=reference.date() - timedelta(days=offset),
+                time=None if offset == 2 else time(9, 15),
+                currency=currency,
+                impact=Impact.HIGH,
+                event_name=f"{currency} {offset}",
+                actual=None if offset == 4 else 1.0 + offset,
+                forecast=0.5,
+                direction=-1 if offset == 1 else 1,
+                weight=offset + 2,
+            )
+            for offset in range(-1, 6)
+            for currency in ("USD", "eur")
+        ]
+        rows = [
+            (
+                e.date,
+                e.time,
+                e.currency,
+                e.weight,
+                # Legacy rows stored without a surprise are recomputed
+                None if e.event_name == "USD 3" else e.surprise,
+                e.actual,
+                e.forecast,
+                e.direction,
+            )
+            for e in events
+        ]
+
+        arrays = EventArrays.from_rows(rows)
+
+        assert arrays.currency_ids == {"USD": 0, "EUR": 1}
+        assert len(arrays.seconds) == len(events) - 2
+        for currency in ("USD", "EUR", "JPY"):
+            assert calculate_currency_score_arrays(
+                arrays, currency, reference, config
+            ) == pytest.approx(
+                calculate_currency_score(events, currency, reference, config),
+                rel=1e-12,
+            )
+
+    def test_currency_scores_match_masked_arrays(self, config: ScoringConfig) -> None:
+        """All-currency totals (JIT kernel or NumPy) match a masked sum."""
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+        rows = [
+            (
+                reference.date() - timedelta(days=offset),
+                time(7, 45),
+                currency,
+                offset + 3,
+                0.1 * offset - 0.2,
+                None,
+                None,
+                1,
+            )
+            for offset in range(-2, 7)
+            for currency in ("USD", "JPY")
+        ]
+        arrays = EventArrays.from_rows(rows)
+        mask = arrays.currency_id == arrays.currency_ids["JPY"]
+        expected = float(
+            np.dot(
+                arrays.surprise[mask] * arrays.weight[mask],
+                np.exp2(
+                    -np.maximum(
+                        (_seconds_since_epoch(reference) - arrays.seconds[mask]) / 3600,
+                        0.0,
+                    )
+                    / config.half_life_hours
+                ),
+            )
+        )
+
+        totals = _score_loop(
+            arrays.seconds,
+            arrays.surprise,
+            arrays.weight,
+            arrays.currency_id,
+            len(arrays.currency_ids),
+            _seconds_since_epoch(reference),
+            _NO_CUTOFF_SECONDS,
+            config.decay_k,
+        )
+
+        # Surprises are stored as float32, so products round at ~1e-7
+        assert totals[arrays.currency_ids["JPY"]] == pytest.approx(expected, rel=1e-6)
+        assert calculate_currency_scores(
+            arrays, ["JPY", "usd", "CHF"], reference, config
+        ) == {
+            "JPY": pytest.approx(expected, rel=1e-6),
+            "usd": pytest.approx(totals[arrays.currency_ids["USD"]], rel=1e-6),
+            "CHF": 0.0,
+        }
+
+    def test_infinite_cutoff_scores_every_event(self, monkeypatch) -> None:
+        """math.inf scores old events and reaches the kernel as a finite cutoff."""
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+        rows = [
+            (
+                reference.date() - timedelta(days=days),
+                time(8, 0),
+                "USD",
+                5,
+                1.0,
+                None,
+                None,
+                1,
+            )
+            for days in (1, 400)
+        ]
+        arrays = EventArrays.from_rows(rows)
+        unlimited = ScoringConfig(half_life_hours=1000, decay_cutoff_halflives=math.inf)
+        huge = ScoringConfig(half_life_hours=1000, decay_cutoff_halflives=1e6)
+        cutoffs = []
+
+        def spy_score_loop(*args):
+            cutoffs.append(args[6])
+            return _score_loop(*args)
+
+        expected = calculate_currency_scores(arrays, ["USD"], reference, huge)
+        numpy_scores = calculate_currency_scores(arrays, ["USD"], reference, unlimited)
+        monkeypatch.setattr(calculator, "NUMBA_AVAILABLE", True)
+        monkeypatch.setattr(calculator, "_score_loop", spy_score_loop)
+        kernel_scores = calculate_currency_scores(arrays, ["USD"], reference, unlimited)
+
+        assert numpy_scores["USD"] == pytest.approx(expected["USD"], rel=1e-12)
+        assert kernel_scores["USD"] == pytest.approx(expected["USD"], rel=1e-6)
+        assert cutoffs == [_NO_CUTOFF_SECONDS]
+        assert math.isfinite(cutoffs[0])
+
+    def test_parallel_loop_matches_single_loop(self, config: ScoringConfig) -> None:
+        """Chunked multi-threaded totals equal the single-loop totals."""
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+        rows = [
+            (
+                date(2026, 1, 15) - timedelta(days=offset % 9),
+                time(offset % 24, 0),
+                ("USD", "EUR", "JPY")[offset % 3],
+                offset % 10 + 1,
+                (offset % 7 - 3) / 2,
+                None,
+                None,
+                1,
+            )
+            for offset in range(50)
+        ]
+        arrays = EventArrays.from_rows(rows)
+        args = (
+            arrays.seconds,
+            arrays.surprise,
+            arrays.weight,
+            arrays.currency_id,
+            len(arrays.currency_ids),
+            _seconds_since_epoch(reference),
+            _NO_CUTOFF_SECONDS,
+            config.decay_k,
+        )
+
+        expected = _score_loop(*args)
+
+        for chunks in (1, 3, 64):
+            np.testing.assert_allclose(
+                _score_loop_parallel(*args, chunks), expected, rtol=1e-12
+            )
+
 
 class TestCalculatePairBias:
     """Tests for calculate_pair_bias function."""
@@ -302,6 +598,18 @@ class TestGetBiasSignal:
         result = get_bias_signal(bias, threshold)
         assert result == expected_signal
 
+    def test_batch_signals_match_scalar(self) -> None:
+        """get_bias_signals labels each bias as get_bias_signal does."""
+        biases = [4.0, -4.0, 0.5, -0.5, 1.0, -1.0, 1.01, -1.01]
+
+        result = get_bias_signals(biases, 1.0)
+
+        assert result == [get_bias_signal(bias, 1.0) for bias in biases]
+
+    def test_batch_signals_empty(self) -> None:
+        """An empty basket yields no signals."""
+        assert get_bias_signals([], 1.0) == []
+
 
 class TestScoringConfig:
     """Tests for ScoringConfig validation."""
@@ -321,6 +629,16 @@ class TestScoringConfig:
         assert config.half_life_hours == 48.0
         assert config.lookback_days == 7
         assert config.min_bias_threshold == 1.0
+        assert config.cache_ttl_seconds == 60.0
+        assert config.decay_cutoff_halflives == 10.0
+
+    def test_derived_decay_constants(self) -> None:
+        """Decay coefficient and cutoff age are derived at construction."""
+        config = ScoringConfig(half_life_hours=24.0, decay_cutoff_halflives=5.0)
+
+        assert config.decay_k == pytest.approx(-math.log(2) / 24.0)
+        assert config.decay_cutoff_seconds == 5.0 * 24.0 * 3600
+        assert config == ScoringConfig(half_life_hours=24.0, decay_cutoff_halflives=5.0)
 
     def test_invalid_half_life_raises_error(self) -> None:
         """Zero or negative half_life raises ValueError."""
@@ -339,3 +657,13 @@ class TestScoringConfig:
         """Negative threshold raises ValueError."""
         with pytest.raises(ValueError, match="min_bias_threshold must be non-negative"):
             ScoringConfig(min_bias_threshold=-1.0)
+
+    def test_invalid_cache_ttl_raises_error(self) -> None:
+        """Negative cache TTL raises ValueError."""
+        with pytest.raises(ValueError, match="cache_ttl_seconds must be non-negative"):
+            ScoringConfig(cache_ttl_seconds=-1)
+
+    def test_invalid_decay_cutoff_raises_error(self) -> None:
+        """Zero or negative decay cutoff raises ValueError."""
+        with pytest.raises(ValueError, match="decay_cutoff_halflives must be positive"):
+            ScoringConfig(decay_cutoff_halflives=0)
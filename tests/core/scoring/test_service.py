@@ -1,143 +1,186 @@
 """Integration tests for the ScoringService."""
 
 from datetime import date, datetime, time
+from unittest.mock import patch
 
 import pytest
 
 from blackbox.core.scoring.config import ScoringConfig
 from blackbox.core.scoring.service import ScoringService
 from blackbox.data.models import EconomicEvent, Impact
-from blackbox.data.storage.repository import EventRepository
+from blackbox.data.storage.repository import AsyncEventRepository
 
 
 class TestScoringServiceIntegration:
     """Integration tests for ScoringService with real database."""
 
-    def test_get_currency_score_with_events(
+    async def test_get_currency_score_with_events(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        store_events,
         scoring_config: ScoringConfig,
         sample_events: list[EconomicEvent],
     ) -> None:
         """Currency score calculation with events in database."""
         # Insert events
-        event_repository.upsert_events(sample_events)
-        event_repository.session.commit()
+        await store_events(sample_events)
 
         service = ScoringService(scoring_config, event_repository)
         reference = datetime(2026, 1, 15, 12, 0, 0)
 
-        usd_score = service.get_currency_score("USD", reference)
-        eur_score = service.get_currency_score("EUR", reference)
+        usd_score = await service.get_currency_score("USD", reference)
+        eur_score = await service.get_currency_score("EUR", reference)
 
         # Both should have non-zero scores
         assert usd_score != 0.0
         assert eur_score != 0.0
 
-    def test_get_currency_score_no_events(
+    async def test_get_currency_score_no_events(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
         scoring_config: ScoringConfig,
     ) -> None:
         """Currency score with no events returns zero."""
         service = ScoringService(scoring_config, event_repository)
         reference = datetime(2026, 1, 15, 12, 0, 0)
 
-        score = service.get_currency_score("USD", reference)
+        score = await service.get_currency_score("USD", reference)
 
         assert score == 0.0
 
-    def test_get_currency_score_case_insensitive(
+    async def test_get_currency_score_case_insensitive(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        store_events,
         scoring_config: ScoringConfig,
         sample_events: list[EconomicEvent],
     ) -> None:
         """Currency matching is case-insensitive."""
-        event_repository.upsert_events(sample_events)
-        event_repository.session.commit()
+        await store_events(sample_events)
 
         service = ScoringService(scoring_config, event_repository)
         reference = datetime(2026, 1, 15, 12, 0, 0)
 
-        upper_score = service.get_currency_score("USD", reference)
-        lower_score = service.get_currency_score("usd", reference)
+        upper_score = await service.get_currency_score("USD", reference)
+        lower_score = await service.get_currency_score("usd", reference)
 
         assert upper_score == lower_score
 
-    def test_get_pair_bias_positive(
+    async def test_get_currency_scores_matches_single_scores(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        store_events,
+        scoring_config: ScoringConfig,
+        sample_events: list[EconomicEvent],
+    ) -> None:
+        """Batched scoring matches per-currency scoring."""
+        await store_events(sample_events)
+
+        service = ScoringService(scoring_config, event_repository)
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+
+        scores = await service.get_currency_scores(["USD", "EUR", "JPY"], reference)
+
+        assert scores["USD"] == await service.get_currency_score("USD", reference)
+        assert scores["EUR"] == await service.get_currency_score("EUR", reference)
+        assert scores["JPY"] == 0.0
+
+    async def test_get_pair_bias_positive(
+        self,
+        event_repository: AsyncEventRepository,
+        store_events,
         scoring_config: ScoringConfig,
         sample_events_bullish_eur: list[EconomicEvent],
     ) -> None:
         """Pair bias is positive when base currency is stronger."""
-        event_repository.upsert_events(sample_events_bullish_eur)
-        event_repository.session.commit()
+        await store_events(sample_events_bullish_eur)
 
         service = ScoringService(scoring_config, event_repository)
         reference = datetime(2026, 1, 15, 12, 0, 0)
 
-        bias = service.get_pair_bias("EUR", "USD", reference)
+        bias = await service.get_pair_bias("EUR", "USD", reference)
 
         # EUR should be stronger, so EURUSD bias is positive
         assert bias > 0
 
-    def test_get_pair_bias_negative(
+    async def test_get_pair_bias_negative(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        store_events,
         scoring_config: ScoringConfig,
         sample_events_bearish_eur: list[EconomicEvent],
     ) -> None:
         """Pair bias is negative when quote currency is stronger."""
-        event_repository.upsert_events(sample_events_bearish_eur)
-        event_repository.session.commit()
+        await store_events(sample_events_bearish_eur)
 
         service = ScoringService(scoring_config, event_repository)
         reference = datetime(2026, 1, 15, 12, 0, 0)
 
-        bias = service.get_pair_bias("EUR", "USD", reference)
+        bias = await service.get_pair_bias("EUR", "USD", reference)
 
         # USD should be stronger, so EURUSD bias is negative
         assert bias < 0
 
-    def test_get_bias_signal_bullish(
+    async def test_get_bias_signal_bullish(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        store_events,
         scoring_config: ScoringConfig,
         sample_events_bullish_eur: list[EconomicEvent],
     ) -> None:
         """Signal is BULLISH when bias exceeds threshold."""
-        event_repository.upsert_events(sample_events_bullish_eur)
-        event_repository.session.commit()
+        await store_events(sample_events_bullish_eur)
 
         service = ScoringService(scoring_config, event_repository)
         reference = datetime(2026, 1, 15, 12, 0, 0)
 
-        signal = service.get_bias_signal("EUR", "USD", reference)
+        signal = await service.get_bias_signal("EUR", "USD", reference)
 
         assert signal == "BULLISH"
 
-    def test_get_bias_signal_bearish(
+    async def test_get_bias_signal_bearish(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        store_events,
         scoring_config: ScoringConfig,
         sample_events_bearish_eur: list[EconomicEvent],
     ) -> None:
         """Signal is BEARISH when bias is below negative threshold."""
-        event_repository.upsert_events(sample_events_bearish_eur)
-        event_repository.session.commit()
+        await store_events(sample_events_bearish_eur)
 
         service = ScoringService(scoring_config, event_repository)
         reference = datetime(2026, 1, 15, 12, 0, 0)
 
-        signal = service.get_bias_signal("EUR", "USD", reference)
+        signal = await service.get_bias_signal("EUR", "USD", reference)
 
         assert signal == "BEARISH"
 
-    def test_get_bias_signal_neutral(
+    async def test_get_bias_signals_basket(
+        self,
+        event_repository: AsyncEventRepository,
+        store_events,
+        scoring_config: ScoringConfig,
+        sample_events_bullish_eur: list[EconomicEvent],
+    ) -> None:
+        """Basket signals match the per-pair signals, in order."""
+        await store_events(sample_events_bullish_eur)
+
+        service = ScoringService(scoring_config, event_repository)
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+        pairs = [("EUR", "USD"), ("USD", "EUR"), ("EUR", "EUR")]
+
+        signals = await service.get_bias_signals(pairs, reference)
+
+        assert signals == [
+            await service.get_bias_signal(base, quote, reference)
+            for base, quote in pairs
+        ]
+        assert signals[0] == "BULLISH"
+
+    async def test_get_bias_signal_neutral(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        store_events,
     ) -> None:
         """Signal is NEUTRAL when bias is within threshold."""
         # Use high threshold so any small bias is neutral
@@ -173,19 +216,19 @@ class TestScoringServiceIntegration:
             ),
         ]
 
-        event_repository.upsert_events(events)
-        event_repository.session.commit()
+        await store_events(events)
 
         service = ScoringService(config, event_repository)
         reference = datetime(2026, 1, 15, 12, 0, 0)
 
-        signal = service.get_bias_signal("EUR", "USD", reference)
+        signal = await service.get_bias_signal("EUR", "USD", reference)
 
         assert signal == "NEUTRAL"
 
-    def test_lookback_window_filters_events(
+    async def test_lookback_window_filters_events(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        store_events,
     ) -> None:
         """Events outside lookback window are not included."""
         config = ScoringConfig(
@@ -218,14 +261,13 @@ class TestScoringServiceIntegration:
             weight=10,
         )
 
-        event_repository.upsert_events([recent_event, old_event])
-        event_repository.session.commit()
+        await store_events([recent_event, old_event])
 
         service = ScoringService(config, event_repository)
 
         # Reference at Jan 15
         reference = datetime(2026, 1, 15, 12, 0, 0)
-        score = service.get_currency_score("USD", reference)
+        score = await service.get_currency_score("USD", reference)
 
         # Only recent event should be included
         # The old event from Jan 5 is outside the 3-day window
@@ -233,15 +275,16 @@ class TestScoringServiceIntegration:
 
         # Now reference at Jan 4 (old event from Jan 5 is in the future, not included)
         reference_old = datetime(2026, 1, 4, 12, 0, 0)
-        score_old = service.get_currency_score("USD", reference_old)
+        score_old = await service.get_currency_score("USD", reference_old)
 
         # Old event from Jan 5 is in the future relative to Jan 4, so not included
         # (window is Jan 1-4, event is Jan 5)
         assert score_old == 0.0
 
-    def test_decay_reduces_old_event_impact(
+    async def test_decay_reduces_old_event_impact(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
+        store_events,
     ) -> None:
         """Older events have reduced impact due to decay."""
         config = ScoringConfig(
@@ -261,23 +304,22 @@ class TestScoringServiceIntegration:
             weight=10,
         )
 
-        event_repository.upsert_events([event])
-        event_repository.session.commit()
+        await store_events([event])
 
         service = ScoringService(config, event_repository)
 
         # Score at event time (no decay)
-        score_no_decay = service.get_currency_score(
+        score_no_decay = await service.get_currency_score(
             "USD", datetime(2026, 1, 15, 12, 0, 0)
         )
 
         # Score 24 hours later (50% decay)
-        score_half_decay = service.get_currency_score(
+        score_half_decay = await service.get_currency_score(
             "USD", datetime(2026, 1, 16, 12, 0, 0)
         )
 
         # Score 48 hours later (25% decay)
-        score_quarter_decay = service.get_currency_score(
+        score_quarter_decay = await service.get_currency_score(
             "USD", datetime(2026, 1, 17, 12, 0, 0)
         )
 
@@ -286,19 +328,95 @@ class TestScoringServiceIntegration:
         assert score_half_decay == pytest.approx(score_no_decay * 0.5, rel=0.01)
         assert score_quarter_decay == pytest.approx(score_no_decay * 0.25, rel=0.01)
 
-    def test_default_reference_time(
+    async def test_default_reference_time(
         self,
-        event_repository: EventRepository,
+        event_repository: AsyncEventRepository,
         scoring_config: ScoringConfig,
     ) -> None:
         """Methods use current time when at_time is not provided."""
         service = ScoringService(scoring_config, event_repository)
 
         # Should not raise, even with no events
-        score = service.get_currency_score("USD")
-        bias = service.get_pair_bias("EUR", "USD")
-        signal = service.get_bias_signal("EUR", "USD")
+        score = await service.get_currency_score("USD")
+        bias = await service.get_pair_bias("EUR", "USD")
+        signal = await service.get_bias_signal("EUR", "USD")
 
         assert score == 0.0
         assert bias == 0.0
         assert signal == "NEUTRAL"
+
+    async def test_event_arrays_cached_per_window(
+        self,
+        event_repository: AsyncEventRepository,
+        store_events,
+        scoring_config: ScoringConfig,
+        sample_events: list[EconomicEvent],
+    ) -> None:
+        """Scores over the same lookback window reuse one query."""
+        await store_events(sample_events)
+        service = ScoringService(
+            scoring_config,
+            event_repository,
+            ScoringService.create_event_cache(scoring_config),
+        )
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+
+        with patch.object(
+            event_repository,
+            "get_event_arrays",
+            wraps=event_repository.get_event_arrays,
+        ) as fetch:
+            usd = await service.get_currency_score("USD", reference)
+            bias = await service.get_pair_bias("EUR", "USD", reference)
+            eur = await service.get_currency_score("EUR", reference)
+            await service.get_currency_score("USD", datetime(2026, 1, 16, 9, 0))
+
+        assert bias == pytest.approx(eur - usd)
+        # One query for the Jan 8-15 window, one for Jan 9-16
+        assert fetch.call_count == 2
+
+    async def test_event_cache_shared_between_services(
+        self,
+        event_repository: AsyncEventRepository,
+        scoring_config: ScoringConfig,
+    ) -> None:
+        """Services given the same event cache share its windows."""
+        cache = ScoringService.create_event_cache(scoring_config)
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+
+        with patch.object(
+            event_repository,
+            "get_event_arrays",
+            wraps=event_repository.get_event_arrays,
+        ) as fetch:
+            first = ScoringService(scoring_config, event_repository, cache)
+            await first.get_currency_score("USD", reference)
+            second = ScoringService(scoring_config, event_repository, cache)
+            await second.get_currency_score("EUR", reference)
+
+        assert fetch.call_count == 1
+
+    async def test_no_event_cache_filters_currencies(
+        self,
+        event_repository: AsyncEventRepository,
+        scoring_config: ScoringConfig,
+    ) -> None:
+        """Without an event cache every call queries only its currencies."""
+        service = ScoringService(scoring_config, event_repository)
+        reference = datetime(2026, 1, 15, 12, 0, 0)
+
+        with patch.object(
+            event_repository,
+            "get_event_arrays",
+            wraps=event_repository.get_event_arrays,
+        ) as fetch:
+            await service.get_currency_score("USD", reference)
+            await service.get_currency_score("USD", reference)
+
+        assert fetch.call_count == 2
+        assert fetch.call_args.kwargs["currencies"] == ["USD"]
+
+    def test_event_cache_disabled(self) -> None:
+        """With cache_ttl_seconds=0 no event cache is created."""
+        config = ScoringConfig(cache_ttl_seconds=0)
+        assert ScoringService.create_event_cache(config) is None
@@ -0,0 +1,156 @@
+"""Tests for the logging module."""
+
+import logging
+import logging.handlers
+import sys
+from pathlib import Path
+
+from blackbox.core import logging as blackbox_logging
+from blackbox.core.logging import (
+    ColoredFormatter,
+    LogColors,
+    PlainFormatter,
+    use_colors,
+)
+
+
+def _record(level: int, msg: str = "hello %s", args: tuple = ("world",)):
+    record = logging.LogRecord("blackbox.test", level, __file__, 1, msg, args, None)
+    record.created = 0.0
+    return record
+
+
+def test_colored_formatter_uses_level_color():
+    """Test each level is rendered with its own color."""
+    formatter = ColoredFormatter()
+
+    output = formatter.format(_record(logging.WARNING))
+
+    assert f"{LogColors.WARNING}WARNING {LogColors.RESET}" in output
+    assert f"{LogColors.NAME}[blackbox.test]{LogColors.RESET}" in output
+    assert output.endswith(" hello world")
+
+
+def test_colored_formatter_time_only_timestamp():
+    """Test the timestamp is formatted as hours, minutes and seconds."""
+    formatter = ColoredFormatter()
+
+    output = formatter.format(_record(logging.INFO))
+    timestamp = output.split(LogColors.RESET)[0].removeprefix(LogColors.TIMESTAMP)
+
+    assert len(timestamp) == len("00:00:00")
+    assert timestamp.count(":") == 2
+
+
+def test_colored_formatter_unknown_level_and_exception():
+    """Test custom levels fall back to no color and tracebacks are appended."""
+    formatter = ColoredFormatter()
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _record(25)
+        record.exc_info = sys.exc_info()
+
+    output = formatter.format(record)
+
+    assert f"{LogColors.RESET}Level 25{LogColors.RESET}" in output
+    assert "ValueError: boom" in output
+
+
+def test_log_directory_created_once(tmp_path, monkeypatch):
+    """Test the log directory is only created on first access."""
+    monkeypatch.setattr(blackbox_logging, "_log_dir", tmp_path / "logs")
+    monkeypatch.setattr(blackbox_logging, "_log_dir_ready", False)
+    calls = []
+    real_mkdir = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        calls.append(self)
+        real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+
+    first = blackbox_logging.get_log_directory()
+    second = blackbox_logging.get_log_directory()
+
+    assert first == second == tmp_path / "logs"
+    assert first.is_dir()
+    assert calls == [tmp_path / "logs"]
+
+
+def test_colored_formatter_reuses_timestamp_within_second(monkeypatch):
+    """Test the timestamp is only formatted once per second."""
+    formatter = ColoredFormatter()
+    calls = []
+    real_strftime = blackbox_logging.time.strftime
+
+    def counting_strftime(fmt, value):
+        calls.append(fmt)
+        return real_strftime(fmt, value)
+
+    monkeypatch.setattr(blackbox_logging.time, "strftime", counting_strftime)
+
+    records = [_record(logging.INFO) for _ in range(3)]
+    records[1].created = 0.5
+    records[2].created = 1.0
+    stamps = [formatter.formatTime(record) for record in records]
+
+    assert stamps[0] == stamps[1]
+    assert len(calls) == 2
+
+
+class _Stream:
+    def __init__(self, tty: bool):
+        self.tty = tty
+
+    def isatty(self) -> bool:
+        return self.tty
+
+
+def test_use_colors_only_on_terminal(monkeypatch):
+    """Test colors are disabled for pipes and when NO_COLOR is set."""
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    assert use_colors(_Stream(tty=True)) is True
+    assert use_colors(_Stream(tty=False)) is False
+
+    monkeypatch.setenv("NO_COLOR", "1")
+    assert use_colors(_Stream(tty=True)) is False
+
+
+def test_plain_formatter_has_no_ansi_codes():
+    """Test the plain console format."""
+    output = PlainFormatter().format(_record(logging.INFO))
+
+    assert "\033[" not in output
+    assert output.endswith(" INFO     [blackbox.test] hello world")
+
+
+def test_console_synchronous_file_queued(tmp_path, monkeypatch):
+    """Test console records are written inline while file records are queued."""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(blackbox_logging, "_initialized", False)
+    monkeypatch.setattr(blackbox_logging, "_listener", None)
+    monkeypatch.setattr(blackbox_logging, "_log_dir_ready", False)
+    stream = _Stream(tty=False)
+    monkeypatch.setattr(sys, "stdout", stream)
+    # The listener is stopped below, not at interpreter exit
+    monkeypatch.setattr(blackbox_logging.atexit, "register", lambda _func: None)
+
+    blackbox_logging.setup_logging(log_dir=tmp_path)
+    try:
+        listener = blackbox_logging._listener
+        console = [h for h in root.handlers if isinstance(h, logging.StreamHandler)]
+        assert [type(h) for h in listener.handlers] == [
+            logging.handlers.TimedRotatingFileHandler
+        ]
+        assert console and console[0].stream is stream
+
+        blackbox_logging.set_console_level(logging.WARNING)
+        blackbox_logging.set_file_level(logging.ERROR)
+
+        assert console[0].level == logging.WARNING
+        assert listener.handlers[0].level == logging.ERROR
+    finally:
+        listener.stop()
+        listener.handlers[0].close()
@@ -0,0 +1,82 @@
+"""Tests for database engine configuration."""
+
+import pytest
+
+from blackbox.data.storage.database import (
+    configure,
+    get_async_connect_args,
+    get_engine,
+    reset_engine,
+    uses_pgbouncer,
+)
+
+
+class TestPgBouncerSettings:
+    """Tests for PgBouncer compatibility settings."""
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch):
+        """Without DATABASE_PGBOUNCER, asyncpg keeps its statement caches."""
+        monkeypatch.delenv("DATABASE_PGBOUNCER", raising=False)
+
+        assert uses_pgbouncer() is False
+        assert get_async_connect_args() == {}
+
+    @pytest.mark.parametrize("value", ["1", "true", "YES"])
+    def test_enabled_disables_statement_caches(
+        self, monkeypatch: pytest.MonkeyPatch, value: str
+    ):
+        """With PgBouncer enabled, prepared statement caches are turned off."""
+        monkeypatch.setenv("DATABASE_PGBOUNCER", value)
+
+        assert uses_pgbouncer() is True
+        assert get_async_connect_args() == {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        }
+
+
+class TestGetEngine:
+    """Tests for the process-wide sync engine."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        reset_engine()
+        yield
+        reset_engine()
+
+    def test_engine_is_memoized(self, tmp_path):
+        """The engine is created once, later arguments are ignored."""
+        engine = get_engine(f"sqlite:///{tmp_path / 'a.db'}", pool_pre_ping=False)
+
+        assert get_engine() is engine
+        assert engine.pool._pre_ping is False
+
+    def test_pre_ping_enabled_by_default(self, tmp_path, monkeypatch):
+        """Long-running processes test connections on checkout."""
+        monkeypatch.delenv("DATABASE_POOL_PRE_PING", raising=False)
+        engine = get_engine(f"sqlite:///{tmp_path / 'b.db'}")
+
+        assert engine.pool._pre_ping is True
+
+    def test_pre_ping_disabled_by_configure(self, tmp_path, monkeypatch):
+        """configure(pool_pre_ping=False) applies to the engine created next."""
+        monkeypatch.delenv("DATABASE_POOL_PRE_PING", raising=False)
+        configure(pool_pre_ping=False)
+        engine = get_engine(f"sqlite:///{tmp_path / 'd.db'}")
+
+        assert engine.pool._pre_ping is False
+
+    def test_environment_overrides_configure(self, tmp_path, monkeypatch):
+        """DATABASE_POOL_PRE_PING takes precedence over configure."""
+        monkeypatch.setenv("DATABASE_POOL_PRE_PING", "true")
+        configure(pool_pre_ping=False)
+        engine = get_engine(f"sqlite:///{tmp_path / 'e.db'}")
+
+        assert engine.pool._pre_ping is True
+
+    def test_pre_ping_disabled_by_environment(self, tmp_path, monkeypatch):
+        """DATABASE_POOL_PRE_PING=false turns pre-ping off."""
+        monkeypatch.setenv("DATABASE_POOL_PRE_PING", "false")
+        engine = get_engine(f"sqlite:///{tmp_path / 'c.db'}")
+
+        assert engine.pool._pre_ping is False
@@ -1,9 +1,12 @@
 """Tests for the EventRepository class."""
 
 from datetime import date, time
+from unittest.mock import MagicMock
+
+import numpy as np
 
 from blackbox.data.models import EconomicEvent, Impact
-from blackbox.data.storage.repository import EventRepository
+from blackbox.data.storage.repository import EventArrays, EventRepository
 
 
 class TestEventRepositoryInsert:
@@ -27,6 +30,29 @@ class TestEventRepositoryInsert:
         count = repo.upsert_events([])
         assert count == 0
 
+    def test_upsert_events_collapses_duplicates(self, test_session):
+        """Test duplicate events in one batch are written once, last one wins."""
+        repo = EventRepository(test_session)
+        events = [
+            EconomicEvent(
+                date=date(2026, 1, 9),
+                time=time(8, 30),
+                currency="USD",
+                impact=Impact.HIGH,
+                event_name="Non-Farm Employment Change",
+                actual=actual,
+            )
+            for actual in ("150K", "256K")
+        ]
+
+        count = repo.upsert_events(events)
+        test_session.commit()
+
+        assert count == 1
+        stored = repo.get_events(date(2026, 1, 9), date(2026, 1, 9))
+        assert len(stored) == 1
+        assert stored[0].actual == 256000.0
+
     def test_upsert_events_update(self, test_session, sample_events_for_db):
         """Test updating existing events with new values."""
         repo = EventRepository(test_session)
@@ -95,6 +121,18 @@ class TestEventRepositoryQuery:
         assert len(events) == 1
         assert events[0].impact == Impact.HIGH
 
+    def test_get_events_with_medium_impact_filter(
+        self, test_session, sample_events_for_db
+    ):
+        """Test a medium minimum impact also returns high impact events."""
+        repo = EventRepository(test_session)
+        repo.upsert_events(sample_events_for_db)
+        test_session.commit()
+
+        events = repo.get_events(date(2026, 1, 1), date(2026, 1, 31), impact="medium")
+        assert {e.impact for e in events} <= {Impact.MEDIUM, Impact.HIGH}
+        assert Impact.HIGH in {e.impact for e in events}
+
     def test_get_events_for_date(self, test_session, sample_events_for_db):
         """Test getting events for a specific date."""
         repo = EventRepository(test_session)
@@ -104,6 +142,33 @@ class TestEventRepositoryQuery:
         events = repo.get_events_for_date(date(2026, 1, 15))
         assert len(events) == 2
 
+    def test_iter_event_records_in_batches(self, test_session, sample_events_for_db):
+        """Test streaming records yields public fields in bounded batches."""
+        repo = EventRepository(test_session)
+        repo.upsert_events(sample_events_for_db)
+        test_session.commit()
+
+        batches = list(
+            repo.iter_event_records(date(2026, 1, 1), date(2026, 1, 31), batch_size=2)
+        )
+        records = [record for batch in batches for record in batch]
+        events = repo.get_events(date(2026, 1, 1), date(2026, 1, 31))
+
+        assert all(0 < len(batch) <= 2 for batch in batches)
+        assert records == [
+            {
+                "date": e.date,
+                "time": e.time,
+                "currency": e.currency,
+                "impact": e.impact.value,
+                "event_name": e.event_name,
+                "actual": e.actual,
+                "forecast": e.forecast,
+                "previous": e.previous,
+            }
+            for e in events
+        ]
+
     def test_get_events_sorted_by_date_and_time(
         self, test_session, sample_events_for_db
     ):
@@ -124,6 +189,20 @@ class TestEventRepositoryQuery:
                 # Different dates: earlier date first
                 assert events[i].date < events[i + 1].date
 
+    def test_get_events_matches_validated_models(
+        self, test_session, sample_events_for_db
+    ):
+        """Test that loaded events equal the validated models that were saved."""
+        repo = EventRepository(test_session)
+        repo.upsert_events(sample_events_for_db)
+        test_session.commit()
+
+        events = repo.get_events(date(2026, 1, 1), date(2026, 1, 31))
+
+        assert [e.model_dump() for e in events] == [
+            e.model_dump() for e in sample_events_for_db
+        ]
+
 
 class TestEventRepositoryNeedsUpdate:
     """Tests for the needs update functionality."""
@@ -165,6 +244,27 @@ class TestEventRepositoryStats:
         assert stats["by_impact"]["holiday"] == 1
         assert stats["date_range"] == (date(2026, 1, 15), date(2026, 1, 17))
 
+    def test_get_date_range(self, test_session, sample_events_for_db):
+        """Test the stored date range, empty table included."""
+        repo = EventRepository(test_session)
+        assert repo.get_date_range() == (None, None)
+
+        repo.upsert_events(sample_events_for_db)
+        test_session.commit()
+
+        assert repo.get_date_range() == (date(2026, 1, 15), date(2026, 1, 17))
+
+    def test_get_stats_sorted_by_count(self, test_session, sample_events_for_db):
+        """Test stats counts are ordered largest first, ties by name."""
+        repo = EventRepository(test_session)
+        repo.upsert_events(sample_events_for_db)
+        test_session.commit()
+
+        stats = repo.get_stats()
+
+        assert list(stats["by_currency"]) == ["USD", "EUR", "JPY"]
+        assert list(stats["by_impact"]) == ["high", "holiday", "low", "medium"]
+
     def test_get_stats_empty_database(self, test_session):
         """Test getting stats from empty database."""
         repo = EventRepository(test_session)
@@ -175,6 +275,44 @@ class TestEventRepositoryStats:
         assert stats["by_impact"] == {}
         assert stats["date_range"] == (None, None)
 
+    def test_refresh_stats_without_view(self, test_session, sample_events_for_db):
+        """Test refresh_stats is a no-op when the database has no stats view."""
+        repo = EventRepository(test_session)
+        repo.upsert_events(sample_events_for_db)
+        test_session.commit()
+
+        before = repo.get_stats()
+        repo.refresh_stats()
+
+        assert repo.get_stats() == before
+
+    def test_postgresql_without_view_aggregates_events(self):
+        """Test a PostgreSQL database created without migrations has no view."""
+        statements: list[str] = []
+
+        def execute(statement, *args, **kwargs):
+            statements.append(str(statement))
+            result = MagicMock()
+            result.scalar.return_value = None  # to_regclass: no such relation
+            result.__iter__.return_value = iter(
+                [("USD", "high", 2, date(2026, 1, 15), date(2026, 1, 16))]
+            )
+            return result
+
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        session.execute.side_effect = execute
+        repo = EventRepository(session)
+
+        stats = repo.get_stats()
+        repo.refresh_stats()
+
+        assert stats["total_events"] == 2
+        assert stats["date_range"] == (date(2026, 1, 15), date(2026, 1, 16))
+        assert any("FROM economic_events" in s for s in statements)
+        assert not any("FROM event_stats" in s for s in statements)
+        assert not any("REFRESH" in s for s in statements)
+
 
 class TestEventRepositoryMonthOperations:
     """Tests for month-level operations."""
@@ -195,6 +333,99 @@ class TestEventRepositoryMonthOperations:
 
         assert repo.has_events_for_month(2026, 3) is False
 
+    def test_get_dates_with_events(self, test_session, sample_events_for_db):
+        """Test listing the distinct dates that have events."""
+        repo = EventRepository(test_session)
+        repo.upsert_events(sample_events_for_db)
+        test_session.commit()
+
+        dates = repo.get_dates_with_events(date(2026, 1, 1), date(2026, 1, 31))
+
+        assert dates == {date(2026, 1, 15), date(2026, 1, 16), date(2026, 1, 17)}
+
+    def test_is_month_complete(self, test_session):
+        """Test a month is complete only when every day was scraped."""
+        repo = EventRepository(test_session)
+        for day in range(1, 28):
+            event = EconomicEvent(
+                date=date(2025, 2, day),
+                currency="USD",
+                impact=Impact.LOW,
+                event_name="Daily",
+                actual="1",
+            )
+            repo.save_scraped_day(event.date, [event])
+        test_session.commit()
+        assert repo.is_month_complete(2025, 2) is False
+
+        repo.save_scraped_day(
+            date(2025, 2, 28), [event.model_copy(update={"date": date(2025, 2, 28)})]
+        )
+        test_session.commit()
+        assert repo.is_month_complete(2025, 2) is True
+
+    def test_month_with_empty_day_is_complete(self, test_session):
+        """Test a scraped day without events does not leave the month incomplete."""
+        repo = EventRepository(test_session)
+        for day in range(1, 29):
+            events = [
+                EconomicEvent(
+                    date=date(2025, 2, day),
+                    currency="USD",
+                    impact=Impact.LOW,
+                    event_name="Daily",
+                    actual="1",
+                )
+            ]
+            # February 1st, 2025 is a Saturday: no events that day
+            repo.save_scraped_day(date(2025, 2, day), [] if day == 1 else events)
+        test_session.commit()
+
+        assert repo.get_dates_with_events(date(2025, 2, 1), date(2025, 2, 28)) == {
+            date(2025, 2, day) for day in range(2, 29)
+        }
+        assert repo.is_month_complete(2025, 2) is True
+
+    def test_events_without_scrape_record_are_incomplete(self, test_session):
+        """Test events upserted outside a day scrape do not complete a month."""
+        repo = EventRepository(test_session)
+        repo.upsert_events(
+            [
+                EconomicEvent(
+                    date=date(2025, 2, day),
+                    currency="USD",
+                    impact=Impact.LOW,
+                    event_name="Daily",
+                    actual="1",
+                )
+                for day in range(1, 29)
+            ]
+        )
+        test_session.commit()
+
+        assert repo.is_month_complete(2025, 2) is False
+
+    def test_delete_month_forgets_scraped_days(self, test_session):
+        """Test deleting a month's events also drops its scraped days."""
+        repo = EventRepository(test_session)
+        for day in range(1, 29):
+            repo.save_scraped_day(date(2025, 2, day), [])
+        test_session.commit()
+
+        repo.delete_events_for_month(2025, 2)
+        test_session.commit()
+
+        assert repo.get_scraped_dates(date(2025, 2, 1), date(2025, 2, 28)) == set()
+
+    def test_has_events_for_date(self, test_session, sample_events_for_db):
+        """Test checking if events exist for a single date."""
+        repo = EventRepository(test_session)
+        repo.upsert_events(sample_events_for_db)
+        test_session.commit()
+
+        assert repo.has_events_for_date(date(2026, 1, 15)) is True
+        assert repo.has_events_for_date(date(2026, 1, 20)) is False
+
     def test_delete_events_for_month(self, test_session, sample_events_for_db):
         """Test deleting all events for a month."""
         repo = EventRepository(test_session)
@@ -206,3 +437,32 @@ class TestEventRepositoryMonthOperations:
 
         assert count == 4
         assert repo.has_events_for_month(2026, 1) is False
+
+
+class TestEventArrays:
+    """Tests for building EventArrays from query rows."""
+
+    def test_from_rows_merges_currency_spellings(self):
+        """Stored codes differing only by case share one currency index."""
+        rows = [
+            (date(2026, 1, 15), time(8, 0), "usd", 5, 1.0, None, None, 1),
+            (date(2026, 1, 15), time(9, 0), "USD", 5, 2.0, None, None, 1),
+            (date(2026, 1, 15), time(10, 0), "EUR", 3, 0.5, None, None, 1),
+            (date(2026, 1, 15), time(11, 0), "usd", 5, 1.5, None, None, 1),
+        ]
+
+        arrays = EventArrays.from_rows(rows)
+
+        assert arrays.currency_ids == {"USD": 0, "EUR": 1}
+        assert arrays.currency_id.tolist() == [0, 0, 1, 0]
+
+    def test_from_rows_uses_compact_dtypes(self):
+        """Surprise and weight are stored as float32 and int8."""
+        rows = [(date(2026, 1, 15), time(8, 0), "USD", 10, 0.1, None, None, 1)]
+
+        arrays = EventArrays.from_rows(rows)
+
+        assert arrays.seconds.dtype == np.float64
+        assert arrays.surprise.dtype == np.float32
+        assert arrays.weight.dtype == np.int8
+        assert arrays.weight.tolist() == [10]
@@ -0,0 +1,131 @@
+"""Tests for the browser pool."""
+
+import gc
+import time
+import weakref
+from unittest.mock import MagicMock, PropertyMock
+
+from blackbox.data.config import BrowserConfig, ForexFactoryConfig
+from blackbox.data.scraper.browser import BrowserManager, BrowserPool
+from blackbox.data.scraper.forex_factory import ForexFactoryScraper
+
+
+def _started_browser() -> BrowserManager:
+    """Create a browser manager with a mocked, already started driver."""
+    browser = BrowserManager()
+    browser._driver = MagicMock()
+    return browser
+
+
+class TestBrowserPool:
+    """Tests for the BrowserPool class."""
+
+    def test_released_browser_is_reused(self):
+        """Test that a released browser is handed out again, not closed."""
+        pool = BrowserPool()
+        browser = _started_browser()
+        driver = browser._driver
+
+        pool.release(browser)
+
+        assert pool.acquire() is browser
+        driver.quit.assert_not_called()
+        pool.release(browser)
+        pool.shutdown()
+
+    def test_release_beyond_max_idle_closes(self):
+        """Test that browsers beyond max_idle are closed on release."""
+        pool = BrowserPool(max_idle=1)
+        first, second = _started_browser(), _started_browser()
+        second_driver = second._driver
+
+        pool.release(first)
+        pool.release(second)
+
+        second_driver.quit.assert_called_once()
+        assert pool.acquire() is first
+        pool.release(first)
+        pool.shutdown()
+
+    def test_unresponsive_browser_is_replaced(self):
+        """Test that a browser whose driver no longer responds is discarded."""
+        pool = BrowserPool()
+        browser = _started_browser()
+        driver = browser._driver
+        type(driver).current_url = PropertyMock(side_effect=RuntimeError("gone"))
+
+        pool.release(browser)
+        replacement = pool.acquire()
+
+        assert replacement is not browser
+        driver.quit.assert_called_once()
+        pool.shutdown()
+
+    def test_shutdown_closes_idle_browsers(self):
+        """Test that shutdown quits every idle browser."""
+        pool = BrowserPool(max_idle=2)
+        browsers = [_started_browser(), _started_browser()]
+        drivers = [browser._driver for browser in browsers]
+        for browser in browsers:
+            pool.release(browser)
+
+        pool.shutdown()
+
+        for driver in drivers:
+            driver.quit.assert_called_once()
+
+    def test_scraper_returns_browser_to_pool(self, test_config: ForexFactoryConfig):
+        """Test that a pooled scraper releases its browser instead of closing."""
+        pool = BrowserPool(test_config.browser, test_config.delays)
+
+        with ForexFactoryScraper(test_config, pool) as scraper:
+            browser = scraper.browser
+            browser._driver = MagicMock()
+        driver = browser._driver
+
+        with ForexFactoryScraper(test_config, pool) as scraper:
+            assert scraper.browser is browser
+        driver.quit.assert_not_called()
+        pool.shutdown()
+
+    def test_idle_browser_evicted_after_timeout(self):
+        """Test that a browser idle past the timeout is closed by the timer."""
+        pool = BrowserPool(BrowserConfig(idle_timeout=0.05))
+        browser = _started_browser()
+        driver = browser._driver
+
+        pool.release(browser)
+        deadline = time.monotonic() + 2
+        while not driver.quit.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        driver.quit.assert_called_once()
+        assert pool.acquire() is not browser
+        pool.shutdown()
+
+    def test_recent_browser_survives_eviction(self):
+        """Test that eviction keeps browsers released within the timeout."""
+        pool = BrowserPool(BrowserConfig(idle_timeout=60))
+        browser = _started_browser()
+
+        pool.release(browser)
+        pool.evict_idle()
+
+        browser._driver.quit.assert_not_called()
+        assert pool.acquire() is browser
+        pool.release(browser)
+        pool.shutdown()
+
+    def test_collected_pool_closes_idle_browsers(self):
+        """Test that a dropped pool is collected and closes its browsers."""
+        pool = BrowserPool()
+        browser = _started_browser()
+        driver = browser._driver
+        pool.release(browser)
+        pool_ref = weakref.ref(pool)
+
+        del pool
+        gc.collect()
+
+        assert pool_ref() is None
+        driver.quit.assert_called_once()
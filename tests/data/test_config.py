@@ -1,6 +1,12 @@
 """Tests for the configuration module."""
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from blackbox.data.config import (
+    USER_AGENT_WEIGHTS,
     USER_AGENTS,
     BrowserConfig,
     ForexFactoryConfig,
@@ -59,6 +65,39 @@ class TestScraperDelays:
             delay = delays.get_pagination_delay()
             assert 2.0 <= delay <= 3.0
 
+    def test_seeded_delays_are_reproducible(self):
+        """Test the same seed yields the same delay sequence."""
+        first = ScraperDelays(seed=42)
+        second = ScraperDelays(seed=42)
+
+        for _ in range(300):
+            assert first.get_page_load_delay() == second.get_page_load_delay()
+            assert first.get_action_delay() == second.get_action_delay()
+
+    def test_threads_share_delays_without_loss(self, monkeypatch):
+        """Test concurrent callers get each drawn delay exactly once."""
+        monkeypatch.setattr("blackbox.data.config.DELAY_BATCH_SIZE", 1)
+        shared = ScraperDelays(seed=7)
+        sequential = ScraperDelays(seed=7)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            batches = list(
+                executor.map(
+                    lambda _: [shared.get_action_delay() for _ in range(500)],
+                    range(8),
+                )
+            )
+
+        drawn = sorted(delay for batch in batches for delay in batch)
+        assert drawn == sorted(sequential.get_action_delay() for _ in range(4000))
+
+    def test_is_frozen(self):
+        """Test delays cannot be modified after creation."""
+        delays = ScraperDelays()
+
+        with pytest.raises(FrozenInstanceError):
+            delays.action_min = 5.0
+
 
 class TestBrowserConfig:
     """Tests for the BrowserConfig configuration."""
@@ -125,6 +164,12 @@ class TestUserAgents:
             assert isinstance(agent, str)
             assert len(agent) > 0
 
+    def test_user_agent_weights_cover_pool(self):
+        """Test each user agent has a positive selection weight."""
+        assert isinstance(USER_AGENTS, tuple)
+        assert len(USER_AGENT_WEIGHTS) == len(USER_AGENTS)
+        assert all(weight > 0 for weight in USER_AGENT_WEIGHTS)
+
     def test_get_random_user_agent(self):
         """Test random user agent selection."""
         agents = set()
@@ -135,3 +180,10 @@ class TestUserAgents:
 
         # Should have selected multiple different agents
         assert len(agents) > 1
+
+    def test_get_random_user_agent_from_threads(self):
+        """Test user agents can be drawn concurrently from worker threads."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            agents = list(executor.map(lambda _: get_random_user_agent(), range(40)))
+
+        assert all(agent in USER_AGENTS for agent in agents)
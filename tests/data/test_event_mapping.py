@@ -1,13 +1,20 @@
 """Tests for event mapping module."""
 
+import re
+
 import pytest
 
 from blackbox.data.event_mapping import (
+    DEFAULT_EVENT_METADATA,
     EVENT_PATTERNS,
     EXACT_EVENT_MAPPING,
     EventMetadata,
     EventPattern,
+    _match_pattern,
+    _pattern_literal,
     get_event_metadata,
+    get_event_metadata_many,
+    get_events_by_type,
 )
 from blackbox.data.models import EventType
 
@@ -52,6 +59,15 @@ class TestEventPatterns:
         """Test that patterns list contains patterns."""
         assert len(EVENT_PATTERNS) > 0
 
+    def test_patterns_case_sensitive(self):
+        """Test that patterns skip case folding (names are lowercased first)."""
+        for event_pattern in EVENT_PATTERNS:
+            assert not event_pattern.pattern.flags & re.IGNORECASE
+
+    def test_patterns_immutable(self):
+        """Test that patterns are frozen into a tuple."""
+        assert isinstance(EVENT_PATTERNS, tuple)
+
     def test_patterns_sorted_by_priority(self):
         """Test that patterns are sorted by priority (highest first)."""
         priorities = [p.priority for p in EVENT_PATTERNS]
@@ -399,3 +415,88 @@ class TestPatternMatching:
         metadata = get_event_metadata("Spanish Manufacturing PMI")
         assert metadata.event_type == EventType.PMI
         assert metadata.weight == 6  # From pattern (generic PMI)
+
+    def test_metadata_lookups_are_memoized(self):
+        """Test that a recurring event name is looked up once."""
+        get_event_metadata.cache_clear()
+
+        first = get_event_metadata("Spanish Manufacturing PMI")
+        second = get_event_metadata("Spanish Manufacturing PMI")
+
+        assert first is second
+        assert get_event_metadata.cache_info().hits == 1
+        assert get_event_metadata.cache_info().misses == 1
+
+    def test_unknown_events_share_default_metadata(self):
+        """Test that unmatched events get the shared default metadata."""
+        assert get_event_metadata("Some Unknown Event") is DEFAULT_EVENT_METADATA
+
+    def test_keyword_patterns_answered_by_exact_mapping(self):
+        """Test that names equal to a keyword pattern have an exact entry."""
+        for event_pattern in EVENT_PATTERNS:
+            literal = _pattern_literal(event_pattern.pattern)
+            if literal is not None:
+                assert literal in EXACT_EVENT_MAPPING
+
+        # Added entries carry what the pattern scan returns
+        assert EXACT_EVENT_MAPPING["jolts"] == _match_pattern("jolts")
+        assert EXACT_EVENT_MAPPING["bank holiday"] == _match_pattern("bank holiday")
+
+    def test_exact_mapping_read_only(self):
+        """Test that the exact mapping cannot be modified."""
+        with pytest.raises(TypeError):
+            EXACT_EVENT_MAPPING["new event"] = EventMetadata(EventType.OTHER, +1, 1)
+
+    def test_nonfarm_spelling_variants(self):
+        """Test that both spellings of nonfarm events share metadata."""
+        assert get_event_metadata("Non-Farm Payrolls") == get_event_metadata(
+            "Nonfarm Payrolls"
+        )
+
+    def test_equal_metadata_shared(self):
+        """Test that equal metadata values are the same instance."""
+        assert get_event_metadata("CPI m/m") is get_event_metadata("CPI y/y")
+        assert get_event_metadata("Bank Holiday") is DEFAULT_EVENT_METADATA
+
+
+class TestGetEventMetadataMany:
+    """Tests for get_event_metadata_many function."""
+
+    def test_matches_single_lookups_in_order(self):
+        """Test that batch results equal per-name lookups, in input order."""
+        names = [
+            "Non-Farm Employment Change",
+            "Spanish Manufacturing PMI",
+            "Some Unknown Event",
+            "Non-Farm Employment Change",
+        ]
+
+        result = get_event_metadata_many(names)
+
+        assert result == [get_event_metadata(name) for name in names]
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns an empty list."""
+        assert get_event_metadata_many([]) == []
+
+
+class TestGetEventsByType:
+    """Tests for get_events_by_type function."""
+
+    def test_partitions_exact_mapping(self):
+        """Test each subtable holds exactly the entries of its type."""
+        total = 0
+        for event_type in EventType:
+            subtable = get_events_by_type(event_type)
+            total += len(subtable)
+            for name, metadata in subtable.items():
+                assert metadata.event_type == event_type
+                assert EXACT_EVENT_MAPPING[name] is metadata
+        assert total == len(EXACT_EVENT_MAPPING)
+
+    def test_subtable_read_only(self):
+        """Test subtables cannot be modified."""
+        subtable = get_events_by_type(EventType.EMPLOYMENT)
+        assert "non-farm employment change" in subtable
+        with pytest.raises(TypeError):
+            subtable["new event"] = DEFAULT_EVENT_METADATA
@@ -1,11 +1,17 @@
 """Tests for the data models."""
 
-from datetime import date, time
+from datetime import date, datetime, time
 
 import pytest
 from pydantic import ValidationError
 
-from blackbox.data.models import CalendarDay, CalendarMonth, EconomicEvent, Impact
+from blackbox.data.models import (
+    CalendarDay,
+    CalendarMonth,
+    EconomicEvent,
+    Impact,
+    wall_clock_seconds,
+)
 
 
 class TestImpact:
@@ -19,6 +25,14 @@ class TestImpact:
         assert Impact.HOLIDAY.value == "holiday"
         assert Impact.UNKNOWN.value == "unknown"
 
+    def test_impact_markers(self):
+        """Test that every impact level has a display marker."""
+        assert Impact.HIGH.marker == "!!!"
+        assert Impact.MEDIUM.marker == "!!"
+        assert Impact.LOW.marker == "!"
+        assert Impact.HOLIDAY.marker == "H"
+        assert Impact.UNKNOWN.marker == "?"
+
 
 class TestEconomicEvent:
     """Tests for the EconomicEvent model."""
@@ -63,6 +77,16 @@ class TestEconomicEvent:
         with pytest.raises(ValidationError):
             EconomicEvent(date=date(2026, 1, 18), currency="USDJPY", event_name="Test")
 
+    def test_currency_uppercased_and_interned(self):
+        """Test currency codes are normalized once at validation."""
+        first = EconomicEvent(date=date(2026, 1, 18), currency="eur", event_name="A")
+        second = EconomicEvent(
+            date=date(2026, 1, 18), currency="".join(["E", "u", "R"]), event_name="B"
+        )
+
+        assert first.currency == "EUR"
+        assert first.currency is second.currency
+
     def test_event_name_required(self):
         """Test that event_name is required and non-empty."""
         with pytest.raises(ValidationError):
@@ -129,6 +153,26 @@ class TestEconomicEvent:
         assert event.forecast is None
 
 
+class TestWallClockSeconds:
+    """Tests for the wall_clock_seconds helper."""
+
+    def test_differences_match_datetime_subtraction(self):
+        """Test differences equal naive datetime differences."""
+        start = datetime(2025, 12, 31, 22, 15, 30, 250000)
+        end = datetime(2026, 1, 2, 8, 30)
+
+        elapsed = wall_clock_seconds(end.date(), end.time()) - wall_clock_seconds(
+            start.date(), start.time()
+        )
+
+        assert elapsed == pytest.approx((end - start).total_seconds())
+
+    def test_all_day_is_midnight(self):
+        """Test a missing time counts as midnight."""
+        day = date(2026, 1, 18)
+        assert wall_clock_seconds(day) == wall_clock_seconds(day, time(0, 0))
+
+
 class TestCalendarDay:
     """Tests for the CalendarDay model."""
 
@@ -156,6 +200,17 @@ class TestCalendarDay:
         empty_day = CalendarDay(date=date(2026, 1, 20))
         assert empty_day.has_high_impact is False
 
+    def test_copy_with_new_events_rebuilds_high_impact(
+        self, sample_calendar_day: CalendarDay
+    ):
+        """Test a copy with updated events does not reuse the cached list."""
+        assert sample_calendar_day.has_high_impact
+
+        emptied = sample_calendar_day.model_copy(update={"events": []})
+
+        assert emptied.high_impact_events == []
+        assert not emptied.has_high_impact
+
 
 class TestCalendarMonth:
     """Tests for the CalendarMonth model."""
@@ -200,6 +255,38 @@ class TestCalendarMonth:
         low_events = sample_calendar_month.filter_by_impact(Impact.LOW)
         assert len(low_events) == 3  # Low + Medium + High (excluding Holiday)
 
+    def test_filters_keep_calendar_order(self, sample_calendar_month: CalendarMonth):
+        """Test that filters return events in calendar order, once each."""
+        all_events = sample_calendar_month.all_events
+
+        by_currency = sample_calendar_month.filter_by_currency(["JPY", "usd", "USD"])
+        assert by_currency == [e for e in all_events if e.currency in ("USD", "JPY")]
+
+        by_impact = sample_calendar_month.filter_by_impact(Impact.MEDIUM)
+        assert by_impact == [
+            e for e in all_events if e.impact in (Impact.MEDIUM, Impact.HIGH)
+        ]
+
+    def test_events_computed_once(self, sample_calendar_month: CalendarMonth):
+        """Test that the frozen month builds its event lists once."""
+        assert sample_calendar_month.all_events is sample_calendar_month.all_events
+        with pytest.raises(ValidationError):
+            sample_calendar_month.days = []
+
+    def test_copy_with_new_days_rebuilds_events(
+        self, sample_calendar_month: CalendarMonth
+    ):
+        """Test a copy with updated days does not reuse the cached events."""
+        assert sample_calendar_month.all_events
+        assert sample_calendar_month.filter_by_currency(["USD"])
+
+        emptied = sample_calendar_month.model_copy(update={"days": []})
+
+        assert emptied.all_events == []
+        assert emptied.high_impact_events == []
+        assert emptied.filter_by_currency(["USD"]) == []
+        assert sample_calendar_month.all_events
+
     def test_year_validation(self):
         """Test year field validation."""
         with pytest.raises(ValidationError):
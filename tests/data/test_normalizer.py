@@ -1,6 +1,10 @@
 """Tests for the economic value normalizer."""
 
-from blackbox.data.normalizer import format_normalized_value, normalize_value
+from blackbox.data.normalizer import (
+    _parse_value,
+    format_normalized_value,
+    normalize_value,
+)
 
 
 class TestNormalizeValue:
@@ -107,6 +111,16 @@ class TestNormalizeValue:
         # CPI style
         assert normalize_value("0.2%") == 0.002
 
+    def test_repeated_values_are_parsed_once(self):
+        """Test that a recurring value string is parsed once."""
+        _parse_value.cache_clear()
+
+        assert normalize_value("0.1%") == 0.001
+        assert normalize_value(" 0.1% ") == 0.001
+
+        assert _parse_value.cache_info().hits == 1
+        assert _parse_value.cache_info().misses == 1
+
 
 class TestFormatNormalizedValue:
     """Tests for format_normalized_value function."""
@@ -1,5 +1,6 @@
 """Tests for the CalendarService class."""
 
+from contextlib import contextmanager
 from datetime import date, time
 from unittest.mock import MagicMock, patch
 
@@ -7,9 +8,11 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from blackbox.data.config import ForexFactoryConfig
 from blackbox.data.models import EconomicEvent, Impact
 from blackbox.data.services import CalendarService
 from blackbox.data.storage.models import Base
+from blackbox.data.storage.repository import EventRepository
 
 
 @pytest.fixture
@@ -26,8 +29,6 @@ def mock_get_session(test_engine):
     """Mock the get_session function to use test database."""
     SessionLocal = sessionmaker(bind=test_engine, autocommit=False, autoflush=False)
 
-    from contextlib import contextmanager
-
     @contextmanager
     def get_session_mock():
         session = SessionLocal()
@@ -112,7 +113,7 @@ class TestCalendarServiceFetchMonth:
     def test_fetch_month_skips_existing_days(
         self, mock_get_session, sample_events_by_date
     ):
-        """Test that fetch_month skips days that already have data."""
+        """Test that fetch_month skips days already scraped, even empty ones."""
         with patch("blackbox.data.services.ForexFactoryScraper") as mock_scraper_class:
             mock_scraper = create_mock_scraper(sample_events_by_date)
             mock_scraper_class.return_value = mock_scraper
@@ -124,14 +125,39 @@ class TestCalendarServiceFetchMonth:
             first_call_count = mock_scraper.fetch_day.call_count
             assert first_call_count == 31
 
-            # Second call - should skip days with existing data
+            # Second call - every day was scraped, including the 29 empty ones
             mock_scraper.fetch_day.reset_mock()
             events = service.fetch_month(2026, 1)
 
-            # Should skip days 15 and 16 (have data), scrape remaining 29 days
-            assert mock_scraper.fetch_day.call_count == 29
+            mock_scraper.fetch_day.assert_not_called()
             assert len(events) == 2
 
+    def test_fetch_month_complete_month_skips_scraper(self, mock_get_session):
+        """Test that a fully stored month does not start a scraper."""
+        events_by_date = {
+            date(2025, 2, day): [
+                EconomicEvent(
+                    date=date(2025, 2, day),
+                    currency="USD",
+                    impact=Impact.LOW,
+                    event_name="Daily",
+                    actual="1",
+                )
+            ]
+            for day in range(1, 29)
+        }
+        with patch("blackbox.data.services.ForexFactoryScraper") as mock_scraper_class:
+            mock_scraper_class.return_value = create_mock_scraper(events_by_date)
+
+            service = CalendarService()
+            service.fetch_month(2025, 2)
+            mock_scraper_class.reset_mock()
+
+            events = service.fetch_month(2025, 2)
+
+            assert len(events) == 28
+            mock_scraper_class.assert_not_called()
+
     def test_fetch_month_force_refresh_scrapes_all(
         self, mock_get_session, sample_events_by_date
     ):
@@ -210,6 +236,30 @@ class TestCalendarServiceFetchToday:
             mock_scraper.fetch_day.assert_called_once_with(today)
             assert len(events) == 1
 
+    def test_fetch_today_refreshes_stats_after_scrape(self, mock_get_session):
+        """Test that scraping today refreshes the stats, serving the cache does not."""
+        today_event = EconomicEvent(
+            date=date.today(),
+            currency="USD",
+            impact=Impact.HIGH,
+            event_name="Test Event",
+        )
+
+        with (
+            patch("blackbox.data.services.ForexFactoryScraper") as mock_scraper_class,
+            patch.object(EventRepository, "refresh_stats") as mock_refresh,
+        ):
+            mock_scraper_class.return_value = create_mock_scraper(
+                {date.today(): [today_event]}
+            )
+            service = CalendarService()
+
+            service.fetch_today()
+            mock_refresh.assert_called_once()
+
+            service.fetch_today()
+            mock_refresh.assert_called_once()
+
     def test_fetch_today_applies_high_impact_filter(self, mock_get_session):
         """Test that high_impact_only filter is applied correctly."""
         today = date.today()
@@ -250,6 +300,105 @@ class TestCalendarServiceFetchToday:
             assert events[0].impact == Impact.HIGH
 
 
+class TestCalendarServiceRefreshMonth:
+    """Tests for the refresh_month method."""
+
+    def test_refresh_month_scrapes_all_days_in_parallel(
+        self, tmp_path, sample_events_by_date
+    ):
+        """Test that refresh_month splits days across parallel scrapers."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'refresh.db'}")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+        @contextmanager
+        def get_session_mock():
+            session = SessionLocal()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+
+        with (
+            patch("blackbox.data.services.get_session", get_session_mock),
+            patch("blackbox.data.services.ForexFactoryScraper") as mock_scraper_class,
+        ):
+            scrapers = [create_mock_scraper(sample_events_by_date) for _ in range(3)]
+            mock_scraper_class.side_effect = scrapers
+
+            service = CalendarService(ForexFactoryConfig(refresh_workers=3))
+            count = service.refresh_month(2026, 1)
+
+        engine.dispose()
+
+        assert count == 2
+        assert mock_scraper_class.call_count == 3
+        scraped = sorted(
+            call.args[0]
+            for scraper in scrapers
+            for call in scraper.fetch_day.call_args_list
+        )
+        assert scraped == [date(2026, 1, day) for day in range(1, 32)]
+
+
+class TestCalendarServiceFetchMonths:
+    """Tests for the fetch_months method."""
+
+    def test_fetch_months_syncs_months_in_parallel(
+        self, tmp_path, sample_events_by_date
+    ):
+        """Test that fetch_months syncs each month and returns them in order."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'months.db'}")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+        @contextmanager
+        def get_session_mock():
+            session = SessionLocal()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+
+        events_by_date = {
+            **sample_events_by_date,
+            date(2026, 2, 3): [
+                EconomicEvent(
+                    date=date(2026, 2, 3),
+                    currency="GBP",
+                    impact=Impact.HIGH,
+                    event_name="GDP",
+                )
+            ],
+        }
+
+        with (
+            patch("blackbox.data.services.get_session", get_session_mock),
+            patch("blackbox.data.services.ForexFactoryScraper") as mock_scraper_class,
+        ):
+            scrapers = [create_mock_scraper(events_by_date) for _ in range(2)]
+            mock_scraper_class.side_effect = scrapers
+
+            service = CalendarService()
+            events = service.fetch_months(
+                [(2026, 2), (2026, 1)], impact="high", max_concurrency=2
+            )
+
+        engine.dispose()
+
+        assert [event.event_name for event in events] == ["GDP", "NFP"]
+        assert mock_scraper_class.call_count == 2
+        assert sum(scraper.fetch_day.call_count for scraper in scrapers) == 31 + 28
+
+    def test_fetch_months_empty(self):
+        """Test that no months means no scraping."""
+        with patch("blackbox.data.services.ForexFactoryScraper") as mock_scraper_class:
+            assert CalendarService().fetch_months([]) == []
+            mock_scraper_class.assert_not_called()
+
+
 class TestCalendarServiceStats:
     """Tests for the get_stats method."""
 